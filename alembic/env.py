@@ -47,7 +47,6 @@ DATABASE_URL: str
 if DATABASE_CONFIG['DATABASE_DIALECT'] == 'sqlite':
     DATABASE_URL = '{}:///{}'.format(
         DATABASE_DRIVER_AND_DIALECT,
-        DATABASE_CONFIG['DATABASE_DRIVER'],
         DATABASE_CONFIG['DATABASE_NAME'],
     )
 else:
@@ -0,0 +1,76 @@
+"""
+Measures JWT tokens encoding and decoding throughput of python-jose round trip, previously used for tokens,
+and of the dedicated token codec.
+
+Usage:
+    python -m benchmarks.jwt_codec --operations 100000
+"""
+
+import argparse
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Any, List, Tuple
+from jose import jwt
+
+from src.security.codec import jwt_codec
+from src.security.config import jwt_config
+from src.security.models import JWTDataModel
+
+
+def jose_encode(jwt_data: JWTDataModel) -> str:
+    return jwt.encode(
+        claims=jwt_data.model_dump(),
+        key=jwt_config.JWT_TOKEN_SECRET_KEY,
+        algorithm=jwt_config.JWT_TOKEN_ALGORITHM
+    )
+
+
+def jose_decode(token: str) -> JWTDataModel:
+    payload: Dict[str, Any] = jwt.decode(
+        token,
+        jwt_config.JWT_TOKEN_SECRET_KEY,
+        algorithms=[jwt_config.JWT_TOKEN_ALGORITHM]
+    )
+    payload['exp'] = datetime.fromtimestamp(payload['exp'], tz=timezone.utc)
+    return JWTDataModel(**payload)
+
+
+def measure(operation: Callable[[Any], Any], argument: Any, operations: int) -> float:
+    """
+    Returns operations per second.
+    """
+
+    started_at: float = time.perf_counter()
+    for _ in range(operations):
+        operation(argument)
+
+    return operations / (time.perf_counter() - started_at)
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--operations', type=int, default=100_000, help='number of operations per measurement')
+    args: argparse.Namespace = parser.parse_args()
+
+    jwt_data: JWTDataModel = JWTDataModel(user_id=1)
+    token: str = jwt_codec.encode(jwt_data=jwt_data)
+    report: List[Tuple[str, float, float]] = [
+        (
+            'encode',
+            measure(operation=jose_encode, argument=jwt_data, operations=args.operations),
+            measure(operation=jwt_codec.encode, argument=jwt_data, operations=args.operations)
+        ),
+        (
+            'decode',
+            measure(operation=jose_decode, argument=token, operations=args.operations),
+            measure(operation=jwt_codec.decode, argument=token, operations=args.operations)
+        ),
+    ]
+
+    print(f'{"operation":<12}{"jose, ops/s":>16}{"codec, ops/s":>16}{"speedup":>10}')
+    for name, before, after in report:
+        print(f'{name:<12}{before:>16.0f}{after:>16.0f}{after / before:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
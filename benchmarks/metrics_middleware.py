@@ -0,0 +1,105 @@
+"""
+Measures overhead of metrics middleware by calling applications directly on ASGI level with and without
+the middleware: minimal FastAPI application and no-op ASGI application, which isolates the middleware cost.
+Measurements are interleaved and the best round is reported to reduce noise.
+
+Usage:
+    python -m benchmarks.metrics_middleware --requests 20000 --rounds 5
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List, Tuple
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+from src.core.metrics import HTTPMetrics
+from src.core.middlewares import MetricsMiddleware
+
+
+def build_fastapi_app() -> FastAPI:
+    app: FastAPI = FastAPI()
+
+    @app.get('/users/{user_id}/like')
+    async def like_user(user_id: int):
+        return {'user_id': user_id}
+
+    return app
+
+
+async def noop_app(_scope: Scope, _receive: Receive, send: Send) -> None:
+    await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+    await send({'type': 'http.response.body', 'body': b''})
+
+
+async def receive() -> Message:
+    return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+
+async def send(_message: Message) -> None:
+    pass
+
+
+def build_scope() -> Scope:
+    return {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': '/users/1/like',
+        'raw_path': b'/users/1/like',
+        'query_string': b'',
+        'root_path': '',
+        'headers': [],
+        'server': ('benchmark', 80),
+        'client': ('127.0.0.1', 1000),
+    }
+
+
+async def measure(app: ASGIApp, requests: int) -> float:
+    """
+    Returns microseconds per request.
+    """
+
+    # Warming up application, which builds middlewares stack on the first call:
+    await app(build_scope(), receive, send)
+
+    started_at: float = time.perf_counter()
+    for _ in range(requests):
+        await app(build_scope(), receive, send)
+
+    return (time.perf_counter() - started_at) * 1_000_000 / requests
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=20_000, help='number of requests per round')
+    parser.add_argument('--rounds', type=int, default=5, help='number of rounds per application')
+    args: argparse.Namespace = parser.parse_args()
+
+    fastapi_app_with_metrics: FastAPI = build_fastapi_app()
+    fastapi_app_with_metrics.add_middleware(MetricsMiddleware, metrics=HTTPMetrics(), path='/metrics')
+    apps: Dict[str, Tuple[ASGIApp, ASGIApp]] = {
+        'no-op ASGI': (noop_app, MetricsMiddleware(app=noop_app, metrics=HTTPMetrics(), path='/metrics')),
+        'FastAPI': (build_fastapi_app(), fastapi_app_with_metrics),
+    }
+
+    print(f'{"application":<16}{"without, us":>14}{"with, us":>12}{"overhead, us":>16}')
+    for name, (app, app_with_metrics) in apps.items():
+        rounds: List[Tuple[float, float]] = [
+            (
+                asyncio.run(measure(app=app, requests=args.requests)),
+                asyncio.run(measure(app=app_with_metrics, requests=args.requests))
+            )
+            for _ in range(args.rounds)
+        ]
+        without_metrics: float = min(without for without, _ in rounds)
+        with_metrics: float = min(with_ for _, with_ in rounds)
+        print(f'{name:<16}{without_metrics:>14.2f}{with_metrics:>12.2f}{with_metrics - without_metrics:>16.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+Measures throughput of concurrent votes and statistics reads on SQLite database with default settings
+against SQLite production profile: WAL journal, pragmas, single writer connection and pool of readers.
+
+Usage:
+    python -m benchmarks.sqlite_profile --env-file .env --users 1000 --votes 2000 --writers 8 --readers 8
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from itertools import permutations
+from typing import Dict, Iterator, List, Tuple
+
+from dotenv import load_dotenv
+
+
+async def run_workload(
+        profile: bool,
+        url: str,
+        users: int,
+        votes: int,
+        writers: int,
+        readers: int
+) -> Dict[str, float]:
+    """
+    Runs voting and reading tasks concurrently, until all votes are made, and returns their throughput.
+    """
+
+    # Importing after environments are loaded, because configs are read on import:
+    from sqlalchemy import insert
+    from sqlalchemy.exc import SQLAlchemyError
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine
+    from src.core.database.base import Base
+    from src.core.database.config import database_config
+    from src.core.database.replicas import ReplicaRouter
+    from src.core.database.sqlite import apply_sqlite_pragmas, get_sqlite_pool_options
+    from src.core.database.unit_of_work import UnitOfWork
+    from src.users.models import UserModel, UserStatisticsModel
+    from src.users.service import UsersService
+
+    writer_engine: AsyncEngine = create_async_engine(url, **(get_sqlite_pool_options(connections=1) if profile else {}))
+    engines: List[AsyncEngine] = [writer_engine]
+    replica_router: ReplicaRouter = ReplicaRouter(session_factories=[])
+    if profile:
+        apply_sqlite_pragmas(engine=writer_engine)
+        reader_engine: AsyncEngine = create_async_engine(
+            url,
+            **get_sqlite_pool_options(connections=database_config.DATABASE_SQLITE_READERS)
+        )
+        apply_sqlite_pragmas(engine=reader_engine, read_only=True)
+        engines.append(reader_engine)
+        replica_router = ReplicaRouter(session_factories=[async_sessionmaker(bind=reader_engine)])
+
+    async with writer_engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(
+            insert(UserModel),
+            [
+                {'id': id, 'email': f'user{id}@mail.ru', 'password': 'password', 'username': f'user{id}'}
+                for id in range(1, users + 1)
+            ]
+        )
+        await connection.execute(insert(UserStatisticsModel), [{'user_id': id} for id in range(1, users + 1)])
+
+    session_factory: async_sessionmaker = async_sessionmaker(bind=writer_engine, expire_on_commit=False)
+    pairs: Iterator[Tuple[int, int]] = iter(random.sample(list(permutations(range(1, min(users, 100) + 1), 2)), votes))
+    counters: Dict[str, int] = {'votes': 0, 'reads': 0, 'errors': 0}
+    voting_finished: asyncio.Event = asyncio.Event()
+
+    async def vote() -> None:
+        for voting_user_id, voted_for_user_id in pairs:
+            try:
+                async with UnitOfWork(session_factory=session_factory) as unit_of_work:
+                    await UsersService(
+                        session_factory=session_factory,
+                        unit_of_work=unit_of_work,
+                        replica_router=replica_router
+                    ).like_user(voting_user_id=voting_user_id, voted_for_user_id=voted_for_user_id)
+
+                counters['votes'] += 1
+            except SQLAlchemyError:
+                counters['errors'] += 1
+
+    async def read() -> None:
+        users_service: UsersService = UsersService(session_factory=session_factory, replica_router=replica_router)
+        while not voting_finished.is_set():
+            try:
+                await users_service.get_user_statistics_by_user_id(user_id=random.randint(1, users))
+                counters['reads'] += 1
+            except SQLAlchemyError:
+                counters['errors'] += 1
+
+    started_at: float = time.perf_counter()
+    readers_tasks: List[asyncio.Task] = [asyncio.create_task(read()) for _ in range(readers)]
+    await asyncio.gather(*(vote() for _ in range(writers)))
+    elapsed_seconds: float = time.perf_counter() - started_at
+    voting_finished.set()
+    await asyncio.gather(*readers_tasks)
+
+    for engine in engines:
+        await engine.dispose()
+
+    return {
+        'votes/s': counters['votes'] / elapsed_seconds,
+        'reads/s': counters['reads'] / elapsed_seconds,
+        'errors': counters['errors'],
+    }
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--env-file', default='.env', help='environments file to load')
+    parser.add_argument('--users', type=int, default=1000, help='number of seeded users')
+    parser.add_argument('--votes', type=int, default=2000, help='number of votes to make')
+    parser.add_argument('--writers', type=int, default=8, help='number of concurrent voting tasks')
+    parser.add_argument('--readers', type=int, default=8, help='number of concurrent reading tasks')
+    args: argparse.Namespace = parser.parse_args()
+
+    load_dotenv(args.env_file)
+    os.environ['DATABASE_ECHO'] = 'false'
+    random.seed(0)
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, profile in (('default', False), ('production profile', True)):
+        with tempfile.TemporaryDirectory() as directory:
+            results[name] = asyncio.run(
+                run_workload(
+                    profile=profile,
+                    url=f'sqlite+aiosqlite:///{os.path.join(directory, "benchmark.db")}',
+                    users=args.users,
+                    votes=args.votes,
+                    writers=args.writers,
+                    readers=args.readers
+                )
+            )
+
+    print(f'{"settings":<20}{"votes/s":>10}{"reads/s":>10}{"errors":>8}')
+    for name, result in results.items():
+        print(f'{name:<20}{result["votes/s"]:>10.0f}{result["reads/s"]:>10.0f}{result["errors"]:>8.0f}')
+
+
+if __name__ == '__main__':
+    main()
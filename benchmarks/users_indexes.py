@@ -0,0 +1,119 @@
+"""
+Measures lookups, used by users service, on a seeded database with and without indexes on users statistics and votes.
+
+Usage:
+    python -m benchmarks.users_indexes --rows 1000000 --lookups 200
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import create_engine, select, func, insert, text, Engine, Connection, Select
+
+from src.core.database.base import Base
+from src.users.models import UserModel, UserStatisticsModel, UserVoteModel
+
+
+INDEXES: Tuple[str, ...] = (
+    'ix_users_statistics_user_id',
+    'ix_users_votes_voted_for_user_id',
+    'ix_users_votes_voting_user_id_voted_for_user_id',
+)
+SEED_BATCH_SIZE: int = 50_000
+
+
+def seed(connection: Connection, rows: int) -> None:
+    """
+    Seeds provided number of users with their statistics and the same number of votes.
+    """
+
+    for batch_start in range(1, rows + 1, SEED_BATCH_SIZE):
+        ids: range = range(batch_start, min(batch_start + SEED_BATCH_SIZE, rows + 1))
+        connection.execute(
+            insert(UserModel),
+            [{'id': id, 'email': f'user{id}@mail.ru', 'password': 'password', 'username': f'user{id}'} for id in ids]
+        )
+        connection.execute(insert(UserStatisticsModel), [{'user_id': id} for id in ids])
+
+        # Every user votes for the next one, which keeps pairs unique:
+        connection.execute(
+            insert(UserVoteModel),
+            [{'voting_user_id': id, 'voted_for_user_id': id % rows + 1} for id in ids]
+        )
+
+    connection.commit()
+
+
+def build_queries(rows: int) -> Dict[str, Callable[[], Select]]:
+    def user_statistics_by_user_id() -> Select:
+        return select(UserStatisticsModel).filter_by(user_id=random.randint(1, rows))
+
+    def already_voted() -> Select:
+        voting_user_id: int = random.randint(1, rows)
+        return select(UserVoteModel).filter_by(
+            voting_user_id=voting_user_id,
+            voted_for_user_id=voting_user_id % rows + 1
+        )
+
+    def votes_for_user() -> Select:
+        return select(func.count()).select_from(UserVoteModel).filter_by(voted_for_user_id=random.randint(1, rows))
+
+    return {
+        'user statistics by user_id': user_statistics_by_user_id,
+        'already voted check': already_voted,
+        'votes for user': votes_for_user,
+    }
+
+
+def measure(connection: Connection, queries: Dict[str, Callable[[], Select]], lookups: int) -> Dict[str, float]:
+    """
+    Returns average milliseconds per lookup for each query.
+    """
+
+    results: Dict[str, float] = {}
+    for name, build_query in queries.items():
+        started_at: float = time.perf_counter()
+        for _ in range(lookups):
+            connection.execute(build_query()).all()
+
+        results[name] = (time.perf_counter() - started_at) * 1000 / lookups
+
+    return results
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000, help='number of seeded users, statistics and votes')
+    parser.add_argument('--lookups', type=int, default=200, help='number of lookups per query and mode')
+    args: argparse.Namespace = parser.parse_args()
+
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as directory:
+        engine: Engine = create_engine(f'sqlite:///{os.path.join(directory, "benchmark.db")}')
+        Base.metadata.create_all(engine)
+        queries: Dict[str, Callable[[], Select]] = build_queries(rows=args.rows)
+        with engine.connect() as connection:
+            started_at: float = time.perf_counter()
+            seed(connection=connection, rows=args.rows)
+            print(f'Seeded {args.rows} rows per table in {time.perf_counter() - started_at:.1f}s')
+
+            indexed: Dict[str, float] = measure(connection=connection, queries=queries, lookups=args.lookups)
+            for index in INDEXES:
+                connection.execute(text(f'DROP INDEX {index}'))
+
+            not_indexed: Dict[str, float] = measure(connection=connection, queries=queries, lookups=args.lookups)
+
+        engine.dispose()
+
+    report: List[Tuple[str, float, float]] = [(name, not_indexed[name], indexed[name]) for name in queries]
+    print(f'{"query":<30}{"no indexes, ms":>16}{"indexes, ms":>16}{"speedup":>10}')
+    for name, before, after in report:
+        print(f'{name:<30}{before:>16.3f}{after:>16.3f}{before / after:>9.0f}x')
+
+
+if __name__ == '__main__':
+    main()
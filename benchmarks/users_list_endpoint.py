@@ -0,0 +1,96 @@
+"""
+Measures throughput of users list endpoint on a seeded database: legacy serialization of ORM instances with
+JSONResponse and jsonable_encoder against current endpoint with response schemas and orjson serialization.
+
+Usage:
+    python -m benchmarks.users_list_endpoint --env-file .env --users 10000 --limit 500 --requests 200
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import List, Tuple
+
+from dotenv import load_dotenv
+
+
+async def measure(app, url: str, requests: int) -> float:
+    """
+    Returns requests per second.
+    """
+
+    from httpx import AsyncClient, ASGITransport, Response
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://benchmark') as client:
+        response: Response = await client.get(url)
+        response.raise_for_status()
+
+        started_at: float = time.perf_counter()
+        for _ in range(requests):
+            await client.get(url)
+
+        return requests / (time.perf_counter() - started_at)
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--env-file', default='.env', help='environments file to load')
+    parser.add_argument('--users', type=int, default=10_000, help='number of seeded users')
+    parser.add_argument('--limit', type=int, default=500, help='users per page')
+    parser.add_argument('--requests', type=int, default=200, help='number of requests per endpoint')
+    args: argparse.Namespace = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        load_dotenv(args.env_file)
+        os.environ['DATABASE_NAME'] = os.path.join(directory, 'benchmark.db')
+        os.environ['DATABASE_ECHO'] = 'false'
+
+        # Importing after environments are loaded, because configs are read on import:
+        from fastapi import FastAPI
+        from fastapi.responses import JSONResponse
+        from sqlalchemy import create_engine, insert, select, Engine
+        from src.app import app
+        from src.core.database.base import Base
+        from src.core.database.connection import engine, session_factory
+        from src.users.config import RouterConfig, URLPathsConfig
+        from src.users.models import UserModel, UserStatisticsModel
+
+        seed_engine: Engine = create_engine(f'sqlite:///{os.environ["DATABASE_NAME"]}')
+        Base.metadata.create_all(seed_engine)
+        with seed_engine.begin() as connection:
+            ids: range = range(1, args.users + 1)
+            connection.execute(
+                insert(UserModel),
+                [
+                    {'id': id, 'email': f'user{id}@mail.ru', 'password': 'password', 'username': f'user{id}'}
+                    for id in ids
+                ]
+            )
+            connection.execute(insert(UserStatisticsModel), [{'user_id': id} for id in ids])
+
+        seed_engine.dispose()
+
+        # Users list, as it was served before response schemas: ORM instances encoded by jsonable_encoder.
+        legacy_app: FastAPI = FastAPI()
+
+        @legacy_app.get(path=RouterConfig.PREFIX + URLPathsConfig.ALL, response_class=JSONResponse)
+        async def get_all_users(limit: int):
+            async with session_factory() as session:
+                return list((await session.scalars(select(UserModel).order_by(UserModel.id).limit(limit))).all())
+
+        url: str = f'{RouterConfig.PREFIX}{URLPathsConfig.ALL}?limit={args.limit}'
+        report: List[Tuple[str, float]] = [
+            ('legacy', asyncio.run(measure(app=legacy_app, url=url, requests=args.requests))),
+            ('current', asyncio.run(measure(app=app, url=url, requests=args.requests))),
+        ]
+        asyncio.run(engine.dispose())
+
+    print(f'{"endpoint":<12}{"requests/s":>14}{"speedup":>10}')
+    for name, requests_per_second in report:
+        print(f'{name:<12}{requests_per_second:>14.1f}{requests_per_second / report[0][1]:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Measures throughput of concurrent votes for the same user: counters, updated by every vote within its transaction,
+against counters, coalesced by votes counters buffer and applied with batched UPDATEs.
+
+Usage:
+    python -m benchmarks.vote_counters_buffer --env-file .env --votes 2000 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import Dict, Iterator, Optional
+
+from dotenv import load_dotenv
+
+
+async def run_votes(url: str, votes: int, concurrency: int, buffered: bool) -> Dict[str, float]:
+    """
+    Makes provided number of likes for one user and returns votes per second, number of counters UPDATEs
+    and number of votes, failed because of database lock.
+    """
+
+    # Importing after environments are loaded, because configs are read on import:
+    from sqlalchemy import insert, event
+    from sqlalchemy.exc import SQLAlchemyError
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine
+    from src.core.database.base import Base
+    from src.core.database.replicas import ReplicaRouter
+    from src.users.counters import VoteCountersBuffer
+    from src.users.models import UserModel, UserStatisticsModel
+    from src.users.service import UsersService
+
+    engine: AsyncEngine = create_async_engine(url)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(
+            insert(UserModel),
+            [
+                {'id': id, 'email': f'user{id}@mail.ru', 'password': 'password', 'username': f'user{id}'}
+                for id in range(1, votes + 2)
+            ]
+        )
+        await connection.execute(insert(UserStatisticsModel), [{'user_id': 1}])
+
+    counters: Dict[str, int] = {'updates': 0, 'errors': 0}
+
+    def count_counters_updates(_connection, _cursor, statement: str, *_args) -> None:
+        if statement.startswith('UPDATE users_statistics'):
+            counters['updates'] += 1
+
+    event.listen(engine.sync_engine, 'before_cursor_execute', count_counters_updates)
+
+    session_factory: async_sessionmaker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    vote_counters_buffer: Optional[VoteCountersBuffer] = (
+        VoteCountersBuffer(session_factory=session_factory) if buffered else None
+    )
+    users_service: UsersService = UsersService(
+        session_factory=session_factory,
+        replica_router=ReplicaRouter(session_factories=[]),
+        vote_counters_buffer=vote_counters_buffer
+    )
+    voting_user_ids: Iterator[int] = iter(range(2, votes + 2))
+
+    async def vote() -> None:
+        for voting_user_id in voting_user_ids:
+            try:
+                await users_service.like_user(voting_user_id=voting_user_id, voted_for_user_id=1)
+            except SQLAlchemyError:
+                counters['errors'] += 1
+
+    if vote_counters_buffer is not None:
+        vote_counters_buffer.start()
+
+    started_at: float = time.perf_counter()
+    await asyncio.gather(*(vote() for _ in range(concurrency)))
+    if vote_counters_buffer is not None:
+        await vote_counters_buffer.stop()
+
+    elapsed_seconds: float = time.perf_counter() - started_at
+    user_statistics: UserStatisticsModel = await UsersService(
+        session_factory=session_factory,
+        replica_router=ReplicaRouter(session_factories=[]),
+        vote_counters_buffer=None
+    ).get_user_statistics_by_user_id(user_id=1)
+    assert user_statistics.likes == votes - counters['errors']
+
+    await engine.dispose()
+    return {
+        'votes/s': (votes - counters['errors']) / elapsed_seconds,
+        'updates': counters['updates'],
+        'errors': counters['errors'],
+    }
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--env-file', default='.env', help='environments file to load')
+    parser.add_argument('--votes', type=int, default=2000, help='number of votes for the same user')
+    parser.add_argument('--concurrency', type=int, default=16, help='number of concurrent voting tasks')
+    args: argparse.Namespace = parser.parse_args()
+
+    load_dotenv(args.env_file)
+    os.environ['DATABASE_ECHO'] = 'false'
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, buffered in (('direct', False), ('buffered', True)):
+        with tempfile.TemporaryDirectory() as directory:
+            results[name] = asyncio.run(
+                run_votes(
+                    url=f'sqlite+aiosqlite:///{os.path.join(directory, "benchmark.db")}',
+                    votes=args.votes,
+                    concurrency=args.concurrency,
+                    buffered=buffered
+                )
+            )
+
+    print(f'{"counters":<12}{"votes/s":>10}{"updates":>10}{"errors":>8}')
+    for name, result in results.items():
+        print(f'{name:<12}{result["votes/s"]:>10.0f}{result["updates"]:>10.0f}{result["errors"]:>8.0f}')
+
+
+if __name__ == '__main__':
+    main()
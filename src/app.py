@@ -1,16 +1,24 @@
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from starlette import status
 
-from src.config import cors_config, URLPathsConfig, URLNamesConfig
-from src.core.database.connection import DATABASE_URL
+from src.config import cors_config, metrics_config, URLPathsConfig, URLNamesConfig
+from src.core.metrics import http_metrics
+from src.core.middlewares import MetricsMiddleware, QueryStatisticsMiddleware
+from src.core.database.config import database_config
+from src.core.database.connection import engine, start_engines, dispose_engines
 from src.core.database.base import Base
+from src.core.database.migrations import check_schema_revision
 from src.users.router import router as users_router
+from src.internal.router import router as internal_router
+from src.users.utils import password_hashing_executor, users_import_executor, setup_password_hashing
+from src.users.counters import vote_counters_buffer
+from src.users.service import get_insert_ignoring_conflicts
 
 
 @asynccontextmanager
@@ -20,16 +28,29 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator:
     """
 
     # Startup events:
-    engine: AsyncEngine = create_async_engine(DATABASE_URL)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    setup_password_hashing()
+    get_insert_ignoring_conflicts(dialect_name=engine.dialect.name)
+    if database_config.DATABASE_CREATE_ALL:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    else:
+        await check_schema_revision(database_engine=engine, schema_check=database_config.DATABASE_SCHEMA_CHECK)
+
+    await start_engines()
+    if vote_counters_buffer is not None:
+        vote_counters_buffer.start()
 
     yield
 
     # Shutdown events:
+    if vote_counters_buffer is not None:
+        await vote_counters_buffer.stop()
+
+    await dispose_engines()
+    await asyncio.gather(password_hashing_executor.stop(), users_import_executor.stop())
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Middlewares:
 app.add_middleware(
@@ -39,9 +60,15 @@ app.add_middleware(
     allow_methods=cors_config.ALLOW_METHODS,
     allow_headers=cors_config.ALLOW_HEADERS,
 )
+app.add_middleware(QueryStatisticsMiddleware, query_budget=database_config.DATABASE_REQUEST_QUERY_BUDGET)
+
+# Added last to be the outermost one and measure time of other middlewares too:
+if metrics_config.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, metrics=http_metrics, path=metrics_config.METRICS_PATH)
 
 # Routers:
 app.include_router(users_router)
+app.include_router(internal_router)
 
 
 @app.get(
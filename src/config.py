@@ -42,6 +42,11 @@ class UvicornConfig(BaseSettings):
     RELOAD: bool = True
 
 
+class MetricsConfig(BaseSettings):
+    METRICS_ENABLED: bool = True
+    METRICS_PATH: str = '/metrics'
+
+
 class LinksConfig(BaseSettings):
     HTTP_PROTOCOL: str
     DOMAIN: str
@@ -50,3 +55,4 @@ class LinksConfig(BaseSettings):
 cors_config: CORSConfig = CORSConfig()
 uvicorn_config: UvicornConfig = UvicornConfig()
 links_config: LinksConfig = LinksConfig()
+metrics_config: MetricsConfig = MetricsConfig()
@@ -0,0 +1,80 @@
+import time
+from collections import OrderedDict
+from typing import Generic, TypeVar, Optional, Tuple, Hashable, Dict, Any
+
+
+KeyType = TypeVar('KeyType', bound=Hashable)
+ValueType = TypeVar('ValueType')
+
+# Named caches by cache name, which statistics are exported:
+caches: Dict[str, 'TTLCache[Any, Any]'] = {}
+
+
+def get_caches_statistics() -> Dict[str, Dict[str, Any]]:
+    return {name: cache.to_dict() for name, cache in caches.items()}
+
+
+class TTLCache(Generic[KeyType, ValueType]):
+    """
+    In-process LRU cache, which entries expire after provided time-to-live.
+    When cache is full, least recently used entry is evicted to bound memory usage.
+    Counts hits and misses to make cache efficiency observable. Statistics of named caches are exported
+    with other metrics.
+    """
+
+    def __init__(self, max_size: int, ttl: float, name: Optional[str] = None) -> None:
+        self._max_size: int = max_size
+        self._ttl: float = ttl
+        self._entries: OrderedDict[KeyType, Tuple[float, ValueType]] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        if name is not None:
+            caches[name] = self
+
+    def get(self, key: KeyType) -> Optional[ValueType]:
+        entry: Optional[Tuple[float, ValueType]] = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: KeyType, value: ValueType, ttl: Optional[float] = None) -> None:
+        """
+        Stores value for provided key. Custom time-to-live can only shorten cache's default one.
+        """
+
+        if self._max_size <= 0:
+            return
+
+        entry_ttl: float = self._ttl if ttl is None else min(ttl, self._ttl)
+        if entry_ttl <= 0:
+            self._entries.pop(key, None)
+            return
+
+        self._entries[key] = (time.monotonic() + entry_ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: KeyType) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self), 'max_size': self._max_size}
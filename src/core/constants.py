@@ -6,3 +6,4 @@ class ErrorDetails:
     SERVER_ERROR: str = 'Server error'
     PERMISSION_DENIED: str = 'Permission denied'
     BAD_REQUEST: str = 'Bad Request'
+    SERVICE_UNAVAILABLE: str = 'Service is temporarily overloaded, try again later'
@@ -1,4 +1,8 @@
 from pydantic_settings import BaseSettings
+from typing import List
+
+from src.core.database.migrations import SchemaCheck
+from src.core.database.replicas import ReplicaSelection
 
 
 class DatabaseConfig(BaseSettings):
@@ -12,8 +16,39 @@ class DatabaseConfig(BaseSettings):
     DATABASE_ECHO: bool
     DATABASE_POOL_RECYCLE: int
     DATABASE_POOL_PRE_PING: bool
+
+    # Pool sizing is applied only to databases with connections pool. For example, file sqlite uses no pool:
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30
+
+    # Number of connections, opened on application startup to avoid cold connections latency on first requests:
+    DATABASE_POOL_WARM_UP_CONNECTIONS: int = 0
     DATABASE_AUTO_FLUSH: bool
     DATABASE_EXPIRE_ON_COMMIT: bool
 
+    # Queries, which take longer, are logged with their parameters and route of request:
+    DATABASE_SLOW_QUERY_MILLISECONDS: float = 100
+
+    # Requests, which perform more queries, are logged with number of queries and total time spent on them:
+    DATABASE_REQUEST_QUERY_BUDGET: int = 10
+
+    # SQLite production profile: WAL journal and pragmas, single writer connection and pool of reader connections,
+    # to which read-only queries are routed the same way as to replicas. Profile requires database file:
+    DATABASE_SQLITE_PROFILE: bool = False
+    DATABASE_SQLITE_READERS: int = 4
+    DATABASE_SQLITE_MMAP_SIZE: int = 268435456
+    DATABASE_SQLITE_CACHE_SIZE: int = -64000  # negative value is size in kibibytes
+    DATABASE_SQLITE_BUSY_TIMEOUT_MILLISECONDS: int = 5000
+
+    # Read-only queries are routed to replicas, if any provided. Replicas are set as full database urls:
+    DATABASE_REPLICA_URLS: List[str] = []
+    DATABASE_REPLICA_SELECTION: ReplicaSelection = 'round_robin'
+
+    # Schema is created and changed by Alembic migrations. On startup database revision is compared with migrations
+    # head. Creating tables from models on startup is for development and tests only and skips the check:
+    DATABASE_SCHEMA_CHECK: SchemaCheck = 'error'
+    DATABASE_CREATE_ALL: bool = False
+
 
 database_config: DatabaseConfig = DatabaseConfig()
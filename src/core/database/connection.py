@@ -1,6 +1,15 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, async_sessionmaker
+import asyncio
+from contextlib import AsyncExitStack
+from sqlalchemy import text, make_url, URL, Pool, QueuePool
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncConnection, async_sessionmaker
+from sqlalchemy.engine.default import DefaultDialect
+from typing import List, Dict, Any, Type, Optional, Sequence, Tuple, cast
 
 from src.core.database.config import database_config
+from src.core.database.replicas import ReplicaRouter
+from src.core.database.pool_statistics import PoolStatistics, instrument_pool_class
+from src.core.database.query_statistics import attach_query_listeners
+from src.core.database.sqlite import apply_sqlite_pragmas, get_sqlite_pool_options
 
 
 """
@@ -25,11 +34,139 @@ else:
         database_config.DATABASE_NAME
     )
 
-engine: AsyncEngine = create_async_engine(
+
+def get_pool_class(url: str) -> Type[Pool]:
+    """
+    Returns pool class, which dialect of provided database url uses by default.
+    """
+
+    database_url: URL = make_url(url)
+    dialect: Type[DefaultDialect] = cast(Type[DefaultDialect], database_url.get_dialect())
+    return dialect.get_pool_class(database_url)
+
+
+def get_engine_options(url: str) -> Dict[str, Any]:
+    """
+    Returns engine options for provided database url. Pool sizing options are passed only to dialects,
+    which use connections pool, because other pools don't accept them.
+    """
+
+    options: Dict[str, Any] = {
+        'pool_pre_ping': database_config.DATABASE_POOL_PRE_PING,
+        'pool_recycle': database_config.DATABASE_POOL_RECYCLE,
+        'echo': database_config.DATABASE_ECHO,
+    }
+
+    if issubclass(get_pool_class(url=url), QueuePool):
+        options.update(
+            pool_size=database_config.DATABASE_POOL_SIZE,
+            max_overflow=database_config.DATABASE_MAX_OVERFLOW,
+            pool_timeout=database_config.DATABASE_POOL_TIMEOUT,
+        )
+
+    return options
+
+
+async def warm_up_engine(database_engine: AsyncEngine, connections: int) -> None:
+    """
+    Opens provided number of connections at once and returns them to the pool, so first requests don't wait
+    for connections to be established. Number of connections is limited by pool size, because pool doesn't
+    keep more connections open.
+    """
+
+    if not isinstance(database_engine.pool, QueuePool):
+        return
+
+    async with AsyncExitStack() as stack:
+        opened_connections: List[AsyncConnection] = await asyncio.gather(
+            *(
+                stack.enter_async_context(database_engine.connect())
+                for _ in range(min(connections, database_engine.pool.size()))
+            )
+        )
+        await asyncio.gather(*(connection.execute(text('SELECT 1')) for connection in opened_connections))
+
+
+# Pools usage statistics of all engines by engine name:
+pools_statistics: Dict[str, PoolStatistics] = {}
+
+
+def create_instrumented_engine(url: str, name: str, **options: Any) -> AsyncEngine:
+    """
+    Creates engine, which pool usage statistics are collected under provided name and which queries
+    are attributed to current request. Provided options override default engine options.
+    """
+
+    engine_options: Dict[str, Any] = {**get_engine_options(url=url), **options}
+    pool_class: Type[Pool] = engine_options.pop('poolclass', get_pool_class(url=url))
+    statistics: PoolStatistics = PoolStatistics()
+    database_engine: AsyncEngine = create_async_engine(
+        url=url,
+        poolclass=instrument_pool_class(pool_class=pool_class, statistics=statistics),
+        **engine_options
+    )
+    statistics.attach(engine=database_engine)
+    attach_query_listeners(engine=database_engine)
+    pools_statistics[name] = statistics
+    return database_engine
+
+
+def get_pools_statistics() -> Dict[str, Dict[str, Any]]:
+    return {name: statistics.to_dict() for name, statistics in pools_statistics.items()}
+
+
+def is_sqlite_memory_database(url: str) -> bool:
+    database: Optional[str] = make_url(url).database
+    return not database or database == ':memory:' or database.startswith('file::memory:')
+
+
+def create_engines(
+        url: str,
+        replica_urls: Sequence[str],
+        sqlite_profile: bool = False
+) -> Tuple[AsyncEngine, List[AsyncEngine]]:
+    """
+    Creates primary engine and engines of replicas. In SQLite production profile all writes are serialized through
+    the single connection of primary engine instead of waiting for database lock, and, if no replicas provided,
+    reads go to separate pool of reader connections, because in WAL mode readers don't block the writer and
+    each other.
+    """
+
+    if sqlite_profile and is_sqlite_memory_database(url=url):
+        # Every connection to in-memory database opens its own empty database, so writer and readers can't share it:
+        raise ValueError('SQLite production profile requires database file, in-memory database is not supported')
+
+    primary_engine: AsyncEngine = create_instrumented_engine(
+        url=url,
+        name='primary',
+        **(get_sqlite_pool_options(connections=1) if sqlite_profile else {})
+    )
+    if sqlite_profile:
+        apply_sqlite_pragmas(engine=primary_engine)
+
+    replicas: List[AsyncEngine] = [
+        create_instrumented_engine(url=replica_url, name=f'replica_{index}')
+        for index, replica_url in enumerate(replica_urls)
+    ]
+
+    if sqlite_profile and not replicas:
+        sqlite_reader_engine: AsyncEngine = create_instrumented_engine(
+            url=url,
+            name='sqlite_reader',
+            **get_sqlite_pool_options(connections=database_config.DATABASE_SQLITE_READERS)
+        )
+        apply_sqlite_pragmas(engine=sqlite_reader_engine, read_only=True)
+        replicas.append(sqlite_reader_engine)
+
+    return primary_engine, replicas
+
+
+engine: AsyncEngine
+replica_engines: List[AsyncEngine]
+engine, replica_engines = create_engines(
     url=DATABASE_URL,
-    pool_pre_ping=database_config.DATABASE_POOL_PRE_PING,
-    pool_recycle=database_config.DATABASE_POOL_RECYCLE,
-    echo=database_config.DATABASE_ECHO,
+    replica_urls=database_config.DATABASE_REPLICA_URLS,
+    sqlite_profile=database_config.DATABASE_DIALECT == 'sqlite' and database_config.DATABASE_SQLITE_PROFILE
 )
 
 session_factory: async_sessionmaker = async_sessionmaker(
@@ -37,3 +174,39 @@ session_factory: async_sessionmaker = async_sessionmaker(
     autoflush=database_config.DATABASE_AUTO_FLUSH,
     expire_on_commit=database_config.DATABASE_EXPIRE_ON_COMMIT
 )
+
+replica_router: ReplicaRouter = ReplicaRouter(
+    session_factories=[
+        async_sessionmaker(
+            bind=replica_engine,
+            autoflush=database_config.DATABASE_AUTO_FLUSH,
+            expire_on_commit=database_config.DATABASE_EXPIRE_ON_COMMIT
+        )
+        for replica_engine in replica_engines
+    ],
+    selection=database_config.DATABASE_REPLICA_SELECTION
+)
+
+
+async def start_engines() -> None:
+    """
+    Warms up connections pools of primary and replica engines.
+    """
+
+    await asyncio.gather(
+        *(
+            warm_up_engine(
+                database_engine=database_engine,
+                connections=database_config.DATABASE_POOL_WARM_UP_CONNECTIONS
+            )
+            for database_engine in [engine, *replica_engines]
+        )
+    )
+
+
+async def dispose_engines() -> None:
+    """
+    Closes all pooled connections of primary and replica engines.
+    """
+
+    await asyncio.gather(*(database_engine.dispose() for database_engine in [engine, *replica_engines]))
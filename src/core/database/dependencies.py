@@ -0,0 +1,13 @@
+from typing import AsyncGenerator
+
+from src.core.database.unit_of_work import UnitOfWork
+
+
+async def get_unit_of_work() -> AsyncGenerator[UnitOfWork, None]:
+    """
+    Provides request-scoped unit of work, which is committed once after the endpoint has finished.
+    FastAPI caches dependencies per request, so all dependencies of one request share the same unit of work.
+    """
+
+    async with UnitOfWork() as unit_of_work:
+        yield unit_of_work
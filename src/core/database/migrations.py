@@ -0,0 +1,70 @@
+import logging
+from pathlib import Path
+from typing import Literal, Set, Tuple
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# "error" refuses to start application with not migrated database, "warn" only logs mismatch:
+SchemaCheck = Literal['error', 'warn', 'off']
+
+MIGRATIONS_DIRECTORY: Path = Path(__file__).parents[3] / 'alembic'
+
+
+class SchemaRevisionMismatchError(RuntimeError):
+    pass
+
+
+def get_head_revisions(migrations_directory: Path = MIGRATIONS_DIRECTORY) -> Set[str]:
+    """
+    Returns head revisions of migrations scripts. Scripts are read from files, so database is not queried.
+    """
+
+    return set(ScriptDirectory(dir=str(migrations_directory)).get_heads())
+
+
+async def get_current_revisions(database_engine: AsyncEngine) -> Set[str]:
+    """
+    Returns revisions, which database is migrated to, from Alembic version table. Database, which was never
+    migrated, has no version table and so has no revisions. Any other database error, for example unreachable
+    database, is raised.
+    """
+
+    async with database_engine.connect() as connection:
+        current_heads: Tuple[str, ...] = await connection.run_sync(
+            lambda sync_connection: MigrationContext.configure(connection=sync_connection).get_current_heads()
+        )
+
+    return set(current_heads)
+
+
+async def check_schema_revision(
+        database_engine: AsyncEngine,
+        schema_check: SchemaCheck,
+        migrations_directory: Path = MIGRATIONS_DIRECTORY
+) -> None:
+    """
+    Compares database revision with head revision of migrations instead of reflecting every table on startup,
+    which costs only existence check and read of version table.
+    Raises SchemaRevisionMismatchError or logs warning, depending on provided check mode, if they differ.
+    """
+
+    if schema_check == 'off':
+        return
+
+    head_revisions: Set[str] = get_head_revisions(migrations_directory=migrations_directory)
+    current_revisions: Set[str] = await get_current_revisions(database_engine=database_engine)
+    if current_revisions == head_revisions:
+        return
+
+    message: str = (
+        f'Database revision {", ".join(sorted(current_revisions)) or "<none>"} doesn\'t match '
+        f'migrations head {", ".join(sorted(head_revisions))}, run "alembic upgrade head"'
+    )
+    if schema_check == 'error':
+        raise SchemaRevisionMismatchError(message)
+
+    logger.warning(message)
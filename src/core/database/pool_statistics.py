@@ -0,0 +1,102 @@
+import time
+from typing import Any, Dict, Type, Tuple, Optional
+from sqlalchemy import event, Pool, QueuePool
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.pool import ConnectionPoolEntry, PoolProxiedConnection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.metrics import Histogram
+
+
+CHECKOUT_WAIT_BUCKETS_MILLISECONDS: Tuple[float, ...] = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000, 30000)
+CONNECTION_AGE_BUCKETS_SECONDS: Tuple[float, ...] = (1, 10, 60, 300, 900, 1800, 3600, 7200)
+
+
+class PoolStatistics:
+    """
+    Collects connections pool usage of engine via pool events: checkouts, checkins, overflow,
+    time of waiting for a connection and age of connections, returned to the pool.
+    """
+
+    def __init__(self) -> None:
+        self._engine: Optional[AsyncEngine] = None
+        self.connects: int = 0
+        self.checkouts: int = 0
+        self.checkins: int = 0
+        self.invalidations: int = 0
+        self.checked_out: int = 0
+        self.max_checked_out: int = 0
+        self.max_overflow: int = 0
+        self.checkout_wait_milliseconds: Histogram = Histogram(buckets=CHECKOUT_WAIT_BUCKETS_MILLISECONDS)
+        self.connection_age_seconds: Histogram = Histogram(buckets=CONNECTION_AGE_BUCKETS_SECONDS)
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """
+        Listens to pool events of provided engine. Listeners are kept by pools, recreated on engine disposal.
+        """
+
+        self._engine = engine
+        event.listen(engine.sync_engine, 'connect', self._on_connect)
+        event.listen(engine.sync_engine, 'checkout', self._on_checkout)
+        event.listen(engine.sync_engine, 'checkin', self._on_checkin)
+        event.listen(engine.sync_engine, 'invalidate', self._on_invalidate)
+
+    def _on_connect(self, _dbapi_connection: DBAPIConnection, connection_record: ConnectionPoolEntry) -> None:
+        self.connects += 1
+        connection_record.info['connected_at'] = time.monotonic()
+
+    def _on_checkout(self, *_args: Any) -> None:
+        self.checkouts += 1
+        self.checked_out += 1
+        self.max_checked_out = max(self.max_checked_out, self.checked_out)
+        if self._engine is not None and isinstance(self._engine.pool, QueuePool):
+            self.max_overflow = max(self.max_overflow, self._engine.pool.overflow())
+
+    def _on_checkin(self, _dbapi_connection: Optional[DBAPIConnection], connection_record: ConnectionPoolEntry) -> None:
+        self.checkins += 1
+        self.checked_out -= 1
+        connected_at: Optional[float] = connection_record.info.get('connected_at')
+        if connected_at is not None:
+            self.connection_age_seconds.observe(time.monotonic() - connected_at)
+
+    def _on_invalidate(self, *_args: Any) -> None:
+        self.invalidations += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        statistics: Dict[str, Any] = {
+            'connects': self.connects,
+            'checkouts': self.checkouts,
+            'checkins': self.checkins,
+            'invalidations': self.invalidations,
+            'checked_out': self.checked_out,
+            'max_checked_out': self.max_checked_out,
+            'max_overflow': self.max_overflow,
+            'checkout_wait_milliseconds': self.checkout_wait_milliseconds.to_dict(),
+            'connection_age_seconds': self.connection_age_seconds.to_dict(),
+        }
+
+        if self._engine is not None and isinstance(self._engine.pool, QueuePool):
+            statistics.update(
+                size=self._engine.pool.size(),
+                checked_in=self._engine.pool.checkedin(),
+                overflow=max(0, self._engine.pool.overflow()),
+                timeout=self._engine.pool.timeout(),
+            )
+
+        return statistics
+
+
+def instrument_pool_class(pool_class: Type[Pool], statistics: PoolStatistics) -> Type[Pool]:
+    """
+    Returns subclass of provided pool class, which measures time of connection checkout, including waiting
+    for a free connection, because pool events are emitted only after connection is already obtained.
+    """
+
+    def connect(self: Pool) -> PoolProxiedConnection:
+        started_at: float = time.perf_counter()
+        try:
+            return pool_class.connect(self)
+        finally:
+            statistics.checkout_wait_milliseconds.observe((time.perf_counter() - started_at) * 1000)
+
+    return type(f'Instrumented{pool_class.__name__}', (pool_class, ), {'connect': connect})
@@ -0,0 +1,145 @@
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, List, Optional, Sequence, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import Scope
+
+from src.core.database.config import database_config
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+QUERY_STARTED_AT_KEY: str = 'query_started_at'
+
+# Values of parameters, which names contain any of these words, are never logged:
+SENSITIVE_PARAMETERS: Tuple[str, ...] = ('password', 'secret', 'token')
+REDACTED_VALUE: str = '<redacted>'
+
+# Only first sets of parameters of executemany are logged, because batch may contain thousands of them:
+MAX_LOGGED_PARAMETERS_SETS: int = 3
+
+
+class RequestQueryStatistics:
+    """
+    Number of queries and total time spent on them within one request.
+    """
+
+    def __init__(self, scope: Scope) -> None:
+        self._scope: Scope = scope
+        self.queries: int = 0
+        self.seconds: float = 0.0
+
+    @property
+    def route(self) -> str:
+        """
+        Route template of request, if request was already routed. Otherwise, raw request path.
+        """
+
+        path: str = self._scope['path']
+        route: str = getattr(self._scope.get('route'), 'path', path)
+        return route
+
+
+current_query_statistics: ContextVar[Optional[RequestQueryStatistics]] = ContextVar(
+    'current_query_statistics',
+    default=None
+)
+
+
+def get_current_query_statistics() -> Optional[RequestQueryStatistics]:
+    return current_query_statistics.get()
+
+
+def _before_cursor_execute(connection: Connection, *_args: Any) -> None:
+    # Stack is used, because cursor executions may be nested:
+    connection.info.setdefault(QUERY_STARTED_AT_KEY, []).append(time.perf_counter())
+
+
+def is_sensitive_parameter(name: str) -> bool:
+    return any(word in name.lower() for word in SENSITIVE_PARAMETERS)
+
+
+def redact_parameters(parameters: Any, names: Optional[Sequence[str]]) -> Any:
+    """
+    Replaces values of sensitive parameters of one execution. Positional parameters are matched with names
+    of compiled statement, and, if names are unknown, all values are redacted.
+    """
+
+    if isinstance(parameters, dict):
+        return {
+            name: REDACTED_VALUE if is_sensitive_parameter(name) else value
+            for name, value in parameters.items()
+        }
+
+    # Batched multi-row statement repeats the same names for every row:
+    if not names or len(parameters) % len(names):
+        return tuple(REDACTED_VALUE for _ in parameters)
+
+    return tuple(
+        REDACTED_VALUE if is_sensitive_parameter(names[index % len(names)]) else value
+        for index, value in enumerate(parameters)
+    )
+
+
+def format_parameters(
+        connection: Connection,
+        parameters: Any,
+        context: Optional[ExecutionContext],
+        executemany: bool
+) -> str:
+    """
+    Formats parameters for log with sensitive values redacted. Parameters are hidden completely, if engine
+    was created with "hide_parameters" option.
+    """
+
+    if connection.engine.hide_parameters:
+        return '<hidden>'
+
+    names: Optional[Sequence[str]] = None
+    if context is not None and context.compiled is not None:
+        names = getattr(context.compiled, 'positiontup', None)
+
+    if not executemany:
+        return repr(redact_parameters(parameters=parameters, names=names))
+
+    formatted_parameters: str = repr(
+        [redact_parameters(parameters=item, names=names) for item in parameters[:MAX_LOGGED_PARAMETERS_SETS]]
+    )
+    if len(parameters) > MAX_LOGGED_PARAMETERS_SETS:
+        formatted_parameters += f' and {len(parameters) - MAX_LOGGED_PARAMETERS_SETS} more'
+
+    return formatted_parameters
+
+
+def _after_cursor_execute(
+        connection: Connection,
+        _cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Optional[ExecutionContext],
+        executemany: bool
+) -> None:
+
+    started_at: List[float] = connection.info[QUERY_STARTED_AT_KEY]
+    seconds: float = time.perf_counter() - started_at.pop()
+    statistics: Optional[RequestQueryStatistics] = current_query_statistics.get()
+    if statistics is not None:
+        statistics.queries += 1
+        statistics.seconds += seconds
+
+    if seconds * 1000 >= database_config.DATABASE_SLOW_QUERY_MILLISECONDS:
+        logger.warning(
+            'Slow query took %.1fms on route %s: %s; parameters: %s',
+            seconds * 1000,
+            statistics.route if statistics is not None else None,
+            statement,
+            format_parameters(connection=connection, parameters=parameters, context=context, executemany=executemany)
+        )
+
+
+def attach_query_listeners(engine: AsyncEngine) -> None:
+    event.listen(engine.sync_engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine.sync_engine, 'after_cursor_execute', _after_cursor_execute)
@@ -0,0 +1,62 @@
+from contextlib import asynccontextmanager
+from typing import List, Sequence, Literal, AsyncGenerator
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+ReplicaSelection = Literal['round_robin', 'least_busy']
+
+
+class ReplicaRouter:
+    """
+    Routes read-only queries to read replicas. Replica is selected either in turn or by the least number
+    of sessions, currently opened on it.
+    """
+
+    def __init__(
+            self,
+            session_factories: Sequence[async_sessionmaker],
+            selection: ReplicaSelection = 'round_robin'
+    ) -> None:
+
+        self._session_factories: List[async_sessionmaker] = list(session_factories)
+        self._selection: ReplicaSelection = selection
+        self._busy: List[int] = [0] * len(self._session_factories)
+        self._next_index: int = 0
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self._session_factories)
+
+    @property
+    def busy(self) -> List[int]:
+        return list(self._busy)
+
+    def select(self) -> int:
+        """
+        Returns index of replica to use. Ties of least busy selection are broken in turn, so idle replicas
+        share the load evenly.
+        """
+
+        if not self._session_factories:
+            raise ValueError('No read replicas configured')
+
+        replicas_count: int = len(self._session_factories)
+        start_index: int = self._next_index
+        self._next_index = (self._next_index + 1) % replicas_count
+        if self._selection == 'round_robin':
+            return start_index
+
+        return min(
+            ((start_index + offset) % replicas_count for offset in range(replicas_count)),
+            key=self._busy.__getitem__
+        )
+
+    @asynccontextmanager
+    async def session(self) -> AsyncGenerator[AsyncSession, None]:
+        index: int = self.select()
+        self._busy[index] += 1
+        try:
+            async with self._session_factories[index]() as session:
+                yield session
+        finally:
+            self._busy[index] -= 1
@@ -0,0 +1,55 @@
+from typing import Dict, Any
+from sqlalchemy import event, AsyncAdaptedQueuePool
+from sqlalchemy.pool import ConnectionPoolEntry
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.database.config import database_config
+
+
+def get_sqlite_pragmas() -> Dict[str, Any]:
+    """
+    Returns pragmas of SQLite production profile. WAL journal lets readers work concurrently with the writer,
+    and "NORMAL" synchronous mode is durable in WAL mode except for the last transactions on power loss.
+    """
+
+    return {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': database_config.DATABASE_SQLITE_MMAP_SIZE,
+        'cache_size': database_config.DATABASE_SQLITE_CACHE_SIZE,
+        'busy_timeout': database_config.DATABASE_SQLITE_BUSY_TIMEOUT_MILLISECONDS,
+        'temp_store': 'MEMORY',
+    }
+
+
+def get_sqlite_pool_options(connections: int) -> Dict[str, Any]:
+    """
+    Returns options of fixed-size pool, because SQLite dialect uses no pool for database files by default.
+    """
+
+    return {
+        'poolclass': AsyncAdaptedQueuePool,
+        'pool_size': connections,
+        'max_overflow': 0,
+        'pool_timeout': database_config.DATABASE_POOL_TIMEOUT,
+    }
+
+
+def apply_sqlite_pragmas(engine: AsyncEngine, read_only: bool = False) -> None:
+    """
+    Applies production profile pragmas to every new connection of engine. Connections of read-only engine
+    additionally reject any writes.
+    """
+
+    pragmas: Dict[str, Any] = get_sqlite_pragmas()
+    if read_only:
+        pragmas['query_only'] = 'ON'
+
+    def set_pragmas(dbapi_connection: Any, _connection_record: ConnectionPoolEntry) -> None:
+        cursor: Any = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+
+        cursor.close()
+
+    event.listen(engine.sync_engine, 'connect', set_pragmas)
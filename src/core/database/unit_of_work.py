@@ -0,0 +1,84 @@
+from types import TracebackType
+from typing import Optional, Type, Any
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.database.connection import session_factory as default_session_factory
+
+
+class UnitOfWork:
+    """
+    Shares one session and transaction between all service calls, made within its scope.
+    Commits once on successful exit and rolls back all changes, if any error occurred.
+
+    Tracks, whether anything was written within its scope, so that following reads go to primary database
+    instead of replicas, which may not have received the writes yet.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker = default_session_factory) -> None:
+        self._session_factory: async_sessionmaker = session_factory
+        self._session: Optional[AsyncSession] = None
+        self._pinned_to_primary: bool = False
+
+    @property
+    def session(self) -> AsyncSession:
+        """
+        Session is opened lazily, so scopes without database access won't open it at all.
+        """
+
+        if self._session is None:
+            self._session = self._session_factory()
+            event.listen(self._session.sync_session, 'after_flush', self._on_flush)
+            event.listen(self._session.sync_session, 'do_orm_execute', self._on_execute)
+
+        return self._session
+
+    @property
+    def pinned_to_primary(self) -> bool:
+        return self._pinned_to_primary
+
+    def pin_to_primary(self) -> None:
+        """
+        Routes all following reads within scope to primary database. Is called automatically after any write.
+        """
+
+        self._pinned_to_primary = True
+
+    def _on_flush(self, *_args: Any) -> None:
+        self.pin_to_primary()
+
+    def _on_execute(self, orm_execute_state: ORMExecuteState) -> None:
+        if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+            self.pin_to_primary()
+
+    async def commit(self) -> None:
+        if self._session is not None:
+            await self._session.commit()
+
+    async def rollback(self) -> None:
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> 'UnitOfWork':
+        return self
+
+    async def __aexit__(
+            self,
+            exc_type: Optional[Type[BaseException]],
+            exc_value: Optional[BaseException],
+            traceback: Optional[TracebackType]
+    ) -> None:
+
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            await self.close()
@@ -36,3 +36,8 @@ class PreconditionFailedError(DetailedHTTPException):
 
 class ValidationError(DetailedHTTPException):
     STATUS_CODE = status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class ServiceUnavailableError(DetailedHTTPException):
+    STATUS_CODE = status.HTTP_503_SERVICE_UNAVAILABLE
+    DETAIL = ErrorDetails.SERVICE_UNAVAILABLE
@@ -0,0 +1,132 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from functools import partial
+from typing import Any, Callable, Dict, Literal, Optional, Tuple, TypeVar
+
+from src.core.exceptions import ServiceUnavailableError
+
+
+ResultType = TypeVar('ResultType')
+ExecutorKind = Literal['thread', 'process']
+
+
+def _timed_call(func: Callable[..., ResultType], *args: Any) -> Tuple[ResultType, float]:
+    """
+    Calls provided function inside worker and measures its execution time.
+    Defined on module level to be picklable for process pool.
+    """
+
+    started_at: float = time.perf_counter()
+    result: ResultType = func(*args)
+    return result, time.perf_counter() - started_at
+
+
+@dataclass
+class ExecutorStatistics:
+    pending: int = 0  # submitted calls, which are waiting for a worker or are being executed
+    completed: int = 0
+    rejected: int = 0
+    pending_limit: int = 0  # configured limit of pending calls, over which calls are rejected
+    total_execution_seconds: float = 0.0
+    max_execution_seconds: float = 0.0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+# Usage statistics of named executors by executor name:
+executors_statistics: Dict[str, ExecutorStatistics] = {}
+
+
+def get_executors_statistics() -> Dict[str, Dict[str, Any]]:
+    return {name: statistics.to_dict() for name, statistics in executors_statistics.items()}
+
+
+class BoundedExecutor:
+    """
+    Runs blocking CPU-bound functions on a dedicated thread or process pool, so they don't block the event loop.
+    Number of pending calls is bounded: when limit is reached, new calls are rejected instead of being queued.
+    Pool is created lazily on the first call. Statistics of named executors are exported with other metrics.
+    """
+
+    def __init__(self, kind: ExecutorKind, workers: int, max_pending: int, name: Optional[str] = None) -> None:
+        self._kind: ExecutorKind = kind
+        self._workers: int = workers
+        self._max_pending: int = max_pending
+        self._executor: Optional[Executor] = None
+        self._initializer: Optional[Callable[..., None]] = None
+        self._initargs: Tuple[Any, ...] = ()
+        self.statistics: ExecutorStatistics = ExecutorStatistics(pending_limit=max_pending)
+        if name is not None:
+            executors_statistics[name] = self.statistics
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self._kind == 'process':
+                # "spawn" avoids forking a process with running event loop and threads:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=self._initializer,
+                    initargs=self._initargs
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._workers,
+                    initializer=self._initializer,
+                    initargs=self._initargs
+                )
+
+        return self._executor
+
+    async def run(self, func: Callable[..., ResultType], *args: Any) -> ResultType:
+        if self.statistics.pending >= self._max_pending:
+            self.statistics.rejected += 1
+            raise ServiceUnavailableError
+
+        self.statistics.pending += 1
+        submitted_at: float = time.perf_counter()
+        try:
+            timed_result: Tuple[ResultType, float] = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(),
+                partial(_timed_call, func, *args)
+            )
+        finally:
+            self.statistics.pending -= 1
+
+        result, execution_seconds = timed_result
+        wait_seconds: float = max(time.perf_counter() - submitted_at - execution_seconds, 0.0)
+        self.statistics.completed += 1
+        self.statistics.total_execution_seconds += execution_seconds
+        self.statistics.max_execution_seconds = max(self.statistics.max_execution_seconds, execution_seconds)
+        self.statistics.total_wait_seconds += wait_seconds
+        self.statistics.max_wait_seconds = max(self.statistics.max_wait_seconds, wait_seconds)
+        return result
+
+    def set_initializer(self, initializer: Optional[Callable[..., None]], *initargs: Any) -> None:
+        """
+        Sets function, which is called in every worker on its start. Already started workers are shut down,
+        so the next call starts new ones with provided initializer.
+        """
+
+        self._initializer = initializer
+        self._initargs = initargs
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def stop(self) -> None:
+        """
+        Shuts pool down after in-flight calls are finished, waiting for them in a separate thread,
+        so the event loop is not blocked.
+        """
+
+        await asyncio.to_thread(self.shutdown)
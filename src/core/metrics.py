@@ -0,0 +1,188 @@
+from bisect import bisect_left
+from typing import Sequence, Tuple, List, Dict, Any, Optional
+
+from src.core.cache import TTLCache
+from src.core.executors import ExecutorStatistics
+
+
+# Default Prometheus buckets for request latencies in seconds:
+LATENCY_BUCKETS_SECONDS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class Histogram:
+    """
+    Counts observed values in buckets with provided upper bounds. Buckets are cumulative, as in Prometheus:
+    each bucket counts all values, which are less than or equal to its bound.
+    """
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+
+        # The last counter is for values, which are greater than all bounds:
+        self._counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> List[Tuple[float, int]]:
+        """
+        Returns pairs of bucket bound and number of values, which are less than or equal to it.
+        The last bound is infinity and its number equals to total count.
+        """
+
+        cumulative_counts: List[Tuple[float, int]] = []
+        total: int = 0
+        for bound, count in zip((*self.buckets, float('inf')), self._counts):
+            total += count
+            cumulative_counts.append((bound, total))
+
+        return cumulative_counts
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'buckets': {
+                ('+Inf' if bound == float('inf') else str(bound)): count
+                for bound, count in self.cumulative_counts()
+            },
+            'count': self.count,
+            'sum': self.sum,
+        }
+
+
+def format_labels(labels: Dict[str, Any]) -> str:
+    """
+    Formats labels in Prometheus text format with escaped values.
+    """
+
+    formatted_labels: List[str] = []
+    for name, value in labels.items():
+        escaped_value: str = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        formatted_labels.append(f'{name}="{escaped_value}"')
+
+    return '{' + ','.join(formatted_labels) + '}'
+
+
+def format_bound(bound: float) -> str:
+    return '+Inf' if bound == float('inf') else repr(float(bound))
+
+
+class HTTPMetrics:
+    """
+    Collects HTTP requests counts, requests in flight and requests latencies by method and route template,
+    and renders them in Prometheus text format.
+    """
+
+    def __init__(self, latency_buckets: Sequence[float] = LATENCY_BUCKETS_SECONDS) -> None:
+        self._latency_buckets: Sequence[float] = latency_buckets
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        self.in_flight: Dict[str, int] = {}
+        self.latencies: Dict[Tuple[str, str], Histogram] = {}
+
+    def request_started(self, method: str) -> None:
+        self.in_flight[method] = self.in_flight.get(method, 0) + 1
+
+    def request_finished(self, method: str, route: str, status_code: int, seconds: float) -> None:
+        self.in_flight[method] -= 1
+
+        requests_key: Tuple[str, str, int] = (method, route, status_code)
+        self.requests[requests_key] = self.requests.get(requests_key, 0) + 1
+
+        latency: Optional[Histogram] = self.latencies.get((method, route))
+        if latency is None:
+            latency = self.latencies[(method, route)] = Histogram(buckets=self._latency_buckets)
+
+        latency.observe(seconds)
+
+    def clear(self) -> None:
+        self.requests.clear()
+        self.in_flight.clear()
+        self.latencies.clear()
+
+    def render(self) -> str:
+        lines: List[str] = [
+            '# HELP http_requests_total Total number of HTTP requests.',
+            '# TYPE http_requests_total counter',
+        ]
+        for (method, route, status_code), count in self.requests.items():
+            labels: str = format_labels({'method': method, 'route': route, 'status': status_code})
+            lines.append(f'http_requests_total{labels} {count}')
+
+        lines.extend([
+            '# HELP http_requests_in_flight Number of HTTP requests, which are being processed.',
+            '# TYPE http_requests_in_flight gauge',
+        ])
+        for method, count in self.in_flight.items():
+            lines.append(f'http_requests_in_flight{format_labels({"method": method})} {count}')
+
+        lines.extend([
+            '# HELP http_request_duration_seconds HTTP requests latency in seconds.',
+            '# TYPE http_request_duration_seconds histogram',
+        ])
+        for (method, route), histogram in self.latencies.items():
+            for bound, count in histogram.cumulative_counts():
+                bucket_labels: str = format_labels({'method': method, 'route': route, 'le': format_bound(bound)})
+                lines.append(f'http_request_duration_seconds_bucket{bucket_labels} {count}')
+
+            labels = format_labels({'method': method, 'route': route})
+            lines.append(f'http_request_duration_seconds_sum{labels} {histogram.sum}')
+            lines.append(f'http_request_duration_seconds_count{labels} {histogram.count}')
+
+        return '\n'.join(lines) + '\n'
+
+
+# Executors statistics fields with names, types and descriptions of metrics, they are rendered as:
+EXECUTOR_METRICS: Tuple[Tuple[str, str, str, str], ...] = (
+    ('pending', 'executor_pending_calls', 'gauge', 'Number of calls, waiting for a worker or being executed.'),
+    ('pending_limit', 'executor_pending_calls_limit', 'gauge', 'Limit of pending calls, over which they are rejected.'),
+    ('completed', 'executor_completed_calls_total', 'counter', 'Total number of completed calls.'),
+    ('rejected', 'executor_rejected_calls_total', 'counter', 'Total number of calls, rejected over pending limit.'),
+    ('total_execution_seconds', 'executor_execution_seconds_total', 'counter', 'Total calls execution time.'),
+    ('max_execution_seconds', 'executor_execution_seconds_max', 'gauge', 'Maximum call execution time.'),
+    ('total_wait_seconds', 'executor_wait_seconds_total', 'counter', 'Total time of calls waiting for a worker.'),
+    ('max_wait_seconds', 'executor_wait_seconds_max', 'gauge', 'Maximum time of call waiting for a worker.'),
+)
+
+
+def render_executors_metrics(executors_statistics: Dict[str, ExecutorStatistics]) -> str:
+    """
+    Renders queue depth, calls counts and latencies of executors by executor name in Prometheus text format.
+    """
+
+    lines: List[str] = []
+    for field, metric, metric_type, description in EXECUTOR_METRICS:
+        lines.extend([f'# HELP {metric} {description}', f'# TYPE {metric} {metric_type}'])
+        for name, statistics in executors_statistics.items():
+            lines.append(f'{metric}{format_labels({"executor": name})} {getattr(statistics, field)}')
+
+    return '\n'.join(lines) + '\n'
+
+
+# Cache statistics keys with names, types and descriptions of metrics, they are rendered as:
+CACHE_METRICS: Tuple[Tuple[str, str, str, str], ...] = (
+    ('hits', 'cache_hits_total', 'counter', 'Total number of lookups, which found valid entry.'),
+    ('misses', 'cache_misses_total', 'counter', 'Total number of lookups, which found no valid entry.'),
+    ('size', 'cache_entries', 'gauge', 'Number of cached entries, including expired ones, not evicted yet.'),
+    ('max_size', 'cache_max_entries', 'gauge', 'Maximum number of cached entries.'),
+)
+
+
+def render_caches_metrics(caches: Dict[str, TTLCache[Any, Any]]) -> str:
+    """
+    Renders hits, misses and sizes of caches by cache name in Prometheus text format.
+    """
+
+    caches_statistics: Dict[str, Dict[str, Any]] = {name: cache.to_dict() for name, cache in caches.items()}
+    lines: List[str] = []
+    for key, metric, metric_type, description in CACHE_METRICS:
+        lines.extend([f'# HELP {metric} {description}', f'# TYPE {metric} {metric_type}'])
+        for name, statistics in caches_statistics.items():
+            lines.append(f'{metric}{format_labels({"cache": name})} {statistics[key]}')
+
+    return '\n'.join(lines) + '\n'
+
+
+http_metrics: HTTPMetrics = HTTPMetrics()
@@ -0,0 +1,110 @@
+import time
+import logging
+from contextvars import Token
+from typing import Optional
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+from src.core.cache import caches
+from src.core.executors import executors_statistics
+from src.core.metrics import HTTPMetrics, render_executors_metrics, render_caches_metrics
+from src.core.database.query_statistics import RequestQueryStatistics, current_query_statistics
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+# Requests, which didn't match any route, share one label to keep number of metrics bounded:
+UNMATCHED_ROUTE: str = '<unmatched>'
+
+
+class MetricsMiddleware:
+    """
+    Records metrics of HTTP requests by route template and serves them in Prometheus text format on provided path
+    together with metrics of executors and caches.
+    Implemented as pure ASGI middleware, because BaseHTTPMiddleware wraps every response into a streaming one
+    and adds noticeable overhead to each request.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: HTTPMetrics, path: str) -> None:
+        self.app: ASGIApp = app
+        self.metrics: HTTPMetrics = metrics
+        self.path: str = path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        if scope['path'] == self.path:
+            await self._send_metrics(send=send)
+            return
+
+        method: str = scope['method']
+        status_code: int = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+
+            await send(message)
+
+        self.metrics.request_started(method=method)
+        started_at: float = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # Router stores matched route in scope, so route template is known only after request is handled:
+            route: str = getattr(scope.get('route'), 'path', UNMATCHED_ROUTE)
+            self.metrics.request_finished(
+                method=method,
+                route=route,
+                status_code=status_code,
+                seconds=time.perf_counter() - started_at
+            )
+
+    async def _send_metrics(self, send: Send) -> None:
+        body: bytes = (
+            self.metrics.render() + render_executors_metrics(executors_statistics) + render_caches_metrics(caches)
+        ).encode()
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'content-type', b'text/plain; version=0.0.4; charset=utf-8'),
+                (b'content-length', str(len(body)).encode()),
+            ],
+        })
+        await send({'type': 'http.response.body', 'body': body})
+
+
+class QueryStatisticsMiddleware:
+    """
+    Attributes queries, performed while handling request, to this request and warns, when number of queries
+    exceeds provided budget.
+    """
+
+    def __init__(self, app: ASGIApp, query_budget: int) -> None:
+        self.app: ASGIApp = app
+        self.query_budget: int = query_budget
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        statistics: RequestQueryStatistics = RequestQueryStatistics(scope=scope)
+        token: Token[Optional[RequestQueryStatistics]] = current_query_statistics.set(statistics)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_query_statistics.reset(token)
+            if statistics.queries > self.query_budget:
+                logger.warning(
+                    'Request %s %s performed %d queries in %.1fms, which exceeds budget of %d queries',
+                    scope['method'],
+                    statistics.route,
+                    statistics.queries,
+                    statistics.seconds * 1000,
+                    self.query_budget
+                )
@@ -1,5 +1,8 @@
+import base64
+import binascii
+import json
 import re
-from typing import Optional
+from typing import Optional, Any, List
 
 
 def get_substring_before_chars(string: str, chars: str) -> str:
@@ -34,3 +37,28 @@ def get_substring_after_chars(string: str, chars: str) -> str:
         return result.group()
 
     return string
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encodes provided keyset pagination values to opaque url-safe cursor.
+    """
+
+    return base64.urlsafe_b64encode(json.dumps(values, separators=(',', ':')).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """
+    Decodes keyset pagination values from cursor, created by "encode_cursor" function.
+    Raises ValueError, if cursor is malformed.
+    """
+
+    try:
+        values: Any = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError):
+        raise ValueError(f'Invalid cursor: {cursor}')
+
+    if not isinstance(values, list):
+        raise ValueError(f'Invalid cursor: {cursor}')
+
+    return values
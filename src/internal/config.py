@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from typing import Tuple, Optional
+from pydantic_settings import BaseSettings
+
+from src.config import RouterConfig as BaseRouterConfig
+
+
+@dataclass(frozen=True)
+class URLPathsConfig:
+    DATABASE_POOLS: str = '/database/pools'
+    EXECUTORS: str = '/executors'
+    CACHES: str = '/caches'
+    USERS_IMPORT: str = '/users/import'
+
+
+@dataclass(frozen=True)
+class URLNamesConfig:
+    DATABASE_POOLS: str = 'get database pools statistics'
+    EXECUTORS: str = 'get executors statistics'
+    CACHES: str = 'get caches statistics'
+    USERS_IMPORT: str = 'import users'
+
+
+@dataclass(frozen=True)
+class RouterConfig(BaseRouterConfig):
+    PREFIX: str = '/internal'
+    TAGS: Tuple[str] = ('Internal', )
+
+
+class InternalConfig(BaseSettings):
+    # Internal endpoints are disabled, unless key is provided. Key is expected in "X-Internal-API-Key" header:
+    INTERNAL_API_KEY: Optional[str] = None
+
+
+internal_config: InternalConfig = InternalConfig()
@@ -0,0 +1,10 @@
+from src.core.constants import ErrorDetails as BaseErrorDetails
+
+
+class ErrorDetails(BaseErrorDetails):
+    """
+    Internal endpoints error messages for custom exceptions.
+    """
+
+    INTERNAL_API_DISABLED: str = 'Not Found'
+    INVALID_INTERNAL_API_KEY: str = 'Provided internal API key is invalid'
@@ -0,0 +1,49 @@
+import hmac
+from fastapi import Header, Query, Request
+from typing import Annotated, Optional, Dict, Any
+
+from src.internal.config import internal_config
+from src.internal.exceptions import InternalAPIDisabledError, InvalidInternalAPIKeyError
+from src.core.database.connection import get_pools_statistics
+from src.core.cache import get_caches_statistics as get_caches_statistics_dict
+from src.core.executors import get_executors_statistics as get_executors_statistics_dict
+from src.users.config import ExportFormat
+from src.users.importer import UsersImportReport, import_users as import_users_stream
+
+
+async def verify_internal_api_key(x_internal_api_key: Annotated[Optional[str], Header()] = None) -> None:
+    """
+    Allows access to internal endpoints only with configured key. Without configured key endpoints
+    pretend not to exist.
+    """
+
+    if internal_config.INTERNAL_API_KEY is None:
+        raise InternalAPIDisabledError
+
+    if x_internal_api_key is None or not hmac.compare_digest(x_internal_api_key, internal_config.INTERNAL_API_KEY):
+        raise InvalidInternalAPIKeyError
+
+
+async def get_database_pools_statistics() -> Dict[str, Dict[str, Any]]:
+    return get_pools_statistics()
+
+
+async def get_executors_statistics() -> Dict[str, Dict[str, Any]]:
+    return get_executors_statistics_dict()
+
+
+async def get_caches_statistics() -> Dict[str, Dict[str, Any]]:
+    return get_caches_statistics_dict()
+
+
+async def import_users(
+        request: Request,
+        import_format: Annotated[ExportFormat, Query(alias='format')] = ExportFormat.NDJSON
+) -> Dict[str, Any]:
+    """
+    Imports users from request body, which is streamed in NDJSON or CSV format, so whole file is never
+    kept in memory. Every batch is committed separately, rather than in request-scoped unit of work.
+    """
+
+    report: UsersImportReport = await import_users_stream(chunks=request.stream(), import_format=import_format)
+    return report.to_dict()
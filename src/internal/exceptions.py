@@ -0,0 +1,10 @@
+from src.internal.constants import ErrorDetails
+from src.core.exceptions import NotFoundError, PermissionDeniedError
+
+
+class InternalAPIDisabledError(NotFoundError):
+    DETAIL = ErrorDetails.INTERNAL_API_DISABLED
+
+
+class InvalidInternalAPIKeyError(PermissionDeniedError):
+    DETAIL = ErrorDetails.INVALID_INTERNAL_API_KEY
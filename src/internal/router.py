@@ -0,0 +1,64 @@
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
+from typing import Dict, Any
+
+from src.internal.config import RouterConfig, URLPathsConfig, URLNamesConfig
+from src.internal.dependencies import (
+    verify_internal_api_key,
+    get_database_pools_statistics as get_database_pools_statistics_dependency,
+    get_executors_statistics as get_executors_statistics_dependency,
+    get_caches_statistics as get_caches_statistics_dependency,
+    import_users as import_users_dependency
+)
+
+
+router = APIRouter(
+    prefix=RouterConfig.PREFIX,
+    tags=RouterConfig.tags_list(),
+    dependencies=[Depends(verify_internal_api_key)],
+    include_in_schema=False
+)
+
+
+@router.get(
+    path=URLPathsConfig.DATABASE_POOLS,
+    response_class=ORJSONResponse,
+    name=URLNamesConfig.DATABASE_POOLS,
+    status_code=status.HTTP_200_OK
+)
+async def get_database_pools_statistics(
+        statistics: Dict[str, Dict[str, Any]] = Depends(get_database_pools_statistics_dependency)
+):
+    return statistics
+
+
+@router.get(
+    path=URLPathsConfig.EXECUTORS,
+    response_class=ORJSONResponse,
+    name=URLNamesConfig.EXECUTORS,
+    status_code=status.HTTP_200_OK
+)
+async def get_executors_statistics(
+        statistics: Dict[str, Dict[str, Any]] = Depends(get_executors_statistics_dependency)
+):
+    return statistics
+
+
+@router.get(
+    path=URLPathsConfig.CACHES,
+    response_class=ORJSONResponse,
+    name=URLNamesConfig.CACHES,
+    status_code=status.HTTP_200_OK
+)
+async def get_caches_statistics(statistics: Dict[str, Dict[str, Any]] = Depends(get_caches_statistics_dependency)):
+    return statistics
+
+
+@router.post(
+    path=URLPathsConfig.USERS_IMPORT,
+    response_class=ORJSONResponse,
+    name=URLNamesConfig.USERS_IMPORT,
+    status_code=status.HTTP_200_OK
+)
+async def import_users(report: Dict[str, Any] = Depends(import_users_dependency)):
+    return report
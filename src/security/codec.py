@@ -0,0 +1,87 @@
+import hmac
+import hashlib
+import binascii
+import orjson
+from base64 import urlsafe_b64encode, urlsafe_b64decode
+from datetime import datetime, timezone
+from typing import Callable, Dict, Any
+
+from src.security.config import jwt_config
+from src.security.models import JWTDataModel
+from src.security.exceptions import InvalidTokenError
+
+
+HMAC_DIGESTS: Dict[str, Callable[..., Any]] = {
+    'HS256': hashlib.sha256,
+    'HS384': hashlib.sha384,
+    'HS512': hashlib.sha512,
+}
+
+
+def base64url_encode(data: bytes) -> bytes:
+    return urlsafe_b64encode(data).rstrip(b'=')
+
+
+def base64url_decode(data: bytes) -> bytes:
+    return urlsafe_b64decode(data + b'=' * (-len(data) % 4))
+
+
+class JWTCodec:
+    """
+    Encodes and decodes HMAC signed JWT tokens with token data.
+    Signing key and token header are built once, and decoding skips pydantic validation, because token data
+    is trusted after signature is verified.
+    """
+
+    def __init__(self, secret_key: str, algorithm: str) -> None:
+        if algorithm not in HMAC_DIGESTS:
+            raise ValueError(f'Unsupported JWT algorithm {algorithm}, supported are {", ".join(HMAC_DIGESTS)}')
+
+        self._key: bytes = secret_key.encode()
+        self._algorithm: str = algorithm
+        self._digest: Callable[..., Any] = HMAC_DIGESTS[algorithm]
+        self._header: bytes = base64url_encode(orjson.dumps({'alg': algorithm, 'typ': 'JWT'}))
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        return base64url_encode(hmac.digest(self._key, signing_input, self._digest))
+
+    def encode(self, jwt_data: JWTDataModel) -> str:
+        payload: bytes = base64url_encode(
+            orjson.dumps({'user_id': jwt_data.user_id, 'exp': int(jwt_data.exp.timestamp())})
+        )
+        signing_input: bytes = self._header + b'.' + payload
+        return (signing_input + b'.' + self._sign(signing_input)).decode()
+
+    def decode(self, token: str) -> JWTDataModel:
+        """
+        Verifies token signature and expiration and returns token data.
+        """
+
+        try:
+            signing_input, signature = token.encode().rsplit(b'.', 1)
+            header, payload = signing_input.split(b'.')
+
+            # Header differs from pre-built one only for tokens, issued by other JWT libraries:
+            if header != self._header and orjson.loads(base64url_decode(header)).get('alg') != self._algorithm:
+                raise InvalidTokenError
+
+            if not hmac.compare_digest(signature, self._sign(signing_input)):
+                raise InvalidTokenError
+
+            claims: Dict[str, Any] = orjson.loads(base64url_decode(payload))
+            user_id: Any = claims['user_id']
+            exp: Any = claims['exp']
+        except (ValueError, KeyError, AttributeError, TypeError, binascii.Error, orjson.JSONDecodeError):
+            raise InvalidTokenError
+
+        if type(user_id) is not int or type(exp) not in (int, float):
+            raise InvalidTokenError
+
+        expires_at: datetime = datetime.fromtimestamp(exp, tz=timezone.utc)
+        if expires_at < datetime.now(tz=timezone.utc):
+            raise InvalidTokenError
+
+        return JWTDataModel.model_construct(user_id=user_id, exp=expires_at)
+
+
+jwt_codec: JWTCodec = JWTCodec(secret_key=jwt_config.JWT_TOKEN_SECRET_KEY, algorithm=jwt_config.JWT_TOKEN_ALGORITHM)
@@ -5,6 +5,8 @@ class JWTConfig(BaseSettings):
     JWT_TOKEN_SECRET_KEY: str
     JWT_TOKEN_ALGORITHM: str
     JWT_TOKEN_EXPIRE_DAYS: int
+    JWT_TOKEN_CACHE_MAX_SIZE: int = 10000
+    JWT_TOKEN_CACHE_TTL_SECONDS: float = 300
 
 
 jwt_config: JWTConfig = JWTConfig()
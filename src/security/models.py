@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime, timedelta, timezone
 
 from src.security.config import jwt_config
@@ -7,5 +7,7 @@ from src.security.config import jwt_config
 class JWTDataModel(BaseModel):
     user_id: int
 
-    # Name should be only "exp" due to JWT docs. In other case will raise datetime encode error:
-    exp: datetime = datetime.now(tz=timezone.utc) + timedelta(days=jwt_config.JWT_TOKEN_EXPIRE_DAYS)
+    # Name should be only "exp" due to JWT docs. Expiration is computed for every issued token:
+    exp: datetime = Field(
+        default_factory=lambda: datetime.now(tz=timezone.utc) + timedelta(days=jwt_config.JWT_TOKEN_EXPIRE_DAYS)
+    )
@@ -1,17 +1,24 @@
+import hashlib
 from datetime import datetime, timezone
-from jose import jwt, JWTError, ExpiredSignatureError
+from typing import Optional
 
+from src.core.cache import TTLCache
+from src.security.codec import jwt_codec
 from src.security.config import jwt_config
 from src.security.models import JWTDataModel
 from src.security.exceptions import InvalidTokenError
 
 
+# Verified tokens, keyed by token digest, to avoid storing raw tokens and decoding same cookie on every request:
+jwt_tokens_cache: TTLCache[bytes, JWTDataModel] = TTLCache(
+    max_size=jwt_config.JWT_TOKEN_CACHE_MAX_SIZE,
+    ttl=jwt_config.JWT_TOKEN_CACHE_TTL_SECONDS,
+    name='jwt_tokens'
+)
+
+
 async def create_jwt_token(jwt_data: JWTDataModel) -> str:
-    jwt_token: str = jwt.encode(
-        claims=jwt_data.model_dump(),
-        key=jwt_config.JWT_TOKEN_SECRET_KEY,
-        algorithm=jwt_config.JWT_TOKEN_ALGORITHM
-    )
+    jwt_token: str = jwt_codec.encode(jwt_data=jwt_data)
     return jwt_token
 
 
@@ -19,16 +26,20 @@ async def parse_jwt_token(token: str) -> JWTDataModel:
     """
     Decodes a JWT token, checks, if token is valid and hadn't expired and returns a JWTData object,
     which represents token data.
+
+    Verified tokens are cached until their expiration, so repeated requests with the same token skip decoding.
     """
 
-    try:
-        payload = jwt.decode(token, jwt_config.JWT_TOKEN_SECRET_KEY, algorithms=[jwt_config.JWT_TOKEN_ALGORITHM])
-        payload['exp'] = datetime.fromtimestamp(payload['exp'], tz=timezone.utc)  # converting to datetime format
-    except (JWTError, ExpiredSignatureError):
-        raise InvalidTokenError
+    token_digest: bytes = hashlib.sha256(token.encode()).digest()
+    cached_jwt_data: Optional[JWTDataModel] = jwt_tokens_cache.get(token_digest)
+    if cached_jwt_data is not None:
+        if cached_jwt_data.exp < datetime.now(tz=timezone.utc):
+            jwt_tokens_cache.invalidate(token_digest)
+            raise InvalidTokenError
 
-    jwt_data: JWTDataModel = JWTDataModel(**payload)
-    if jwt_data.exp < datetime.now(tz=timezone.utc):
-        raise InvalidTokenError
+        return cached_jwt_data
 
+    jwt_data: JWTDataModel = jwt_codec.decode(token=token)
+    now: datetime = datetime.now(tz=timezone.utc)
+    jwt_tokens_cache.set(token_digest, jwt_data, ttl=(jwt_data.exp - now).total_seconds())
     return jwt_data
@@ -0,0 +1,140 @@
+"""
+Users management commands.
+
+Usage:
+    python -m src.users.cli [--env-file .env] <command> --help
+"""
+
+import argparse
+import asyncio
+import time
+from typing import AsyncGenerator, BinaryIO
+from dotenv import load_dotenv
+
+
+def calibrate_hashing(args: argparse.Namespace) -> None:
+    """
+    Prints hashing cost, which meets provided latency budget on current hardware, in environments file format.
+    """
+
+    # Importing after environments are loaded, because configs are read on import:
+    from passlib.registry import get_crypt_handler
+    from src.users.config import passlib_config
+    from src.users.utils import calibrate_password_rounds
+
+    scheme: str = args.scheme or passlib_config.PASSLIB_SCHEME
+    rounds: int = calibrate_password_rounds(target_milliseconds=args.target_milliseconds, scheme=scheme)
+    started_at: float = time.perf_counter()
+    get_crypt_handler(scheme).using(rounds=rounds).hash('calibration password')
+    elapsed_milliseconds: float = (time.perf_counter() - started_at) * 1000
+
+    print(f'# {scheme}: {rounds} rounds take {elapsed_milliseconds:.1f}ms per hash on this machine')
+    print(f'PASSLIB_ROUNDS={rounds}')
+
+
+def recompute_scores(args: argparse.Namespace) -> None:
+    """
+    Recomputes stored leaderboard scores of all users from their votes counters.
+    """
+
+    # Importing after environments are loaded, because configs are read on import:
+    from src.core.database.connection import engine
+    from src.users.config import UsersLeaderboardConfig
+    from src.users.service import UsersService
+
+    batch_size: int = args.batch_size or UsersLeaderboardConfig.RECOMPUTE_BATCH_SIZE
+
+    async def recompute() -> int:
+        try:
+            return await UsersService().recompute_users_scores(batch_size=batch_size)
+        finally:
+            await engine.dispose()
+
+    started_at: float = time.perf_counter()
+    updated_count: int = asyncio.run(recompute())
+    print(f'Recomputed scores of {updated_count} users in {time.perf_counter() - started_at:.1f}s')
+
+
+async def read_file_chunks(file: BinaryIO, chunk_size: int = 64 * 1024) -> AsyncGenerator[bytes, None]:
+    while chunk := file.read(chunk_size):
+        yield chunk
+
+
+def import_users(args: argparse.Namespace) -> None:
+    """
+    Imports users from NDJSON or CSV file with plain passwords and prints progress after every batch.
+    """
+
+    # Importing after environments are loaded, because configs are read on import:
+    from src.core.database.connection import engine
+    from src.users.config import ExportFormat, users_import_config
+    from src.users.importer import UsersImportReport, import_users as import_users_stream
+    from src.users.utils import users_import_executor, setup_password_hashing
+
+    def print_progress(report: UsersImportReport) -> None:
+        print(
+            f'processed={report.processed} imported={report.imported} skipped={report.skipped} '
+            f'invalid={report.invalid} rows/s={report.rows_per_second:.0f}',
+            flush=True
+        )
+
+    async def run_import() -> UsersImportReport:
+        try:
+            with open(args.file, 'rb') as file:
+                return await import_users_stream(
+                    chunks=read_file_chunks(file=file),
+                    import_format=ExportFormat(args.format),
+                    batch_size=args.batch_size or users_import_config.USERS_IMPORT_BATCH_SIZE,
+                    on_progress=print_progress
+                )
+        finally:
+            await engine.dispose()
+            await users_import_executor.stop()
+
+    setup_password_hashing()
+    report: UsersImportReport = asyncio.run(run_import())
+    for error in report.errors:
+        print(f'line {error["line"]}: {error["error"]}')
+
+    print(f'Imported {report.imported} users in {report.seconds:.1f}s, {report.rows_per_second:.0f} rows/s')
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--env-file', default='.env', help='environments file to load')
+    subparsers = parser.add_subparsers(required=True)
+
+    calibrate_hashing_parser: argparse.ArgumentParser = subparsers.add_parser(
+        'calibrate-hashing',
+        help='calibrate password hashing cost to meet latency budget'
+    )
+    calibrate_hashing_parser.add_argument('--target-milliseconds', type=float, default=100)
+    calibrate_hashing_parser.add_argument('--scheme', help='passlib scheme, PASSLIB_SCHEME by default')
+    calibrate_hashing_parser.set_defaults(handler=calibrate_hashing)
+
+    recompute_scores_parser: argparse.ArgumentParser = subparsers.add_parser(
+        'recompute-scores',
+        help='recompute leaderboard scores of all users from their votes'
+    )
+    recompute_scores_parser.add_argument('--batch-size', type=int, help='statistics per transaction, 10000 by default')
+    recompute_scores_parser.set_defaults(handler=recompute_scores)
+
+    import_users_parser: argparse.ArgumentParser = subparsers.add_parser(
+        'import-users',
+        help='import users from NDJSON or CSV file with email, username and plain password of every user'
+    )
+    import_users_parser.add_argument('file', help='path to file to import')
+    import_users_parser.add_argument('--format', choices=('ndjson', 'csv'), default='ndjson')
+    import_users_parser.add_argument('--batch-size', type=int, help='users per transaction, 500 by default')
+    import_users_parser.set_defaults(handler=import_users)
+    return parser
+
+
+def main() -> None:
+    args: argparse.Namespace = build_parser().parse_args()
+    load_dotenv(args.env_file)
+    args.handler(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from typing import Tuple, Literal
+from enum import Enum
+from typing import Tuple, Literal, Optional
 from pydantic_settings import BaseSettings
 
 from src.config import RouterConfig as BaseRouterConfig
@@ -16,6 +17,9 @@ class URLPathsConfig:
     MY_STATS: str = '/get-my-statistics'
     LIKE_USER: str = '/{user_id}/like'
     DISLIKE_USER: str = '/{user_id}/dislike'
+    EXPORT: str = '/export'
+    LEADERBOARD: str = '/leaderboard'
+    VOTES: str = '/votes'
 
 
 @dataclass(frozen=True)
@@ -29,6 +33,9 @@ class URLNamesConfig:
     MY_STATS: str = 'get my statistics'
     LIKE_USER: str = 'like user'
     DISLIKE_USER: str = 'dislike user'
+    EXPORT: str = 'export users'
+    LEADERBOARD: str = 'get users leaderboard'
+    VOTES: str = 'vote for users'
 
 
 @dataclass(frozen=True)
@@ -39,6 +46,61 @@ class UserValidationConfig:
     USERNAME_MAX_LENGTH: int = 60
 
 
+@dataclass(frozen=True)
+class UsersPaginationConfig:
+    DEFAULT_PAGE_SIZE: int = 50
+    MAX_PAGE_SIZE: int = 500
+    TOTAL_COUNT_CACHE_TTL_SECONDS: int = 30
+
+
+class ExportFormat(str, Enum):
+    NDJSON = 'ndjson'
+    CSV = 'csv'
+
+
+@dataclass(frozen=True)
+class UsersExportConfig:
+    BATCH_SIZE: int = 1000
+    NDJSON_MEDIA_TYPE: str = 'application/x-ndjson'
+    CSV_MEDIA_TYPE: str = 'text/csv'
+    FIELDS: Tuple[str, ...] = ('id', 'email', 'username', 'likes', 'dislikes')
+
+
+class LeaderboardOrder(str, Enum):
+    LIKES = 'likes'
+    SCORE = 'score'
+    WILSON_SCORE = 'wilson_score'
+
+
+@dataclass(frozen=True)
+class UsersLeaderboardConfig:
+    DEFAULT_PAGE_SIZE: int = 10
+    MAX_PAGE_SIZE: int = 100
+
+    # Confidence level of Wilson score lower bound: 1.96 quantile corresponds to 95% confidence:
+    WILSON_SCORE_Z: float = 1.96
+
+    # Scores are recomputed in ranges of statistics ids, each in its own transaction:
+    RECOMPUTE_BATCH_SIZE: int = 10000
+
+
+class VoteType(str, Enum):
+    LIKE = 'like'
+    DISLIKE = 'dislike'
+
+
+class VoteOutcome(str, Enum):
+    APPLIED = 'applied'
+    ALREADY_VOTED = 'already_voted'
+    SELF_VOTE = 'self_vote'
+    NOT_FOUND = 'not_found'
+
+
+@dataclass(frozen=True)
+class UsersVotesConfig:
+    BATCH_MAX_SIZE: int = 500
+
+
 @dataclass(frozen=True)
 class RouterConfig(BaseRouterConfig):
     PREFIX: str = '/users'
@@ -57,6 +119,42 @@ class PasslibConfig(BaseSettings):
     PASSLIB_SCHEME: str
     PASSLIB_DEPRECATED: str
 
+    # Hashing is performed on a dedicated pool, so it doesn't block the event loop:
+    PASSLIB_EXECUTOR: Literal['thread', 'process'] = 'thread'
+    PASSLIB_WORKERS: int = 4
+    PASSLIB_MAX_PENDING: int = 256
+
+    # Hashing cost (rounds) for the scheme. If not provided, but target hash latency is provided, cost is calibrated
+    # on application startup. Stored hashes with lower cost are rehashed on successful login:
+    PASSLIB_ROUNDS: Optional[int] = None
+    PASSLIB_TARGET_HASH_MILLISECONDS: Optional[float] = None
+
+
+class UsersCacheConfig(BaseSettings):
+    # Authenticated users are cached by id to skip loading user from database on every request:
+    USERS_IDENTITY_CACHE_MAX_SIZE: int = 10000
+    USERS_IDENTITY_CACHE_TTL_SECONDS: float = 60
+
+
+class VotesBufferConfig(BaseSettings):
+    # Votes counters increments can be coalesced in memory per user and applied with batched UPDATE
+    # every flush interval or, if earlier, when number of pending votes reaches the limit:
+    VOTES_BUFFER_ENABLED: bool = False
+    VOTES_BUFFER_FLUSH_INTERVAL_MILLISECONDS: float = 100
+    VOTES_BUFFER_MAX_PENDING_VOTES: int = 1000
+
+
+class UsersImportConfig(BaseSettings):
+    # Passwords of imported users are hashed on dedicated process pool, so import doesn't slow down logins:
+    USERS_IMPORT_WORKERS: int = 4
+    USERS_IMPORT_BATCH_SIZE: int = 500
+
+    # Only first invalid records are reported with their errors, the rest are only counted:
+    USERS_IMPORT_MAX_REPORTED_ERRORS: int = 100
+
 
 cookies_config: CookiesConfig = CookiesConfig()
 passlib_config: PasslibConfig = PasslibConfig()
+users_cache_config: UsersCacheConfig = UsersCacheConfig()
+votes_buffer_config: VotesBufferConfig = VotesBufferConfig()
+users_import_config: UsersImportConfig = UsersImportConfig()
@@ -20,3 +20,4 @@ class ErrorDetails(BaseErrorDetails):
     USER_CAN_NOT_VOTE_FOR_HIMSELF: str = 'User can not vote for himself'
     USER_STATISTICS_NOT_FOUND: str = 'User statistics not found'
     USER_ALREADY_VOTED: str = 'Current user already voted for provided user'
+    INVALID_CURSOR: str = 'Provided pagination cursor is invalid'
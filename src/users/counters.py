@@ -0,0 +1,225 @@
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Dict, List, Optional, Tuple, Any
+from sqlalchemy import event, update, bindparam, Integer, Table, Update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from src.users.config import VoteType, votes_buffer_config
+from src.users.models import UserStatisticsModel
+from src.users.utils import wilson_score_lower_bound, calculate_wilson_score_lower_bound
+from src.core.database.connection import session_factory as default_session_factory
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Session info key of votes, which are added to buffer only after session transaction is committed:
+SESSION_VOTES_KEY: str = 'buffered_votes'
+
+
+def build_counters_update() -> Update:
+    """
+    Returns UPDATE statement, which applies coalesced increments to counters and scores of one user.
+    Statement is executed once for all buffered users with list of parameters.
+    """
+
+    table: Table = UserStatisticsModel.__table__  # type: ignore[assignment]
+    likes: Any = table.c.likes + bindparam('likes_increment', type_=Integer)
+    dislikes: Any = table.c.dislikes + bindparam('dislikes_increment', type_=Integer)
+    return update(
+        table
+    ).where(
+        table.c.user_id == bindparam('voted_for_user_id', type_=Integer)
+    ).values(
+        likes=likes,
+        dislikes=dislikes,
+        score=likes - dislikes,
+        wilson_score=wilson_score_lower_bound(likes, dislikes)
+    )
+
+
+class VoteCountersBuffer:
+    """
+    Write-behind buffer of users statistics counters. Votes themselves are inserted within caller's transaction,
+    while counters increments are coalesced per user in memory and applied by background task with one batched
+    UPDATE every flush interval or, if earlier, when number of pending votes reaches the limit. So frequently voted
+    for users don't make every vote wait for lock of the same statistics row.
+
+    Buffer is in-process: reads merge increments, pending in the same process, and stopping the buffer drains it.
+    """
+
+    def __init__(
+            self,
+            session_factory: async_sessionmaker = default_session_factory,
+            flush_interval_milliseconds: float = votes_buffer_config.VOTES_BUFFER_FLUSH_INTERVAL_MILLISECONDS,
+            max_pending_votes: int = votes_buffer_config.VOTES_BUFFER_MAX_PENDING_VOTES
+    ) -> None:
+
+        self._session_factory: async_sessionmaker = session_factory
+        self._flush_interval_seconds: float = flush_interval_milliseconds / 1000
+        self._max_pending_votes: int = max_pending_votes
+
+        # Likes and dislikes increments by user id, which are waiting for flush and which are being flushed:
+        self._pending: Dict[int, List[int]] = {}
+        self._flushing: Dict[int, List[int]] = {}
+        self._pending_votes: int = 0
+
+        # Event and task are created on start, because they are bound to running event loop:
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping: bool = False
+        self.flushes: int = 0
+
+    @property
+    def pending_votes(self) -> int:
+        return self._pending_votes
+
+    def add(self, user_id: int, vote: VoteType) -> None:
+        increments: List[int] = self._pending.setdefault(user_id, [0, 0])
+        increments[0 if vote == VoteType.LIKE else 1] += 1
+        self._pending_votes += 1
+        if self._pending_votes >= self._max_pending_votes and self._flush_requested is not None:
+            self._flush_requested.set()
+
+    def add_on_commit(self, session: AsyncSession, user_id: int, vote: VoteType) -> None:
+        """
+        Adds vote to buffer, once transaction of provided session is committed, so increments of rolled back votes
+        are never applied.
+        """
+
+        session_votes: Optional[List[Tuple[int, VoteType]]] = session.info.get(SESSION_VOTES_KEY)
+        if session_votes is None:
+            session_votes = session.info[SESSION_VOTES_KEY] = []
+            event.listen(session.sync_session, 'after_commit', self._on_commit)
+            event.listen(session.sync_session, 'after_rollback', self._on_rollback)
+
+        session_votes.append((user_id, vote))
+
+    def _on_commit(self, session: Session) -> None:
+        session_votes: List[Tuple[int, VoteType]] = session.info[SESSION_VOTES_KEY]
+        for user_id, vote in session_votes:
+            self.add(user_id=user_id, vote=vote)
+
+        session_votes.clear()
+
+    def _on_rollback(self, session: Session) -> None:
+        session.info[SESSION_VOTES_KEY].clear()
+
+    def get_increments(self, user_id: int) -> Tuple[int, int]:
+        """
+        Returns likes and dislikes increments of user, which are not applied to database yet.
+        """
+
+        pending: List[int] = self._pending.get(user_id, [0, 0])
+        flushing: List[int] = self._flushing.get(user_id, [0, 0])
+        return pending[0] + flushing[0], pending[1] + flushing[1]
+
+    def merge(self, user_statistics: UserStatisticsModel, likes: int = 0, dislikes: int = 0) -> UserStatisticsModel:
+        """
+        Returns user statistics with pending and provided increments merged in. Merged statistics are detached
+        from any session, so changing them doesn't write anything to database.
+        """
+
+        pending_likes, pending_dislikes = self.get_increments(user_id=user_statistics.user_id)
+        likes += pending_likes
+        dislikes += pending_dislikes
+        if not likes and not dislikes:
+            return user_statistics
+
+        merged_likes: int = user_statistics.likes + likes
+        merged_dislikes: int = user_statistics.dislikes + dislikes
+        return UserStatisticsModel(
+            id=user_statistics.id,
+            user_id=user_statistics.user_id,
+            likes=merged_likes,
+            dislikes=merged_dislikes,
+            score=merged_likes - merged_dislikes,
+            wilson_score=calculate_wilson_score_lower_bound(likes=merged_likes, dislikes=merged_dislikes)
+        )
+
+    async def flush(self) -> int:
+        """
+        Applies all pending increments with one batched UPDATE and returns number of updated users.
+        If UPDATE fails, increments are returned to buffer to be applied on the next flush.
+        """
+
+        if not self._pending or self._flushing:
+            return 0
+
+        self._flushing, self._pending = self._pending, {}
+        self._pending_votes = 0
+        flushed_users: int = len(self._flushing)
+        try:
+            async with self._session_factory() as session:
+                await session.execute(
+                    build_counters_update(),
+                    [
+                        {'voted_for_user_id': user_id, 'likes_increment': likes, 'dislikes_increment': dislikes}
+                        for user_id, (likes, dislikes) in self._flushing.items()
+                    ]
+                )
+                await session.commit()
+
+                # Cleared without awaiting anything after commit, so reads never merge increments,
+                # which committed counters already include:
+                self._flushing = {}
+        except BaseException:
+            # Increments are returned to buffer only, if they were not committed:
+            for user_id, (likes, dislikes) in self._flushing.items():
+                increments: List[int] = self._pending.setdefault(user_id, [0, 0])
+                increments[0] += likes
+                increments[1] += dislikes
+                self._pending_votes += likes + dislikes
+
+            self._flushing = {}
+            raise
+
+        self.flushes += 1
+        return flushed_users
+
+    async def _run(self) -> None:
+        assert self._flush_requested is not None
+        while True:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self._flush_interval_seconds)
+
+            self._flush_requested.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception(
+                    'Failed to flush %s buffered votes, they are kept for the next flush',
+                    self._pending_votes
+                )
+
+            if self._stopping:
+                return
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._flush_requested = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stops background task after the last flush, which drains the buffer.
+        """
+
+        if self._task is None:
+            return
+
+        assert self._flush_requested is not None
+        self._stopping = True
+        self._flush_requested.set()
+        await self._task
+        self._task = None
+        self._flush_requested = None
+        if self._pending_votes:
+            logger.error('%s buffered votes were not flushed on stop', self._pending_votes)
+
+
+vote_counters_buffer: Optional[VoteCountersBuffer] = (
+    VoteCountersBuffer() if votes_buffer_config.VOTES_BUFFER_ENABLED else None
+)
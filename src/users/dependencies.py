@@ -1,55 +1,96 @@
-from fastapi import Depends
-from typing import List
+from fastapi import Depends, Query
+from typing import Optional, Annotated, AsyncIterator, Sequence, Tuple, Any, List
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 
 from src.users.exceptions import (
-    UserNotFoundError,
     InvalidPasswordError,
     UserAlreadyExistsError,
-    UserAlreadyVotedError,
-    UserCanNotVoteForHimSelf
+    UserCanNotVoteForHimSelf,
+    InvalidCursorError
 )
 from src.users.models import UserModel, UserStatisticsModel
 from src.security.models import JWTDataModel
-from src.users.schemas import LoginUserScheme, RegisterUserScheme
-from src.users.utils import oauth2_scheme, verify_password, hash_password
+from src.users.schemas import (
+    LoginUserScheme,
+    RegisterUserScheme,
+    UserScheme,
+    UsersPageScheme,
+    LeaderboardEntryScheme,
+    LeaderboardPageScheme,
+    VotesBatchScheme,
+    VotesBatchResultScheme,
+    VoteResultScheme
+)
+from src.users.config import UsersPaginationConfig, ExportFormat, UsersLeaderboardConfig, LeaderboardOrder, VoteOutcome
+from src.users.utils import oauth2_scheme, verify_and_update_password, hash_password, encode_users_export
 from src.security.utils import parse_jwt_token
 from src.users.service import UsersService
+from src.core.database.dependencies import get_unit_of_work
+from src.core.database.unit_of_work import UnitOfWork
+from src.core.utils import encode_cursor, decode_cursor
+
+
+async def get_users_service(unit_of_work: UnitOfWork = Depends(get_unit_of_work)) -> UsersService:
+    """
+    Provides users service, bound to request-scoped unit of work, so all service calls during one request
+    share the same session and transaction.
+    """
+
+    return UsersService(unit_of_work=unit_of_work)
 
 
-async def register_user(user_data: RegisterUserScheme) -> UserModel:
-    users_service: UsersService = UsersService()
+async def register_user(
+        user_data: RegisterUserScheme,
+        users_service: UsersService = Depends(get_users_service)
+) -> UserModel:
+
     if await users_service.check_user_existence(email=user_data.email, username=user_data.username):
         raise UserAlreadyExistsError
 
     user: UserModel = UserModel(**user_data.model_dump())
     user.password = await hash_password(user.password)
-    return await users_service.register_user(user=user)
+
+    # Existence is checked on replica, if any, so user, registered concurrently or not replicated yet,
+    # is rejected by unique constraints:
+    try:
+        return await users_service.register_user(user=user)
+    except IntegrityError:
+        raise UserAlreadyExistsError
 
 
-async def verify_user_credentials(user_data: LoginUserScheme) -> UserModel:
-    users_service: UsersService = UsersService()
-    user: UserModel
-    if await users_service.check_user_existence(email=user_data.username):
-        user = await users_service.get_user_by_email(email=user_data.username)
-    elif await users_service.check_user_existence(username=user_data.username):
-        user = await users_service.get_user_by_username(username=user_data.username)
-    else:
-        raise UserNotFoundError
+async def verify_user_credentials(
+        user_data: LoginUserScheme,
+        users_service: UsersService = Depends(get_users_service)
+) -> UserModel:
 
-    if not await verify_password(plain_password=user_data.password, hashed_password=user.password):
+    # Username field of login form may contain either email or username:
+    user: UserModel = await users_service.get_user_by_login(login=user_data.username)
+    is_valid_password, updated_password_hash = await verify_and_update_password(
+        plain_password=user_data.password,
+        hashed_password=user.password
+    )
+    if not is_valid_password:
         raise InvalidPasswordError
 
+    # Transparently rehashing password, which was hashed with outdated scheme or cost:
+    if updated_password_hash is not None:
+        await users_service.update_user_password(user_id=user.id, password=updated_password_hash)
+        user.password = updated_password_hash
+
     return user
 
 
-async def authenticate_user(token: str = Depends(oauth2_scheme)) -> UserModel:
+async def authenticate_user(
+        token: str = Depends(oauth2_scheme),
+        users_service: UsersService = Depends(get_users_service)
+) -> UserModel:
     """
     Authenticates user according to provided JWT token, if token is valid and hadn't expired.
     """
 
     jwt_data: JWTDataModel = await parse_jwt_token(token=token)
-    users_service: UsersService = UsersService()
-    user: UserModel = await users_service.get_user_by_id(id=jwt_data.user_id)
+    user: UserModel = await users_service.get_cached_user_by_id(id=jwt_data.user_id)
     return user
 
 
@@ -57,20 +98,24 @@ async def get_my_account(user: UserModel = Depends(authenticate_user)) -> UserMo
     return user
 
 
-async def get_my_statistics(user: UserModel = Depends(authenticate_user)) -> UserStatisticsModel:
-    users_service: UsersService = UsersService()
+async def get_my_statistics(
+        user: UserModel = Depends(authenticate_user),
+        users_service: UsersService = Depends(get_users_service)
+) -> UserStatisticsModel:
+
     user_statistics: UserStatisticsModel = await users_service.get_user_statistics_by_user_id(user_id=user.id)
     return user_statistics
 
 
-async def like_user(user_id: int, user: UserModel = Depends(authenticate_user)) -> UserStatisticsModel:
+async def like_user(
+        user_id: int,
+        user: UserModel = Depends(authenticate_user),
+        users_service: UsersService = Depends(get_users_service)
+) -> UserStatisticsModel:
+
     if user.id == user_id:
         raise UserCanNotVoteForHimSelf
 
-    users_service: UsersService = UsersService()
-    if await users_service.check_if_user_already_voted(voting_user_id=user.id, voted_for_user_id=user_id):
-        raise UserAlreadyVotedError
-
     user_statistics: UserStatisticsModel = await users_service.like_user(
         voting_user_id=user.id,
         voted_for_user_id=user_id
@@ -79,14 +124,15 @@ async def like_user(user_id: int, user: UserModel = Depends(authenticate_user))
     return user_statistics
 
 
-async def dislike_user(user_id: int, user: UserModel = Depends(authenticate_user)) -> UserStatisticsModel:
+async def dislike_user(
+        user_id: int,
+        user: UserModel = Depends(authenticate_user),
+        users_service: UsersService = Depends(get_users_service)
+) -> UserStatisticsModel:
+
     if user.id == user_id:
         raise UserCanNotVoteForHimSelf
 
-    users_service: UsersService = UsersService()
-    if await users_service.check_if_user_already_voted(voting_user_id=user.id, voted_for_user_id=user_id):
-        raise UserAlreadyVotedError
-
     user_statistics: UserStatisticsModel = await users_service.dislike_user(
         voting_user_id=user.id,
         voted_for_user_id=user_id
@@ -95,7 +141,115 @@ async def dislike_user(user_id: int, user: UserModel = Depends(authenticate_user
     return user_statistics
 
 
-async def get_all_users() -> List[UserModel]:
-    users_service: UsersService = UsersService()
-    users: List[UserModel] = await users_service.get_all_users()
-    return users
+async def vote_for_users(
+        votes_batch: VotesBatchScheme,
+        user: UserModel = Depends(authenticate_user),
+        users_service: UsersService = Depends(get_users_service)
+) -> VotesBatchResultScheme:
+    """
+    Applies batch of likes and dislikes of current user in one transaction. Votes, which can not be applied,
+    do not fail the whole batch, but are reported with their outcome.
+    """
+
+    outcomes: List[VoteOutcome] = await users_service.vote_for_users(
+        voting_user_id=user.id,
+        votes=[(vote.user_id, vote.vote) for vote in votes_batch.votes]
+    )
+
+    return VotesBatchResultScheme(
+        results=[
+            VoteResultScheme(user_id=vote.user_id, vote=vote.vote, outcome=outcome)
+            for vote, outcome in zip(votes_batch.votes, outcomes)
+        ]
+    )
+
+
+async def get_all_users(
+        limit: Annotated[int, Query(ge=1, le=UsersPaginationConfig.MAX_PAGE_SIZE)] = (
+            UsersPaginationConfig.DEFAULT_PAGE_SIZE
+        ),
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        users_service: UsersService = Depends(get_users_service)
+) -> UsersPageScheme:
+    """
+    Returns page of users, which starts after provided cursor, and cursor for the next page.
+    """
+
+    after_id: Optional[int] = None
+    if cursor is not None:
+        try:
+            after_id = decode_cursor(cursor=cursor)[0]
+        except (ValueError, IndexError):
+            raise InvalidCursorError
+
+        if type(after_id) is not int:
+            raise InvalidCursorError
+
+    # Requesting one extra user to know, whether the next page exists, without additional query:
+    users: Sequence[Row] = await users_service.get_all_users(limit=limit + 1, after_id=after_id)
+    next_cursor: Optional[str] = None
+    if len(users) > limit:
+        users = users[:limit]
+        next_cursor = encode_cursor(users[-1].id)
+
+    return UsersPageScheme(
+        users=[UserScheme.model_validate(user) for user in users],
+        next_cursor=next_cursor,
+        total=await users_service.count_users() if include_total else None
+    )
+
+
+async def get_leaderboard(
+        order: LeaderboardOrder = LeaderboardOrder.LIKES,
+        limit: Annotated[int, Query(ge=1, le=UsersLeaderboardConfig.MAX_PAGE_SIZE)] = (
+            UsersLeaderboardConfig.DEFAULT_PAGE_SIZE
+        ),
+        cursor: Optional[str] = None,
+        users_service: UsersService = Depends(get_users_service)
+) -> LeaderboardPageScheme:
+    """
+    Returns page of users, ranked by provided score, which starts after provided cursor, and cursor for the next page.
+    Cursor holds score and user id of the last user on page, so it is valid only for the same ranking order.
+    """
+
+    after: Optional[Tuple[Any, int]] = None
+    if cursor is not None:
+        try:
+            values: List[Any] = decode_cursor(cursor=cursor)
+        except ValueError:
+            raise InvalidCursorError
+
+        score_types: Tuple[type, ...] = (int, float) if order == LeaderboardOrder.WILSON_SCORE else (int, )
+        if len(values) != 2 or type(values[0]) not in score_types or type(values[1]) is not int:
+            raise InvalidCursorError
+
+        after = (values[0], values[1])
+
+    # Requesting one extra user to know, whether the next page exists, without additional query:
+    users_statistics: Sequence[Row] = await users_service.get_leaderboard(order=order, limit=limit + 1, after=after)
+    next_cursor: Optional[str] = None
+    if len(users_statistics) > limit:
+        users_statistics = users_statistics[:limit]
+        next_cursor = encode_cursor(getattr(users_statistics[-1], order.value), users_statistics[-1].user_id)
+
+    return LeaderboardPageScheme(
+        users=[LeaderboardEntryScheme.model_validate(user_statistics) for user_statistics in users_statistics],
+        next_cursor=next_cursor
+    )
+
+
+async def export_users(
+        export_format: Annotated[ExportFormat, Query(alias='format')] = ExportFormat.NDJSON,
+        _user: UserModel = Depends(authenticate_user),
+        users_service: UsersService = Depends(get_users_service)
+) -> AsyncIterator[bytes]:
+    """
+    Returns chunks of all users with their statistics for streaming response.
+    Chunks are produced lazily, while response is being sent, and stream stops, when client disconnects.
+    """
+
+    return encode_users_export(
+        rows_batches=users_service.stream_users_with_statistics(),
+        export_format=export_format
+    )
@@ -50,3 +50,7 @@ class UserStatisticsNotFoundError(NotFoundError):
 
 class UserAlreadyVotedError(BadRequestError):
     DETAIL = ErrorDetails.USER_ALREADY_VOTED
+
+
+class InvalidCursorError(BadRequestError):
+    DETAIL = ErrorDetails.INVALID_CURSOR
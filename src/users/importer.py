@@ -0,0 +1,184 @@
+import csv
+import logging
+import time
+import orjson
+from dataclasses import dataclass, field
+from fastapi import HTTPException
+from pydantic import ValidationError
+from typing import Any, AsyncIterator, AsyncGenerator, Callable, Dict, List, Optional, Tuple
+
+from src.users.config import ExportFormat, users_import_config
+from src.users.schemas import RegisterUserScheme
+from src.users.service import UsersService
+from src.users.utils import hash_passwords
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass
+class UsersImportReport:
+    processed: int = 0
+    imported: int = 0
+    skipped: int = 0  # users, whose email or username is already taken
+    invalid: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)  # line number and error of first invalid records
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.processed / self.seconds if self.seconds else 0.0
+
+    def add_error(self, line: int, error: str) -> None:
+        self.invalid += 1
+        if len(self.errors) < users_import_config.USERS_IMPORT_MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line, 'error': error})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'processed': self.processed,
+            'imported': self.imported,
+            'skipped': self.skipped,
+            'invalid': self.invalid,
+            'errors': self.errors,
+            'seconds': self.seconds,
+            'rows_per_second': self.rows_per_second,
+        }
+
+
+async def read_lines(chunks: AsyncIterator[bytes]) -> AsyncGenerator[Tuple[int, str], None]:
+    """
+    Splits stream of chunks to lines, which are yielded with their numbers, starting from 1.
+    """
+
+    remainder: bytes = b''
+    line_number: int = 0
+    async for chunk in chunks:
+        lines: List[bytes] = (remainder + chunk).split(b'\n')
+        remainder = lines.pop()
+        for line in lines:
+            line_number += 1
+            yield line_number, line.decode(errors='replace').rstrip('\r')
+
+    if remainder:
+        yield line_number + 1, remainder.decode(errors='replace').rstrip('\r')
+
+
+async def parse_users_records(
+        chunks: AsyncIterator[bytes],
+        import_format: ExportFormat
+) -> AsyncGenerator[Tuple[int, Any], None]:
+    """
+    Parses stream of NDJSON objects or CSV rows with header to records, which are yielded with their line numbers.
+    Blank lines are skipped. Malformed line is yielded as ValueError instead of record.
+    """
+
+    fields: Optional[List[str]] = None
+    async for line_number, line in read_lines(chunks=chunks):
+        if not line.strip():
+            continue
+
+        if import_format == ExportFormat.NDJSON:
+            try:
+                yield line_number, orjson.loads(line)
+            except orjson.JSONDecodeError as error:
+                yield line_number, ValueError(f'Invalid JSON: {error}')
+
+            continue
+
+        values: List[str] = next(csv.reader([line]))
+        if fields is None:
+            fields = values
+        elif len(values) != len(fields):
+            yield line_number, ValueError(f'Expected {len(fields)} values, got {len(values)}')
+        else:
+            yield line_number, dict(zip(fields, values))
+
+
+def validate_user_record(record: Any) -> Dict[str, str]:
+    """
+    Validates record the same way as user registration does and returns user columns with plain password.
+    Raises ValueError, if record is invalid.
+    """
+
+    if isinstance(record, ValueError):
+        raise record
+
+    if not isinstance(record, dict):
+        raise ValueError('User record must be an object')
+
+    try:
+        return RegisterUserScheme(**record).model_dump(include={'email', 'username', 'password'})
+    except ValidationError as error:
+        raise ValueError('; '.join(f'{".".join(map(str, item["loc"]))}: {item["msg"]}' for item in error.errors()))
+    except HTTPException as error:
+        raise ValueError(error.detail)
+
+
+async def import_users(
+        chunks: AsyncIterator[bytes],
+        import_format: ExportFormat = ExportFormat.NDJSON,
+        users_service: Optional[UsersService] = None,
+        batch_size: int = users_import_config.USERS_IMPORT_BATCH_SIZE,
+        on_progress: Optional[Callable[[UsersImportReport], None]] = None
+) -> UsersImportReport:
+    """
+    Imports users from stream of NDJSON or CSV records in batches: passwords of batch are hashed in parallel
+    on process pool, and batch is inserted in its own transaction, so already imported batches are kept,
+    if import is interrupted. Progress is reported after every batch.
+    """
+
+    users_service = users_service or UsersService()
+    report: UsersImportReport = UsersImportReport()
+    started_at: float = time.perf_counter()
+    batch: List[Dict[str, str]] = []
+
+    async def import_batch() -> None:
+        # Users with taken emails or usernames are skipped before hashing, which is the most expensive part
+        # of import, so repeated import of the same file is fast. Concurrent registrations are still skipped
+        # on insert:
+        taken_emails, taken_usernames = await users_service.get_taken_emails_and_usernames(
+            emails=[user['email'] for user in batch],
+            usernames=[user['username'] for user in batch]
+        )
+        users: List[Dict[str, str]] = []
+        for user in batch:
+            if user['email'] not in taken_emails and user['username'] not in taken_usernames:
+                users.append(user)
+                taken_emails.add(user['email'])
+                taken_usernames.add(user['username'])
+
+        password_hashes: List[str] = await hash_passwords([user['password'] for user in users])
+        for user, password_hash in zip(users, password_hashes):
+            user['password'] = password_hash
+
+        imported_count: int = len(await users_service.import_users(users=users)) if users else 0
+        report.imported += imported_count
+        report.skipped += len(batch) - imported_count
+        report.seconds = time.perf_counter() - started_at
+        batch.clear()
+
+        logger.info(
+            'Imported %s of %s processed users, %.0f rows/s',
+            report.imported,
+            report.processed,
+            report.rows_per_second
+        )
+        if on_progress is not None:
+            on_progress(report)
+
+    async for line_number, record in parse_users_records(chunks=chunks, import_format=import_format):
+        report.processed += 1
+        try:
+            batch.append(validate_user_record(record))
+        except ValueError as error:
+            report.add_error(line=line_number, error=str(error))
+
+        if len(batch) >= batch_size:
+            await import_batch()
+
+    if batch:
+        await import_batch()
+
+    report.seconds = time.perf_counter() - started_at
+    return report
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import mapped_column, Mapped
-from sqlalchemy import String, Integer, ForeignKey
+from sqlalchemy import String, Integer, Float, ForeignKey, Index
 
 from src.core.database.base import Base
 
@@ -15,26 +15,46 @@ class UserModel(Base):
 
 class UserStatisticsModel(Base):
     __tablename__ = 'users_statistics'
+    __table_args__ = (
+        # Leaderboard pages are read by scanning these indexes backwards, starting from keyset cursor:
+        Index('ix_users_statistics_likes_user_id', 'likes', 'user_id'),
+        Index('ix_users_statistics_score_user_id', 'score', 'user_id'),
+        Index('ix_users_statistics_wilson_score_user_id', 'wilson_score', 'user_id'),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey('users.id', onupdate='CASCADE', ondelete='CASCADE'),
-        nullable=False
+        nullable=False,
+        unique=True,
+        index=True
     )
     likes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     dislikes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
+    # Ranking scores are stored and updated together with votes counters, so leaderboard is read by index.
+    # Score is net number of likes, Wilson score is lower bound of confidence interval of likes proportion:
+    score: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default='0')
+    wilson_score: Mapped[float] = mapped_column(Float, nullable=False, default=0, server_default='0')
+
 
 class UserVoteModel(Base):
     __tablename__ = 'users_votes'
+    __table_args__ = (
+        # Each user can vote for another user only once:
+        Index('ix_users_votes_voting_user_id_voted_for_user_id', 'voting_user_id', 'voted_for_user_id', unique=True),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     voted_for_user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey('users.id', onupdate='CASCADE', ondelete='CASCADE'),
-        nullable=False
+        nullable=False,
+        index=True
     )
+
+    # Lookups by voting_user_id are covered by unique index above, where it is the leading column:
     voting_user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey('users.id', onupdate='CASCADE', ondelete='CASCADE'),
@@ -1,10 +1,24 @@
-from typing import MutableSequence
 from datetime import datetime, timezone, timedelta
-from fastapi import APIRouter, Depends, status
-from fastapi.responses import Response, JSONResponse
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import Response, ORJSONResponse, StreamingResponse
+from typing import Annotated, AsyncIterator
 
 from src.users.models import UserModel, UserStatisticsModel
-from src.users.config import RouterConfig, URLPathsConfig, URLNamesConfig, cookies_config
+from src.users.config import (
+    RouterConfig,
+    URLPathsConfig,
+    URLNamesConfig,
+    cookies_config,
+    ExportFormat,
+    UsersExportConfig
+)
+from src.users.schemas import (
+    UserScheme,
+    UserStatisticsScheme,
+    UsersPageScheme,
+    LeaderboardPageScheme,
+    VotesBatchResultScheme
+)
 from src.security.models import JWTDataModel
 from src.security.utils import create_jwt_token
 from src.users.dependencies import (
@@ -12,9 +26,12 @@ from src.users.dependencies import (
     register_user,
     get_my_account as get_my_account_dependency,
     get_all_users as get_all_users_dependency,
+    get_leaderboard as get_leaderboard_dependency,
     get_my_statistics as get_my_statistics_dependency,
     like_user as like_user_dependency,
-    dislike_user as dislike_user_dependency
+    dislike_user as dislike_user_dependency,
+    vote_for_users as vote_for_users_dependency,
+    export_users as export_users_dependency
 )
 
 
@@ -26,10 +43,10 @@ router = APIRouter(
 
 @router.post(
     path=URLPathsConfig.REGISTER,
-    response_class=JSONResponse,
+    response_class=ORJSONResponse,
     name=URLNamesConfig.REGISTER,
     status_code=status.HTTP_201_CREATED,
-    # response_model=UserModel
+    response_model=UserScheme
 )
 async def register(user: UserModel = Depends(register_user)):
     return user
@@ -75,8 +92,8 @@ async def logout():
 
 @router.get(
     path=URLPathsConfig.ME,
-    response_class=JSONResponse,
-    # response_model=UserModel,
+    response_class=ORJSONResponse,
+    response_model=UserScheme,
     name=URLNamesConfig.ME,
     status_code=status.HTTP_200_OK
 )
@@ -86,19 +103,30 @@ async def get_my_account(user: UserModel = Depends(get_my_account_dependency)):
 
 @router.get(
     path=URLPathsConfig.ALL,
-    response_class=JSONResponse,
-    # response_model=MutableSequence[UserModel],
+    response_class=ORJSONResponse,
+    response_model=UsersPageScheme,
     name=URLNamesConfig.ALL,
     status_code=status.HTTP_200_OK
 )
-async def get_all_users(users: MutableSequence[UserModel] = Depends(get_all_users_dependency)):
-    return users
+async def get_all_users(users_page: UsersPageScheme = Depends(get_all_users_dependency)):
+    return users_page
+
+
+@router.get(
+    path=URLPathsConfig.LEADERBOARD,
+    response_class=ORJSONResponse,
+    response_model=LeaderboardPageScheme,
+    name=URLNamesConfig.LEADERBOARD,
+    status_code=status.HTTP_200_OK
+)
+async def get_leaderboard(leaderboard_page: LeaderboardPageScheme = Depends(get_leaderboard_dependency)):
+    return leaderboard_page
 
 
 @router.get(
     path=URLPathsConfig.MY_STATS,
-    response_class=JSONResponse,
-    # response_model=UserStatisticsModel,
+    response_class=ORJSONResponse,
+    response_model=UserStatisticsScheme,
     name=URLNamesConfig.MY_STATS,
     status_code=status.HTTP_200_OK
 )
@@ -108,8 +136,8 @@ async def get_my_statistics(statistics: UserStatisticsModel = Depends(get_my_sta
 
 @router.patch(
     path=URLPathsConfig.LIKE_USER,
-    response_class=JSONResponse,
-    # response_model=UserStatisticsModel,
+    response_class=ORJSONResponse,
+    response_model=UserStatisticsScheme,
     name=URLNamesConfig.LIKE_USER,
     status_code=status.HTTP_200_OK
 )
@@ -119,10 +147,38 @@ async def like_user(statistics: UserStatisticsModel = Depends(like_user_dependen
 
 @router.patch(
     path=URLPathsConfig.DISLIKE_USER,
-    response_class=JSONResponse,
-    # response_model=UserStatisticsModel,
+    response_class=ORJSONResponse,
+    response_model=UserStatisticsScheme,
     name=URLNamesConfig.DISLIKE_USER,
     status_code=status.HTTP_200_OK
 )
 async def dislike_user(statistics: UserStatisticsModel = Depends(dislike_user_dependency)):
     return statistics
+
+
+@router.post(
+    path=URLPathsConfig.VOTES,
+    response_class=ORJSONResponse,
+    response_model=VotesBatchResultScheme,
+    name=URLNamesConfig.VOTES,
+    status_code=status.HTTP_200_OK
+)
+async def vote_for_users(votes_results: VotesBatchResultScheme = Depends(vote_for_users_dependency)):
+    return votes_results
+
+
+@router.get(
+    path=URLPathsConfig.EXPORT,
+    response_class=StreamingResponse,
+    name=URLNamesConfig.EXPORT,
+    status_code=status.HTTP_200_OK
+)
+async def export_users(
+        export_format: Annotated[ExportFormat, Query(alias='format')] = ExportFormat.NDJSON,
+        chunks: AsyncIterator[bytes] = Depends(export_users_dependency)
+):
+    media_type: str = (
+        UsersExportConfig.CSV_MEDIA_TYPE if export_format == ExportFormat.CSV else UsersExportConfig.NDJSON_MEDIA_TYPE
+    )
+
+    return StreamingResponse(content=chunks, media_type=media_type)
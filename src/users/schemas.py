@@ -1,6 +1,7 @@
-from pydantic import BaseModel, EmailStr, field_validator
+from pydantic import BaseModel, EmailStr, Field, field_validator, ConfigDict
+from typing import List, Optional
 
-from src.users.config import UserValidationConfig
+from src.users.config import UserValidationConfig, UsersVotesConfig, VoteType, VoteOutcome
 from src.users.exceptions import PasswordValidationError, UsernameValidationError
 
 
@@ -27,3 +28,68 @@ class LoginUserScheme(BaseModel):
 
 class RegisterUserScheme(LoginUserScheme):
     email: EmailStr
+
+
+class UserScheme(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    email: str
+    username: str
+
+
+class UserStatisticsScheme(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_id: int
+    likes: int
+    dislikes: int
+    score: int
+    wilson_score: float
+
+
+class UsersPageScheme(BaseModel):
+    users: List[UserScheme]
+
+    # Cursor for the next page. Absent, if current page is the last one:
+    next_cursor: Optional[str] = None
+
+    # Total number of users, provided only on demand:
+    total: Optional[int] = None
+
+
+class LeaderboardEntryScheme(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    user_id: int
+    username: str
+    likes: int
+    dislikes: int
+    score: int
+    wilson_score: float
+
+
+class LeaderboardPageScheme(BaseModel):
+    users: List[LeaderboardEntryScheme]
+
+    # Cursor for the next page. Absent, if current page is the last one:
+    next_cursor: Optional[str] = None
+
+
+class VoteScheme(BaseModel):
+    user_id: int
+    vote: VoteType
+
+
+class VotesBatchScheme(BaseModel):
+    votes: List[VoteScheme] = Field(min_length=1, max_length=UsersVotesConfig.BATCH_MAX_SIZE)
+
+
+class VoteResultScheme(VoteScheme):
+    outcome: VoteOutcome
+
+
+class VotesBatchResultScheme(BaseModel):
+    # Results are in the same order as votes in request:
+    results: List[VoteResultScheme]
@@ -1,26 +1,253 @@
-from typing import Optional, List, Sequence
-from sqlalchemy.ext.asyncio import async_sessionmaker
-from sqlalchemy import select, update, insert
+from contextlib import asynccontextmanager
+from typing import (
+    Optional,
+    List,
+    Sequence,
+    AsyncGenerator,
+    AsyncContextManager,
+    Dict,
+    Any,
+    Tuple,
+    Set,
+    Callable,
+    Union,
+    cast
+)
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession, AsyncResult
+from sqlalchemy import (
+    event,
+    select,
+    update,
+    insert,
+    or_,
+    case,
+    exists,
+    func,
+    tuple_,
+    literal,
+    ColumnElement,
+    Select,
+    Row,
+    CursorResult
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import InstrumentedAttribute, Session
 
+from src.users.config import (
+    UsersPaginationConfig,
+    UsersExportConfig,
+    UsersLeaderboardConfig,
+    LeaderboardOrder,
+    VoteType,
+    VoteOutcome,
+    users_cache_config
+)
 from src.users.constants import ErrorDetails
-from src.users.exceptions import UserNotFoundError, UserStatisticsNotFoundError
+from src.users.exceptions import UserNotFoundError, UserStatisticsNotFoundError, UserAlreadyVotedError
 from src.users.models import UserModel, UserStatisticsModel, UserVoteModel
-from src.core.database.connection import session_factory as default_session_factory
+from src.users.utils import wilson_score_lower_bound
+from src.users.counters import VoteCountersBuffer, vote_counters_buffer as default_vote_counters_buffer
+from src.core.database.connection import (
+    session_factory as default_session_factory,
+    replica_router as default_replica_router
+)
+from src.core.database.replicas import ReplicaRouter
+from src.core.database.unit_of_work import UnitOfWork
+from src.core.cache import TTLCache
+
+
+USERS_COUNT_CACHE_KEY: str = 'users_count'
+users_count_cache: TTLCache[str, int] = TTLCache(
+    max_size=1,
+    ttl=UsersPaginationConfig.TOTAL_COUNT_CACHE_TTL_SECONDS
+)
+
+# Users are cached as column values snapshots, because ORM instances are bound to sessions, they were loaded in:
+users_identity_cache: TTLCache[int, Dict[str, Any]] = TTLCache(
+    max_size=users_cache_config.USERS_IDENTITY_CACHE_MAX_SIZE,
+    ttl=users_cache_config.USERS_IDENTITY_CACHE_TTL_SECONDS,
+    name='users_identity'
+)
+
+# Dialect-specific INSERT constructs, which support skipping rows, conflicting with unique constraints:
+InsertIgnoringConflicts = Callable[..., Union[postgresql.Insert, sqlite.Insert]]
+INSERT_IGNORING_CONFLICTS: Dict[str, InsertIgnoringConflicts] = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+
+
+class UnsupportedDialectError(RuntimeError):
+    pass
+
+
+def get_insert_ignoring_conflicts(dialect_name: str) -> InsertIgnoringConflicts:
+    """
+    Returns INSERT construct of provided dialect, which supports skipping conflicting rows.
+    Is called on startup too, so application doesn't start on unsupported database instead of failing requests.
+    """
+
+    insert_ignoring_conflicts: Optional[InsertIgnoringConflicts] = INSERT_IGNORING_CONFLICTS.get(dialect_name)
+    if insert_ignoring_conflicts is None:
+        raise UnsupportedDialectError(
+            f'Unsupported database dialect "{dialect_name}", supported ones are: {", ".join(INSERT_IGNORING_CONFLICTS)}'
+        )
+
+    return insert_ignoring_conflicts
+
+
+# Session info key of cache entries, which are invalidated only after session transaction is committed:
+SESSION_CACHE_INVALIDATIONS_KEY: str = 'cache_invalidations'
+
+
+def _on_commit_invalidate_caches(session: Session) -> None:
+    cache: TTLCache
+    for cache, key in session.info.pop(SESSION_CACHE_INVALIDATIONS_KEY, []):
+        cache.invalidate(key)
+
+
+def _on_rollback_keep_caches(session: Session) -> None:
+    session.info.pop(SESSION_CACHE_INVALIDATIONS_KEY, None)
+
+
+def invalidate_on_commit(session: AsyncSession, cache: TTLCache, key: Any) -> None:
+    """
+    Invalidates cache entry, once transaction of provided session is committed. If entry was invalidated
+    before commit, concurrent read could load data without changes of the transaction and cache it again.
+    """
+
+    session.info.setdefault(SESSION_CACHE_INVALIDATIONS_KEY, []).append((cache, key))
+    if not event.contains(session.sync_session, 'after_commit', _on_commit_invalidate_caches):
+        event.listen(session.sync_session, 'after_commit', _on_commit_invalidate_caches)
+        event.listen(session.sync_session, 'after_rollback', _on_rollback_keep_caches)
+
+
+def get_vote_counters_values(vote: VoteType) -> Dict[str, ColumnElement]:
+    """
+    Returns values of UPDATE statement, which applies one vote to user statistics counters and scores.
+    Scores are computed from updated counters rather than incremented, so they can't drift from counters.
+    """
+
+    likes: ColumnElement[int] = UserStatisticsModel.likes + (1 if vote == VoteType.LIKE else 0)
+    dislikes: ColumnElement[int] = UserStatisticsModel.dislikes + (1 if vote == VoteType.DISLIKE else 0)
+    return {
+        'likes': likes,
+        'dislikes': dislikes,
+        'score': likes - dislikes,
+        'wilson_score': wilson_score_lower_bound(likes, dislikes),
+    }
 
 
 class UsersService:
 
-    def __init__(self, session_factory: async_sessionmaker = default_session_factory) -> None:
+    def __init__(
+            self,
+            session_factory: async_sessionmaker = default_session_factory,
+            unit_of_work: Optional[UnitOfWork] = None,
+            replica_router: ReplicaRouter = default_replica_router,
+            vote_counters_buffer: Optional[VoteCountersBuffer] = default_vote_counters_buffer
+    ) -> None:
+
         self._session_factory: async_sessionmaker = session_factory
+        self._unit_of_work: Optional[UnitOfWork] = unit_of_work
+        self._replica_router: ReplicaRouter = replica_router
+        self._vote_counters_buffer: Optional[VoteCountersBuffer] = vote_counters_buffer
+
+    def _use_replica(self) -> bool:
+        """
+        Replica is used for reads, unless unit of work has already written something to primary database.
+        """
+
+        if not self._replica_router.has_replicas:
+            return False
+
+        return self._unit_of_work is None or not self._unit_of_work.pinned_to_primary
+
+    @asynccontextmanager
+    async def _session(self, read_only: bool = False) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Yields session of the unit of work, service is bound to, which is committed once at the end of its scope.
+        In other case every service call is performed in its own unit of work.
+        Read-only calls are performed on read replica, if replicas are configured.
+        """
+
+        if read_only and self._use_replica():
+            async with self._replica_router.session() as session:
+                yield session
+
+            return
+
+        if self._unit_of_work is not None:
+            yield self._unit_of_work.session
+            return
+
+        async with UnitOfWork(session_factory=self._session_factory) as unit_of_work:
+            yield unit_of_work.session
 
     async def register_user(self, user: UserModel) -> UserModel:
-        async with self._session_factory() as session:
+        async with self._session() as session:
             session.add(user)
             await session.flush()
             session.add(UserStatisticsModel(user_id=user.id))
-            await session.commit()
+            await session.flush()
+            invalidate_on_commit(session=session, cache=users_count_cache, key=USERS_COUNT_CACHE_KEY)
             return user
 
+    async def import_users(self, users: Sequence[Dict[str, str]]) -> List[int]:
+        """
+        Inserts batch of users with already hashed passwords and their statistics with one multi-row INSERT
+        per table. Users, whose email or username is already taken, are skipped.
+
+        Returns ids of inserted users.
+        """
+
+        async with self._session() as session:
+            insert_ignoring_conflicts: InsertIgnoringConflicts = get_insert_ignoring_conflicts(
+                dialect_name=session.get_bind().dialect.name
+            )
+            user_ids: List[int] = list(
+                (
+                    await session.scalars(
+                        insert_ignoring_conflicts(
+                            UserModel
+                        ).values(
+                            list(users)
+                        ).on_conflict_do_nothing().returning(
+                            UserModel.id
+                        )
+                    )
+                ).all()
+            )
+            if user_ids:
+                await session.execute(insert(UserStatisticsModel), [{'user_id': user_id} for user_id in user_ids])
+                invalidate_on_commit(session=session, cache=users_count_cache, key=USERS_COUNT_CACHE_KEY)
+
+            return user_ids
+
+    async def get_taken_emails_and_usernames(
+            self,
+            emails: Sequence[str],
+            usernames: Sequence[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        """
+        Returns emails and usernames from provided ones, which are already taken by existing users.
+        """
+
+        async with self._session() as session:
+            rows: Sequence[Row] = (
+                await session.execute(
+                    select(
+                        UserModel.email,
+                        UserModel.username
+                    ).where(
+                        or_(UserModel.email.in_(emails), UserModel.username.in_(usernames))
+                    )
+                )
+            ).all()
+
+        return {row.email for row in rows}, {row.username for row in rows}
+
     async def check_user_existence(
             self,
             id: Optional[int] = None,
@@ -31,27 +258,24 @@ class UsersService:
         if not (id or email or username):
             raise ValueError(ErrorDetails.USER_ATTRIBUTE_REQUIRED)
 
-        async with self._session_factory() as session:
-            user: Optional[UserModel]  # declaring here for mypy passing
-            if id:
-                user = (await session.scalars(select(UserModel).filter_by(id=id))).one_or_none()
-                if user:
-                    return True
-
-            if email:
-                user = (await session.scalars(select(UserModel).filter_by(email=email))).one_or_none()
-                if user:
-                    return True
-
-            if username:
-                user = (await session.scalars(select(UserModel).filter_by(username=username))).one_or_none()
-                if user:
-                    return True
+        conditions: List[ColumnElement[bool]] = []
+        if id:
+            conditions.append(UserModel.id == id)
 
-        return False
+        if email:
+            conditions.append(UserModel.email == email)
+
+        if username:
+            conditions.append(UserModel.username == username)
+
+        # Only boolean is selected, so no ORM objects are loaded to identity map. Check is read-only, so it doesn't
+        # hold connection of primary database, while password is hashed before registration:
+        async with self._session(read_only=True) as session:
+            user_exists: Optional[bool] = await session.scalar(select(exists().where(or_(*conditions))))
+            return bool(user_exists)
 
     async def get_user_by_email(self, email: str) -> UserModel:
-        async with self._session_factory() as session:
+        async with self._session(read_only=True) as session:
             user: Optional[UserModel] = (await session.scalars(select(UserModel).filter_by(email=email))).one_or_none()
             if not user:
                 raise UserNotFoundError
@@ -59,7 +283,7 @@ class UsersService:
             return user
 
     async def get_user_by_username(self, username: str) -> UserModel:
-        async with self._session_factory() as session:
+        async with self._session(read_only=True) as session:
             user: Optional[UserModel] = (
                 await session.scalars(
                     select(
@@ -74,22 +298,150 @@ class UsersService:
 
             return user
 
+    async def get_user_by_login(self, login: str) -> UserModel:
+        """
+        Resolves user by login identifier, which can be either email or username, using single query.
+        If identifier matches email of one user and username of another, user with matched email is returned.
+        """
+
+        async with self._session(read_only=True) as session:
+            user: Optional[UserModel] = (
+                await session.scalars(
+                    select(
+                        UserModel
+                    ).where(
+                        or_(UserModel.email == login, UserModel.username == login)
+                    ).order_by(
+                        case((UserModel.email == login, 0), else_=1)
+                    ).limit(
+                        1
+                    )
+                )
+            ).one_or_none()
+            if not user:
+                raise UserNotFoundError
+
+            return user
+
     async def get_user_by_id(self, id: int) -> UserModel:
-        async with self._session_factory() as session:
+        async with self._session(read_only=True) as session:
             user: Optional[UserModel] = (await session.scalars(select(UserModel).filter_by(id=id))).one_or_none()
             if not user:
                 raise UserNotFoundError
 
             return user
 
-    async def get_all_users(self) -> List[UserModel]:
-        async with self._session_factory() as session:
-            users: Sequence[UserModel] = (await session.scalars(select(UserModel))).all()
-            assert isinstance(users, list)
+    async def get_cached_user_by_id(self, id: int) -> UserModel:
+        """
+        Returns user from identity cache, if present. Otherwise, loads user from database and caches it.
+        Returned user is detached from any session and should be used for reading only.
+        """
+
+        user_snapshot: Optional[Dict[str, Any]] = users_identity_cache.get(id)
+        if user_snapshot is None:
+            user: UserModel = await self.get_user_by_id(id=id)
+            user_snapshot = {column.key: getattr(user, column.key) for column in UserModel.__table__.columns}
+            users_identity_cache.set(id, user_snapshot)
+
+        return UserModel(**user_snapshot)
+
+    async def update_user_password(self, user_id: int, password: str) -> None:
+        async with self._session() as session:
+            invalidate_on_commit(session=session, cache=users_identity_cache, key=user_id)
+            await session.execute(
+                update(
+                    UserModel
+                ).filter_by(
+                    id=user_id
+                ).values(
+                    password=password
+                )
+            )
+
+    async def get_all_users(
+            self,
+            limit: int = UsersPaginationConfig.DEFAULT_PAGE_SIZE,
+            after_id: Optional[int] = None
+    ) -> Sequence[Row]:
+        """
+        Returns page of users, ordered by id, using keyset pagination: page starts after user with provided id,
+        so database seeks by primary key instead of scanning skipped rows.
+
+        Only public columns are selected as plain rows, because page is serialized as is and ORM instances
+        are not needed.
+        """
+
+        query: Select = select(
+            UserModel.id,
+            UserModel.email,
+            UserModel.username
+        ).order_by(
+            UserModel.id
+        ).limit(
+            limit
+        )
+        if after_id is not None:
+            query = query.where(UserModel.id > after_id)
+
+        async with self._session(read_only=True) as session:
+            users: Sequence[Row] = (await session.execute(query)).all()
             return users
 
+    async def count_users(self) -> int:
+        """
+        Returns total number of users. Result is cached for a short time, because counting scans the whole table.
+        """
+
+        users_count: Optional[int] = users_count_cache.get(USERS_COUNT_CACHE_KEY)
+        if users_count is not None:
+            return users_count
+
+        # Counting is read-only and scans the whole table, so it shouldn't hold connection of primary database:
+        async with self._session(read_only=True) as session:
+            users_count = await session.scalar(select(func.count()).select_from(UserModel))
+            assert users_count is not None
+            users_count_cache.set(USERS_COUNT_CACHE_KEY, users_count)
+            return users_count
+
+    async def stream_users_with_statistics(
+            self,
+            batch_size: int = UsersExportConfig.BATCH_SIZE
+    ) -> AsyncGenerator[Sequence[Row], None]:
+        """
+        Streams all users with their statistics counters in batches, using server-side cursor,
+        so memory usage does not depend on table size.
+
+        Stream is consumed after request dependencies are finished, so it always uses its own session
+        instead of the unit of work, service might be bound to. Stream reads the whole table, so it is performed
+        on read replica, if replicas are configured.
+        """
+
+        session_context: AsyncContextManager[AsyncSession] = (
+            self._replica_router.session() if self._replica_router.has_replicas else self._session_factory()
+        )
+        async with session_context as session:
+            result: AsyncResult = await session.stream(
+                select(
+                    UserModel.id,
+                    UserModel.email,
+                    UserModel.username,
+                    func.coalesce(UserStatisticsModel.likes, 0).label('likes'),
+                    func.coalesce(UserStatisticsModel.dislikes, 0).label('dislikes')
+                ).outerjoin(
+                    UserStatisticsModel,
+                    UserStatisticsModel.user_id == UserModel.id
+                ).order_by(
+                    UserModel.id
+                ).execution_options(
+                    yield_per=batch_size
+                )
+            )
+
+            async for rows in result.partitions(batch_size):
+                yield rows
+
     async def get_user_statistics_by_user_id(self, user_id: int) -> UserStatisticsModel:
-        async with self._session_factory() as session:
+        async with self._session(read_only=True) as session:
             user_statistics: Optional[UserStatisticsModel] = (
                 await session.scalars(
                     select(
@@ -102,10 +454,96 @@ class UsersService:
             if not user_statistics:
                 raise UserStatisticsNotFoundError
 
+            if self._vote_counters_buffer is not None:
+                return self._vote_counters_buffer.merge(user_statistics=user_statistics)
+
             return user_statistics
 
-    async def like_user(self, voting_user_id: int, voted_for_user_id: int) -> UserStatisticsModel:
+    async def get_leaderboard(
+            self,
+            order: LeaderboardOrder = LeaderboardOrder.LIKES,
+            limit: int = UsersLeaderboardConfig.DEFAULT_PAGE_SIZE,
+            after: Optional[Tuple[Any, int]] = None
+    ) -> Sequence[Row]:
+        """
+        Returns page of users statistics, ordered by provided stored score descending, using keyset pagination:
+        page starts after provided pair of score and user id. Users with equal scores are ordered by user id
+        descending, so page is read by scanning composite index of score and user id backwards.
+        """
+
+        order_column: InstrumentedAttribute = getattr(UserStatisticsModel, order.value)
+        query: Select = select(
+            UserStatisticsModel.user_id,
+            UserModel.username,
+            UserStatisticsModel.likes,
+            UserStatisticsModel.dislikes,
+            UserStatisticsModel.score,
+            UserStatisticsModel.wilson_score
+        ).join(
+            UserModel,
+            UserModel.id == UserStatisticsModel.user_id
+        ).order_by(
+            order_column.desc(),
+            UserStatisticsModel.user_id.desc()
+        ).limit(
+            limit
+        )
+        if after is not None:
+            after_score, after_user_id = after
+            query = query.where(
+                tuple_(order_column, UserStatisticsModel.user_id) < tuple_(literal(after_score), literal(after_user_id))
+            )
+
+        async with self._session(read_only=True) as session:
+            users_statistics: Sequence[Row] = (await session.execute(query)).all()
+            return users_statistics
+
+    async def recompute_users_scores(self, batch_size: int = UsersLeaderboardConfig.RECOMPUTE_BATCH_SIZE) -> int:
+        """
+        Recomputes stored scores from votes counters, for example to backfill them after scores were introduced
+        or scoring formula was changed. Scores are computed by database for whole ranges of statistics ids at once,
+        each range in its own transaction, so writers are not blocked for the whole recompute.
+
+        Returns number of updated statistics.
+        """
+
         async with self._session_factory() as session:
+            max_id: Optional[int] = await session.scalar(select(func.max(UserStatisticsModel.id)))
+
+        updated_count: int = 0
+        for start_id in range(0, max_id or 0, batch_size):
+            async with UnitOfWork(session_factory=self._session_factory) as unit_of_work:
+                result: CursorResult = cast(
+                    CursorResult,
+                    await unit_of_work.session.execute(
+                        update(
+                            UserStatisticsModel
+                        ).where(
+                            UserStatisticsModel.id > start_id,
+                            UserStatisticsModel.id <= start_id + batch_size
+                        ).values(
+                            score=UserStatisticsModel.likes - UserStatisticsModel.dislikes,
+                            wilson_score=wilson_score_lower_bound(
+                                UserStatisticsModel.likes,
+                                UserStatisticsModel.dislikes
+                            )
+                        ).execution_options(
+                            synchronize_session=False
+                        )
+                    )
+                )
+                updated_count += result.rowcount
+
+        return updated_count
+
+    async def _buffer_vote(self, voting_user_id: int, voted_for_user_id: int, vote: VoteType) -> UserStatisticsModel:
+        """
+        Inserts vote and leaves increment of counters to votes counters buffer, which applies it after commit.
+        Returns user statistics with pending increments, including this vote, merged in.
+        """
+
+        assert self._vote_counters_buffer is not None
+        async with self._session() as session:
             user_statistics: Optional[UserStatisticsModel] = (
                 await session.scalars(
                     select(
@@ -118,66 +556,193 @@ class UsersService:
             if not user_statistics:
                 raise UserStatisticsNotFoundError
 
-            await session.execute(
-                update(
-                    UserStatisticsModel
-                ).filter_by(
-                    id=user_statistics.id
-                ).values(
-                    likes=user_statistics.likes + 1
+            try:
+                await session.execute(
+                    insert(
+                        UserVoteModel
+                    ).values(
+                        voting_user_id=voting_user_id,
+                        voted_for_user_id=voted_for_user_id
+                    )
                 )
+            except IntegrityError:
+                raise UserAlreadyVotedError
+
+            self._vote_counters_buffer.add_on_commit(session=session, user_id=voted_for_user_id, vote=vote)
+            return self._vote_counters_buffer.merge(
+                user_statistics=user_statistics,
+                likes=int(vote == VoteType.LIKE),
+                dislikes=int(vote == VoteType.DISLIKE)
             )
 
-            await session.execute(
-                insert(
-                    UserVoteModel
-                ).values(
-                    voting_user_id=voting_user_id,
-                    voted_for_user_id=voted_for_user_id
-                )
+    async def like_user(self, voting_user_id: int, voted_for_user_id: int) -> UserStatisticsModel:
+        if self._vote_counters_buffer is not None:
+            return await self._buffer_vote(
+                voting_user_id=voting_user_id,
+                voted_for_user_id=voted_for_user_id,
+                vote=VoteType.LIKE
             )
 
-            await session.commit()
+        async with self._session() as session:
+            user_statistics: Optional[UserStatisticsModel] = (
+                await session.scalars(
+                    update(
+                        UserStatisticsModel
+                    ).filter_by(
+                        user_id=voted_for_user_id
+                    ).values(
+                        **get_vote_counters_values(vote=VoteType.LIKE)
+                    ).returning(
+                        UserStatisticsModel
+                    )
+                )
+            ).one_or_none()
+            if not user_statistics:
+                raise UserStatisticsNotFoundError
+
+            # Unique index on votes rejects repeated vote and increment above is rolled back with the transaction:
+            try:
+                await session.execute(
+                    insert(
+                        UserVoteModel
+                    ).values(
+                        voting_user_id=voting_user_id,
+                        voted_for_user_id=voted_for_user_id
+                    )
+                )
+            except IntegrityError:
+                raise UserAlreadyVotedError
+
             return user_statistics
 
     async def dislike_user(self, voting_user_id: int, voted_for_user_id: int) -> UserStatisticsModel:
-        async with self._session_factory() as session:
+        if self._vote_counters_buffer is not None:
+            return await self._buffer_vote(
+                voting_user_id=voting_user_id,
+                voted_for_user_id=voted_for_user_id,
+                vote=VoteType.DISLIKE
+            )
+
+        async with self._session() as session:
             user_statistics: Optional[UserStatisticsModel] = (
                 await session.scalars(
-                    select(
+                    update(
                         UserStatisticsModel
                     ).filter_by(
                         user_id=voted_for_user_id
+                    ).values(
+                        **get_vote_counters_values(vote=VoteType.DISLIKE)
+                    ).returning(
+                        UserStatisticsModel
                     )
                 )
             ).one_or_none()
             if not user_statistics:
                 raise UserStatisticsNotFoundError
 
-            await session.execute(
-                update(
-                    UserStatisticsModel
-                ).filter_by(
-                    id=user_statistics.id
-                ).values(
-                    dislikes=user_statistics.dislikes + 1
+            # Unique index on votes rejects repeated vote and increment above is rolled back with the transaction:
+            try:
+                await session.execute(
+                    insert(
+                        UserVoteModel
+                    ).values(
+                        voting_user_id=voting_user_id,
+                        voted_for_user_id=voted_for_user_id
+                    )
                 )
+            except IntegrityError:
+                raise UserAlreadyVotedError
+
+            return user_statistics
+
+    async def vote_for_users(self, voting_user_id: int, votes: Sequence[Tuple[int, VoteType]]) -> List[VoteOutcome]:
+        """
+        Applies batch of votes of one user with fixed number of set-based statements, independent of batch size:
+        existence check of voted for users, bulk insert of votes and one counters UPDATE per vote type.
+
+        Returns outcome of every vote in the same order as provided votes. Only the first vote for each user
+        within batch is applied and the following ones are considered as already voted.
+        """
+
+        outcomes: List[Optional[VoteOutcome]] = [None] * len(votes)
+        first_votes: Dict[int, int] = {}
+        for index, (voted_for_user_id, _vote) in enumerate(votes):
+            if voted_for_user_id == voting_user_id:
+                outcomes[index] = VoteOutcome.SELF_VOTE
+            elif voted_for_user_id in first_votes:
+                outcomes[index] = VoteOutcome.ALREADY_VOTED
+            else:
+                first_votes[voted_for_user_id] = index
+
+        if not first_votes:
+            return cast(List[VoteOutcome], outcomes)
+
+        async with self._session() as session:
+            existing_user_ids: Set[int] = set(
+                (
+                    await session.scalars(
+                        select(
+                            UserStatisticsModel.user_id
+                        ).where(
+                            UserStatisticsModel.user_id.in_(first_votes)
+                        )
+                    )
+                ).all()
             )
 
-            await session.execute(
-                insert(
-                    UserVoteModel
-                ).values(
-                    voting_user_id=voting_user_id,
-                    voted_for_user_id=voted_for_user_id
+            # Votes, which conflict with unique index on votes, are skipped and only inserted ones are returned:
+            applied_user_ids: Set[int] = set()
+            if existing_user_ids:
+                insert_ignoring_conflicts: InsertIgnoringConflicts = get_insert_ignoring_conflicts(
+                    dialect_name=session.get_bind().dialect.name
+                )
+                applied_user_ids = set(
+                    (
+                        await session.scalars(
+                            insert_ignoring_conflicts(
+                                UserVoteModel
+                            ).values(
+                                [
+                                    {'voting_user_id': voting_user_id, 'voted_for_user_id': voted_for_user_id}
+                                    for voted_for_user_id in existing_user_ids
+                                ]
+                            ).on_conflict_do_nothing().returning(
+                                UserVoteModel.voted_for_user_id
+                            )
+                        )
+                    ).all()
                 )
-            )
 
-            await session.commit()
-            return user_statistics
+            for vote in VoteType:
+                voted_for_user_ids: List[int] = [
+                    voted_for_user_id for voted_for_user_id in applied_user_ids
+                    if votes[first_votes[voted_for_user_id]][1] == vote
+                ]
+                if voted_for_user_ids:
+                    await session.execute(
+                        update(
+                            UserStatisticsModel
+                        ).where(
+                            UserStatisticsModel.user_id.in_(voted_for_user_ids)
+                        ).values(
+                            **get_vote_counters_values(vote=vote)
+                        ).execution_options(
+                            synchronize_session=False
+                        )
+                    )
+
+        for voted_for_user_id, index in first_votes.items():
+            if voted_for_user_id in applied_user_ids:
+                outcomes[index] = VoteOutcome.APPLIED
+            elif voted_for_user_id in existing_user_ids:
+                outcomes[index] = VoteOutcome.ALREADY_VOTED
+            else:
+                outcomes[index] = VoteOutcome.NOT_FOUND
+
+        return cast(List[VoteOutcome], outcomes)
 
     async def check_if_user_already_voted(self, voting_user_id: int, voted_for_user_id: int) -> bool:
-        async with self._session_factory() as session:
+        async with self._session() as session:
             user_vote: Optional[UserVoteModel] = (
                 await session.scalars(
                     select(
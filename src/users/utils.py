@@ -1,11 +1,29 @@
+import asyncio
+import csv
+import io
+import math
+import time
+import orjson
 from fastapi import Request
 from fastapi.security import OAuth2
 from fastapi.openapi.models import OAuthFlows as OAuthFlowsModel
 from passlib.context import CryptContext
-from typing import Optional, Dict
+from passlib.registry import get_crypt_handler
+from sqlalchemy import Row, Float, ColumnElement, SQLColumnExpression, case, cast, func
+from typing import Optional, Dict, AsyncIterator, AsyncGenerator, Sequence, Tuple, Any, List
 
-from src.users.config import URLPathsConfig, cookies_config, passlib_config, RouterConfig
+from src.users.config import (
+    URLPathsConfig,
+    cookies_config,
+    passlib_config,
+    RouterConfig,
+    ExportFormat,
+    UsersExportConfig,
+    UsersLeaderboardConfig,
+    users_import_config
+)
 from src.users.exceptions import NotAuthenticatedError
+from src.core.executors import BoundedExecutor
 
 
 class OAuth2Cookie(OAuth2):
@@ -45,17 +63,218 @@ class OAuth2Cookie(OAuth2):
         return token
 
 
+def get_password_rounds_settings(rounds: int, scheme: str = passlib_config.PASSLIB_SCHEME) -> Dict[str, int]:
+    """
+    Returns CryptContext settings, which make new hashes use provided rounds and mark hashes with lower rounds
+    as outdated, so they are rehashed on the next successful login.
+    """
+
+    return {
+        f'{scheme}__default_rounds': rounds,
+        f'{scheme}__min_rounds': rounds,
+    }
+
+
 pwd_context: CryptContext = CryptContext(
     schemes=[passlib_config.PASSLIB_SCHEME],
     deprecated=passlib_config.PASSLIB_DEPRECATED
 )
+if passlib_config.PASSLIB_ROUNDS is not None:
+    pwd_context.update(**get_password_rounds_settings(rounds=passlib_config.PASSLIB_ROUNDS))
 
 oauth2_scheme: OAuth2Cookie = OAuth2Cookie(token_url=RouterConfig.PREFIX + URLPathsConfig.LOGIN)
 
 
-async def verify_password(plain_password: str, hashed_password: str) -> bool:
+password_hashing_executor: BoundedExecutor = BoundedExecutor(
+    kind=passlib_config.PASSLIB_EXECUTOR,
+    workers=passlib_config.PASSLIB_WORKERS,
+    max_pending=passlib_config.PASSLIB_MAX_PENDING,
+    name='password_hashing'
+)
+
+# Bulk import hashes many passwords at once, so it uses its own pool of processes instead of shared executor:
+users_import_executor: BoundedExecutor = BoundedExecutor(
+    kind='process',
+    workers=users_import_config.USERS_IMPORT_WORKERS,
+    max_pending=users_import_config.USERS_IMPORT_WORKERS * 2,
+    name='users_import'
+)
+
+
+def set_password_rounds(rounds: int) -> None:
+    pwd_context.update(**get_password_rounds_settings(rounds))
+
+
+def configure_password_hashing(rounds: int) -> None:
+    """
+    Applies provided hashing cost to current process and to every password hashing worker.
+    """
+
+    set_password_rounds(rounds)
+    password_hashing_executor.set_initializer(set_password_rounds, rounds)
+    users_import_executor.set_initializer(set_password_rounds, rounds)
+
+
+def calibrate_password_rounds(
+        target_milliseconds: float,
+        scheme: str = passlib_config.PASSLIB_SCHEME,
+        samples: int = 3
+) -> int:
+    """
+    Measures hashing time on current hardware and returns rounds, which make single hash take approximately
+    provided number of milliseconds. Hash time is measured with reduced rounds and extrapolated according to
+    scheme's cost model (linear or log2). Result is rounded to two significant digits for linear schemes,
+    so processes, calibrated on the same hardware, agree on the value.
+    """
+
+    handler: Any = get_crypt_handler(scheme)
+    if 'rounds' not in handler.setting_kwds:
+        raise ValueError(f'Scheme {scheme} does not support rounds configuration')
+
+    probe_rounds: int
+    if handler.rounds_cost == 'log2':
+        probe_rounds = max(handler.min_rounds, handler.default_rounds - 4)
+    else:
+        probe_rounds = max(handler.min_rounds, handler.default_rounds // 16)
+
+    probe_handler: Any = handler.using(rounds=probe_rounds)
+    probe_milliseconds: float = float('inf')
+    for _ in range(samples):
+        started_at: float = time.perf_counter()
+        probe_handler.hash('calibration password')
+        probe_milliseconds = min(probe_milliseconds, (time.perf_counter() - started_at) * 1000)
+
+    rounds: int
+    if handler.rounds_cost == 'log2':
+        rounds = round(probe_rounds + math.log2(target_milliseconds / probe_milliseconds))
+    else:
+        rounds = int(float(f'{probe_rounds * target_milliseconds / probe_milliseconds:.2g}'))
+
+    return min(max(rounds, handler.min_rounds), handler.max_rounds or rounds)
+
+
+def setup_password_hashing() -> None:
+    """
+    Calibrates hashing cost on application startup, if target hash latency is configured instead of explicit rounds.
+    """
+
+    if passlib_config.PASSLIB_ROUNDS is None and passlib_config.PASSLIB_TARGET_HASH_MILLISECONDS is not None:
+        configure_password_hashing(
+            rounds=calibrate_password_rounds(target_milliseconds=passlib_config.PASSLIB_TARGET_HASH_MILLISECONDS)
+        )
+
+
+def verify_password_sync(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(secret=plain_password, hash=hashed_password)
 
 
-async def hash_password(password: str) -> str:
+def verify_and_update_password_sync(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    return pwd_context.verify_and_update(secret=plain_password, hash=hashed_password)
+
+
+def hash_password_sync(password: str) -> str:
     return pwd_context.hash(secret=password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await password_hashing_executor.run(verify_password_sync, plain_password, hashed_password)
+
+
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verifies password and, if it is valid, but its hash is outdated (for example, hashing cost was increased),
+    returns new hash of the password, using the same worker call.
+    """
+
+    return await password_hashing_executor.run(verify_and_update_password_sync, plain_password, hashed_password)
+
+
+async def hash_password(password: str) -> str:
+    return await password_hashing_executor.run(hash_password_sync, password)
+
+
+def hash_passwords_sync(passwords: Sequence[str]) -> List[str]:
+    return [pwd_context.hash(secret=password) for password in passwords]
+
+
+async def hash_passwords(passwords: Sequence[str]) -> List[str]:
+    """
+    Hashes passwords in parallel on users import executor. Passwords are split to one chunk per worker,
+    so every worker call hashes many passwords and inter-process communication overhead is paid once per chunk.
+    """
+
+    chunk_size: int = max(1, math.ceil(len(passwords) / users_import_config.USERS_IMPORT_WORKERS))
+    hashes_chunks: List[List[str]] = await asyncio.gather(
+        *(
+            users_import_executor.run(hash_passwords_sync, passwords[index:index + chunk_size])
+            for index in range(0, len(passwords), chunk_size)
+        )
+    )
+
+    return [password_hash for hashes_chunk in hashes_chunks for password_hash in hashes_chunk]
+
+
+async def encode_users_export(
+        rows_batches: AsyncIterator[Sequence[Row]],
+        export_format: ExportFormat
+) -> AsyncGenerator[bytes, None]:
+    """
+    Encodes batches of exported users rows to NDJSON or CSV chunks, one chunk per batch.
+    """
+
+    if export_format == ExportFormat.CSV:
+        buffer: io.StringIO = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(UsersExportConfig.FIELDS)
+        yield buffer.getvalue().encode()
+
+        async for rows in rows_batches:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerows(rows)
+            yield buffer.getvalue().encode()
+
+        return
+
+    async for rows in rows_batches:
+        yield b''.join(orjson.dumps(row._asdict()) + b'\n' for row in rows)
+
+
+def wilson_score_lower_bound(
+        likes: SQLColumnExpression[int],
+        dislikes: SQLColumnExpression[int],
+        z: float = UsersLeaderboardConfig.WILSON_SCORE_Z
+) -> ColumnElement[float]:
+    """
+    Returns SQL expression of Wilson score interval lower bound for proportion of likes, so users with few votes
+    are ranked below users with many mostly positive votes. Expression is evaluated by database, either for single
+    row in UPDATE statement, or for the whole table at once on recompute.
+
+    Lower bound of users without likes is exactly 0, which floating point evaluation of formula would turn into
+    tiny negative noise, so such users would be ordered by rounding errors instead of user id.
+    """
+
+    votes: ColumnElement[int] = likes + dislikes
+    return case(
+        (likes == 0, 0.0),
+        else_=(
+            (cast(likes, Float) + z * z / 2) / (votes + z * z)
+            - z / (votes + z * z) * func.sqrt(cast(likes, Float) * dislikes / votes + z * z / 4)
+        )
+    )
+
+
+def calculate_wilson_score_lower_bound(
+        likes: int,
+        dislikes: int,
+        z: float = UsersLeaderboardConfig.WILSON_SCORE_Z
+) -> float:
+    """
+    Calculates the same Wilson score interval lower bound as "wilson_score_lower_bound" expression, but in Python.
+    """
+
+    votes: int = likes + dislikes
+    if likes == 0:
+        return 0.0
+
+    return (likes + z * z / 2) / (votes + z * z) - z / (votes + z * z) * math.sqrt(likes * dislikes / votes + z * z / 4)
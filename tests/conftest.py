@@ -4,14 +4,16 @@ from httpx import AsyncClient, Cookies, Response
 from sqlalchemy import insert, CursorResult, RowMapping
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncConnection
 from sqlalchemy.exc import IntegrityError
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Optional, Generator, Dict, Any
 
 from src.app import app
 from src.users.config import RouterConfig, URLPathsConfig, cookies_config
 from src.users.models import UserModel, UserStatisticsModel
 from src.core.database.connection import DATABASE_URL
 from src.core.database.base import Base
-from src.users.utils import hash_password
+from src.users.utils import hash_password, pwd_context, password_hashing_executor, users_import_executor
+from src.users.service import users_count_cache, users_identity_cache
+from src.security.utils import jwt_tokens_cache
 from tests.config import FakeUserConfig
 from tests.utils import get_base_url, drop_test_db
 
@@ -25,6 +27,30 @@ def anyio_backend() -> str:
     return 'asyncio'
 
 
+@pytest.fixture(autouse=True)
+def clear_caches() -> None:
+    """
+    Clears in-process caches, because test database is recreated for every test.
+    """
+
+    users_count_cache.clear()
+    users_identity_cache.clear()
+    jwt_tokens_cache.clear()
+
+
+@pytest.fixture
+def restore_password_hashing() -> Generator[None, None, None]:
+    """
+    Restores password hashing configuration, changed during test.
+    """
+
+    original_settings: Dict[str, Any] = pwd_context.to_dict()
+    yield
+    pwd_context.load(original_settings)
+    password_hashing_executor.set_initializer(None)
+    users_import_executor.set_initializer(None)
+
+
 @pytest.fixture
 async def async_connection() -> AsyncGenerator[AsyncConnection, None]:
     engine: AsyncEngine = create_async_engine(DATABASE_URL)
@@ -0,0 +1,124 @@
+import logging
+import pytest
+from pathlib import Path
+from typing import Any, AsyncGenerator
+from fastapi import FastAPI, status
+from httpx import AsyncClient, ASGITransport, Response
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
+
+from src.core.metrics import HTTPMetrics
+from src.core.middlewares import MetricsMiddleware, QueryStatisticsMiddleware, UNMATCHED_ROUTE
+from src.core.database.query_statistics import attach_query_listeners
+
+
+METRICS_PATH: str = '/metrics'
+
+
+def get_client(app: Any, raise_app_exceptions: bool = True) -> AsyncClient:
+    return AsyncClient(
+        transport=ASGITransport(app=app, raise_app_exceptions=raise_app_exceptions),
+        base_url='http://test'
+    )
+
+
+@pytest.fixture
+def http_metrics() -> HTTPMetrics:
+    return HTTPMetrics()
+
+
+@pytest.fixture
+def metrics_app(http_metrics: HTTPMetrics) -> FastAPI:
+    app: FastAPI = FastAPI()
+
+    @app.get('/items/{item_id}')
+    async def get_item(item_id: int):
+        return {'item_id': item_id}
+
+    @app.get('/error')
+    async def error():
+        raise RuntimeError
+
+    app.add_middleware(MetricsMiddleware, metrics=http_metrics, path=METRICS_PATH)
+    return app
+
+
+@pytest.mark.anyio
+async def test_metrics_middleware_records_route_templates(metrics_app: FastAPI, http_metrics: HTTPMetrics) -> None:
+    async with get_client(app=metrics_app) as client:
+        await client.get('/items/1')
+        await client.get('/items/2')
+        await client.get('/missing')
+
+    assert http_metrics.requests == {
+        ('GET', '/items/{item_id}', status.HTTP_200_OK): 2,
+        ('GET', UNMATCHED_ROUTE, status.HTTP_404_NOT_FOUND): 1,
+    }
+    assert http_metrics.latencies[('GET', '/items/{item_id}')].count == 2
+    assert http_metrics.in_flight == {'GET': 0}
+
+
+@pytest.mark.anyio
+async def test_metrics_middleware_records_errors(metrics_app: FastAPI, http_metrics: HTTPMetrics) -> None:
+    async with get_client(app=metrics_app, raise_app_exceptions=False) as client:
+        await client.get('/error')
+
+    assert http_metrics.requests == {('GET', '/error', status.HTTP_500_INTERNAL_SERVER_ERROR): 1}
+    assert http_metrics.in_flight == {'GET': 0}
+
+
+@pytest.mark.anyio
+async def test_metrics_middleware_serves_metrics(metrics_app: FastAPI, http_metrics: HTTPMetrics) -> None:
+    async with get_client(app=metrics_app) as client:
+        await client.get('/items/1')
+        response: Response = await client.get(METRICS_PATH)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['content-type'].startswith('text/plain')
+    assert 'http_requests_total{method="GET",route="/items/{item_id}",status="200"} 1' in response.text
+
+    # Metrics endpoint itself is not measured:
+    assert len(http_metrics.requests) == 1
+
+
+@pytest.fixture
+async def queries_app(tmp_path: Path) -> AsyncGenerator[FastAPI, None]:
+    engine: AsyncEngine = create_async_engine(f'sqlite+aiosqlite:///{tmp_path / "database.db"}')
+    attach_query_listeners(engine=engine)
+    app: FastAPI = FastAPI()
+
+    @app.get('/queries/{queries_count}')
+    async def perform_queries(queries_count: int):
+        async with engine.connect() as connection:
+            for _ in range(queries_count):
+                await connection.execute(text('SELECT 1'))
+
+    app.add_middleware(QueryStatisticsMiddleware, query_budget=2)
+    yield app
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_query_statistics_middleware_warns_over_budget(
+        queries_app: FastAPI,
+        caplog: pytest.LogCaptureFixture
+) -> None:
+
+    with caplog.at_level(logging.WARNING):
+        async with get_client(app=queries_app) as client:
+            await client.get('/queries/3')
+
+    assert 'GET /queries/{queries_count} performed 3 queries' in caplog.text
+
+
+@pytest.mark.anyio
+async def test_query_statistics_middleware_within_budget(
+        queries_app: FastAPI,
+        caplog: pytest.LogCaptureFixture
+) -> None:
+
+    with caplog.at_level(logging.WARNING):
+        async with get_client(app=queries_app) as client:
+            await client.get('/queries/2')
+
+    assert 'queries' not in caplog.text
@@ -0,0 +1,73 @@
+import logging
+import pytest
+from pathlib import Path
+from typing import AsyncGenerator
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
+
+from src.core.database.migrations import (
+    check_schema_revision,
+    get_current_revisions,
+    get_head_revisions,
+    SchemaRevisionMismatchError
+)
+
+
+@pytest.fixture
+async def database_engine(tmp_path: Path) -> AsyncGenerator[AsyncEngine, None]:
+    engine: AsyncEngine = create_async_engine(f'sqlite+aiosqlite:///{tmp_path / "database.db"}')
+    yield engine
+    await engine.dispose()
+
+
+async def stamp_database(database_engine: AsyncEngine, revision: str) -> None:
+    async with database_engine.begin() as connection:
+        await connection.execute(text('CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)'))
+        await connection.execute(text('INSERT INTO alembic_version VALUES (:revision)'), {'revision': revision})
+
+
+def test_get_head_revisions() -> None:
+    assert get_head_revisions() == {'041a879dd4fe'}
+
+
+@pytest.mark.anyio
+async def test_check_schema_revision_success(database_engine: AsyncEngine) -> None:
+    head_revision: str = get_head_revisions().pop()
+    await stamp_database(database_engine=database_engine, revision=head_revision)
+
+    assert await get_current_revisions(database_engine=database_engine) == {head_revision}
+    await check_schema_revision(database_engine=database_engine, schema_check='error')
+
+
+@pytest.mark.anyio
+async def test_check_schema_revision_fail_not_migrated_database(database_engine: AsyncEngine) -> None:
+    assert await get_current_revisions(database_engine=database_engine) == set()
+    with pytest.raises(SchemaRevisionMismatchError):
+        await check_schema_revision(database_engine=database_engine, schema_check='error')
+
+
+@pytest.mark.anyio
+async def test_check_schema_revision_warns_on_outdated_database(
+        database_engine: AsyncEngine,
+        caplog: pytest.LogCaptureFixture
+) -> None:
+
+    await stamp_database(database_engine=database_engine, revision='a7182d2c20b9')
+    with caplog.at_level(logging.WARNING, logger='src.core.database.migrations'):
+        await check_schema_revision(database_engine=database_engine, schema_check='warn')
+        await check_schema_revision(database_engine=database_engine, schema_check='off')
+
+    assert len(caplog.records) == 1
+    assert 'a7182d2c20b9' in caplog.records[0].getMessage()
+
+
+@pytest.mark.anyio
+async def test_check_schema_revision_fail_unreachable_database(tmp_path: Path) -> None:
+    engine: AsyncEngine = create_async_engine(f'sqlite+aiosqlite:///{tmp_path / "missing" / "database.db"}')
+
+    # Unreachable database is not reported as not migrated one, even if mismatch is only logged:
+    with pytest.raises(OperationalError):
+        await check_schema_revision(database_engine=engine, schema_check='warn')
+
+    await engine.dispose()
@@ -0,0 +1,57 @@
+import pytest
+from pathlib import Path
+from typing import Dict, Any
+from sqlalchemy import text, AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
+
+from src.core.database.pool_statistics import PoolStatistics, instrument_pool_class
+from src.core.database.connection import get_pools_statistics
+
+
+@pytest.mark.anyio
+async def test_pool_statistics(tmp_path: Path) -> None:
+    statistics: PoolStatistics = PoolStatistics()
+    engine: AsyncEngine = create_async_engine(
+        f'sqlite+aiosqlite:///{tmp_path / "database.db"}',
+        poolclass=instrument_pool_class(pool_class=AsyncAdaptedQueuePool, statistics=statistics),
+        pool_size=1,
+        max_overflow=1
+    )
+    statistics.attach(engine=engine)
+
+    async with engine.connect() as first_connection:
+        async with engine.connect() as second_connection:
+            await first_connection.execute(text('SELECT 1'))
+            await second_connection.execute(text('SELECT 1'))
+            assert statistics.to_dict()['checked_out'] == 2
+
+    async with engine.connect() as connection:
+        await connection.execute(text('SELECT 1'))
+
+    pool_statistics: Dict[str, Any] = statistics.to_dict()
+    assert pool_statistics['connects'] == 2
+    assert pool_statistics['checkouts'] == 3
+    assert pool_statistics['checkins'] == 3
+    assert pool_statistics['checked_out'] == 0
+    assert pool_statistics['max_checked_out'] == 2
+    assert pool_statistics['max_overflow'] == 1
+    assert pool_statistics['size'] == 1
+    assert pool_statistics['checked_in'] == 1
+    assert pool_statistics['checkout_wait_milliseconds']['count'] == 3
+    assert pool_statistics['connection_age_seconds']['count'] == 3
+
+    # Statistics are kept, when pool is recreated on engine disposal:
+    await engine.dispose()
+    async with engine.connect() as connection:
+        await connection.execute(text('SELECT 1'))
+
+    assert statistics.checkouts == 4
+    assert statistics.checkout_wait_milliseconds.count == 4
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_get_pools_statistics() -> None:
+    pools_statistics: Dict[str, Dict[str, Any]] = get_pools_statistics()
+    assert 'primary' in pools_statistics
+    assert pools_statistics['primary']['checkouts'] >= 0
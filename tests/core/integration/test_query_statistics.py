@@ -0,0 +1,117 @@
+import logging
+import pytest
+from pathlib import Path
+from contextvars import Token
+from typing import AsyncGenerator, Optional
+from sqlalchemy import text, insert, update
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncConnection
+
+from src.core.database.base import Base
+from src.core.database.config import database_config
+from src.core.database.query_statistics import (
+    RequestQueryStatistics,
+    current_query_statistics,
+    attach_query_listeners
+)
+from src.users.models import UserModel
+
+
+@pytest.fixture
+async def engine(tmp_path: Path) -> AsyncGenerator[AsyncEngine, None]:
+    engine: AsyncEngine = create_async_engine(f'sqlite+aiosqlite:///{tmp_path / "database.db"}')
+    attach_query_listeners(engine=engine)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_queries_attributed_to_current_request(engine: AsyncEngine) -> None:
+    statistics: RequestQueryStatistics = RequestQueryStatistics(scope={'path': '/users/1'})
+    token: Token[Optional[RequestQueryStatistics]] = current_query_statistics.set(statistics)
+
+    connection: AsyncConnection
+    async with engine.connect() as connection:
+        await connection.execute(text('SELECT 1'))
+        await connection.execute(text('SELECT 2'))
+
+    current_query_statistics.reset(token)
+
+    assert statistics.queries == 2
+    assert statistics.seconds > 0
+    assert statistics.route == '/users/1'
+
+
+@pytest.mark.anyio
+async def test_slow_query_logged(
+        engine: AsyncEngine,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture
+) -> None:
+
+    monkeypatch.setattr(database_config, 'DATABASE_SLOW_QUERY_MILLISECONDS', 0)
+    token: Token[Optional[RequestQueryStatistics]] = current_query_statistics.set(
+        RequestQueryStatistics(scope={'path': '/users/1'})
+    )
+    with caplog.at_level(logging.WARNING):
+        async with engine.connect() as connection:
+            await connection.execute(text('SELECT :value'), {'value': 'someValue'})
+
+    current_query_statistics.reset(token)
+
+    assert 'SELECT ?' in caplog.text
+    assert 'someValue' in caplog.text
+    assert '/users/1' in caplog.text
+
+
+@pytest.mark.anyio
+async def test_slow_query_logged_without_sensitive_parameters(
+        engine: AsyncEngine,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture
+) -> None:
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    monkeypatch.setattr(database_config, 'DATABASE_SLOW_QUERY_MILLISECONDS', 0)
+    with caplog.at_level(logging.WARNING):
+        async with engine.begin() as connection:
+            await connection.execute(
+                insert(UserModel),
+                [
+                    {
+                        'email': f'user_{number}@mail.ru',
+                        'password': f'passwordHash{number}',
+                        'username': f'user_{number}'
+                    }
+                    for number in range(5)
+                ]
+            )
+            await connection.execute(
+                update(UserModel).filter_by(id=1).values(password='newPasswordHash')
+            )
+
+    assert 'passwordHash' not in caplog.text
+    assert 'newPasswordHash' not in caplog.text
+    assert "('user_0@mail.ru', '<redacted>', 'user_0')" in caplog.text
+    assert 'and 2 more' in caplog.text
+    assert 'user_4@mail.ru' not in caplog.text
+
+
+@pytest.mark.anyio
+async def test_slow_query_logged_with_hidden_parameters(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture
+) -> None:
+
+    engine: AsyncEngine = create_async_engine(f'sqlite+aiosqlite:///{tmp_path / "database.db"}', hide_parameters=True)
+    attach_query_listeners(engine=engine)
+    monkeypatch.setattr(database_config, 'DATABASE_SLOW_QUERY_MILLISECONDS', 0)
+    with caplog.at_level(logging.WARNING):
+        async with engine.connect() as connection:
+            await connection.execute(text('SELECT :value'), {'value': 'someValue'})
+
+    await engine.dispose()
+    assert 'someValue' not in caplog.text
+    assert 'parameters: <hidden>' in caplog.text
@@ -0,0 +1,85 @@
+import pytest
+from pathlib import Path
+from typing import AsyncGenerator
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, async_sessionmaker
+
+from src.core.database.base import Base
+from src.core.database.replicas import ReplicaRouter
+from src.core.database.unit_of_work import UnitOfWork
+from src.users.models import UserModel
+from src.users.service import UsersService
+from tests.config import FakeUserConfig
+
+
+REPLICA_USERNAME: str = 'replicaUsername'
+
+
+@pytest.fixture
+async def replica_router(tmp_path: Path) -> AsyncGenerator[ReplicaRouter, None]:
+    """
+    Creates replica database, which differs from primary one by username of test user,
+    so it is visible, which database query was routed to.
+    """
+
+    engine: AsyncEngine = create_async_engine(f'sqlite+aiosqlite:///{tmp_path / "replica.db"}')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(
+            insert(UserModel).values(
+                id=1,
+                email=FakeUserConfig.EMAIL,
+                password=FakeUserConfig.PASSWORD,
+                username=REPLICA_USERNAME
+            )
+        )
+
+    yield ReplicaRouter(session_factories=[async_sessionmaker(bind=engine)])
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_read_only_queries_routed_to_replica(create_test_user: None, replica_router: ReplicaRouter) -> None:
+    users_service: UsersService = UsersService(replica_router=replica_router)
+
+    user: UserModel = await users_service.get_user_by_id(id=1)
+    assert user.username == REPLICA_USERNAME
+    assert [user.username for user in await users_service.get_all_users()] == [REPLICA_USERNAME]
+
+    assert await users_service.check_user_existence(username=REPLICA_USERNAME)
+
+    # User, registered on primary database, is not counted on replica:
+    await users_service.register_user(user=UserModel(email='user@mail.ru', password='<PASSWORD>', username='user'))
+    assert await users_service.count_users() == 1
+
+    # Queries, which are not read-only, are performed on primary database:
+    taken_emails, taken_usernames = await users_service.get_taken_emails_and_usernames(
+        emails=[],
+        usernames=[FakeUserConfig.USERNAME, REPLICA_USERNAME]
+    )
+    assert taken_usernames == {FakeUserConfig.USERNAME}
+
+
+@pytest.mark.anyio
+async def test_reads_routed_to_primary_after_write(create_test_user: None, replica_router: ReplicaRouter) -> None:
+    async with UnitOfWork() as unit_of_work:
+        users_service: UsersService = UsersService(unit_of_work=unit_of_work, replica_router=replica_router)
+        user: UserModel = await users_service.get_user_by_id(id=1)
+        assert user.username == REPLICA_USERNAME
+        assert not unit_of_work.pinned_to_primary
+
+        await users_service.update_user_password(user_id=1, password='newPasswordHash')
+        assert unit_of_work.pinned_to_primary
+
+        user = await users_service.get_user_by_id(id=1)
+        assert user.username == FakeUserConfig.USERNAME
+        assert user.password == 'newPasswordHash'
+
+
+@pytest.mark.anyio
+async def test_reads_routed_to_primary_after_pinning(create_test_user: None, replica_router: ReplicaRouter) -> None:
+    async with UnitOfWork() as unit_of_work:
+        unit_of_work.pin_to_primary()
+        users_service: UsersService = UsersService(unit_of_work=unit_of_work, replica_router=replica_router)
+        user: UserModel = await users_service.get_user_by_id(id=1)
+        assert user.username == FakeUserConfig.USERNAME
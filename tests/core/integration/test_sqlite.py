@@ -0,0 +1,71 @@
+import pytest
+from pathlib import Path
+from typing import AsyncGenerator, Tuple
+from sqlalchemy import text, insert, select, func
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
+
+from src.core.database.base import Base
+from src.core.database.config import database_config
+from src.core.database.sqlite import apply_sqlite_pragmas, get_sqlite_pool_options
+from src.users.models import UserModel
+
+
+@pytest.fixture
+async def sqlite_engines(tmp_path: Path) -> AsyncGenerator[Tuple[AsyncEngine, AsyncEngine], None]:
+    """
+    Creates writer and reader engines of SQLite production profile for the same database file.
+    """
+
+    url: str = f'sqlite+aiosqlite:///{tmp_path / "database.db"}'
+    writer_engine: AsyncEngine = create_async_engine(url, **get_sqlite_pool_options(connections=1))
+    apply_sqlite_pragmas(engine=writer_engine)
+    reader_engine: AsyncEngine = create_async_engine(url, **get_sqlite_pool_options(connections=2))
+    apply_sqlite_pragmas(engine=reader_engine, read_only=True)
+
+    async with writer_engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    yield writer_engine, reader_engine
+    await writer_engine.dispose()
+    await reader_engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_sqlite_pragmas_applied(sqlite_engines: Tuple[AsyncEngine, AsyncEngine]) -> None:
+    writer_engine, _ = sqlite_engines
+    async with writer_engine.connect() as connection:
+        assert (await connection.execute(text('PRAGMA journal_mode'))).scalar() == 'wal'
+        assert (await connection.execute(text('PRAGMA synchronous'))).scalar() == 1  # NORMAL
+        assert (await connection.execute(text('PRAGMA busy_timeout'))).scalar() == (
+            database_config.DATABASE_SQLITE_BUSY_TIMEOUT_MILLISECONDS
+        )
+        assert (await connection.execute(text('PRAGMA cache_size'))).scalar() == (
+            database_config.DATABASE_SQLITE_CACHE_SIZE
+        )
+        assert (await connection.execute(text('PRAGMA temp_store'))).scalar() == 2  # MEMORY
+        assert (await connection.execute(text('PRAGMA query_only'))).scalar() == 0
+
+
+@pytest.mark.anyio
+async def test_sqlite_reader_rejects_writes(sqlite_engines: Tuple[AsyncEngine, AsyncEngine]) -> None:
+    _, reader_engine = sqlite_engines
+    with pytest.raises(OperationalError):
+        async with reader_engine.begin() as connection:
+            await connection.execute(insert(UserModel).values(email='email', password='password', username='user'))
+
+
+@pytest.mark.anyio
+async def test_sqlite_reader_not_blocked_by_writer(sqlite_engines: Tuple[AsyncEngine, AsyncEngine]) -> None:
+    writer_engine, reader_engine = sqlite_engines
+    async with writer_engine.begin() as writer_connection:
+        await writer_connection.execute(
+            insert(UserModel).values(email='email', password='password', username='user')
+        )
+
+        # Reader sees last committed state, while write transaction is still open:
+        async with reader_engine.connect() as reader_connection:
+            assert (await reader_connection.execute(select(func.count()).select_from(UserModel))).scalar() == 0
+
+    async with reader_engine.connect() as reader_connection:
+        assert (await reader_connection.execute(select(func.count()).select_from(UserModel))).scalar() == 1
@@ -0,0 +1,46 @@
+import pytest
+from typing import Optional
+from sqlalchemy import select, CursorResult, Row
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.core.database.unit_of_work import UnitOfWork
+from src.users.models import UserModel
+from src.users.service import UsersService
+from tests.config import FakeUserConfig
+
+
+@pytest.mark.anyio
+async def test_unit_of_work_commits_on_successful_exit(
+        create_test_db: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async with UnitOfWork() as unit_of_work:
+        users_service: UsersService = UsersService(unit_of_work=unit_of_work)
+        user: UserModel = await users_service.register_user(user=UserModel(**FakeUserConfig().to_dict(to_lower=True)))
+
+        # All service calls within unit of work share the same session and identity map:
+        assert await users_service.get_user_by_id(id=user.id) is user
+
+    cursor: CursorResult = await async_connection.execute(select(UserModel).filter_by(email=FakeUserConfig.EMAIL))
+    result: Optional[Row] = cursor.first()
+    assert result
+
+
+@pytest.mark.anyio
+async def test_unit_of_work_rolls_back_on_error(create_test_db: None, async_connection: AsyncConnection) -> None:
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork() as unit_of_work:
+            users_service: UsersService = UsersService(unit_of_work=unit_of_work)
+            await users_service.register_user(user=UserModel(**FakeUserConfig().to_dict(to_lower=True)))
+            raise RuntimeError
+
+    cursor: CursorResult = await async_connection.execute(select(UserModel).filter_by(email=FakeUserConfig.EMAIL))
+    result: Optional[Row] = cursor.first()
+    assert not result
+
+
+@pytest.mark.anyio
+async def test_unit_of_work_does_not_open_session_without_database_access() -> None:
+    async with UnitOfWork() as unit_of_work:
+        assert unit_of_work._session is None
@@ -0,0 +1,82 @@
+import time
+import pytest
+
+from src.core.cache import TTLCache, caches, get_caches_statistics
+
+
+def test_ttl_cache_get_set() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+    cache.set('key', 1)
+    assert cache.get('key') == 1
+    assert cache.get('missing_key') is None
+
+
+def test_ttl_cache_evicts_least_recently_used_entry() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+    cache.set('first', 1)
+    cache.set('second', 2)
+    cache.get('first')
+    cache.set('third', 3)
+
+    assert len(cache) == 2
+    assert cache.get('first') == 1
+    assert cache.get('second') is None
+    assert cache.get('third') == 3
+
+
+def test_ttl_cache_entry_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+    cache.set('key', 1)
+
+    now: float = time.monotonic()
+    monkeypatch.setattr(time, 'monotonic', lambda: now + 61)
+    assert cache.get('key') is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_invalidate() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+    cache.set('key', 1)
+    cache.invalidate('key')
+    assert cache.get('key') is None
+
+
+def test_ttl_cache_hits_and_misses() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+    cache.set('key', 1)
+    cache.get('key')
+    cache.get('key')
+    cache.get('missing_key')
+
+    assert cache.hits == 2
+    assert cache.misses == 1
+
+    cache.clear()
+    assert cache.hits == 0
+    assert cache.misses == 0
+
+
+def test_ttl_cache_entry_custom_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+    cache.set('short', 1, ttl=10)
+    cache.set('capped', 2, ttl=120)
+    cache.set('expired', 3, ttl=0)
+    assert cache.get('expired') is None
+
+    now: float = time.monotonic()
+    monkeypatch.setattr(time, 'monotonic', lambda: now + 11)
+    assert cache.get('short') is None
+    assert cache.get('capped') == 2
+
+    monkeypatch.setattr(time, 'monotonic', lambda: now + 61)
+    assert cache.get('capped') is None
+
+
+def test_ttl_cache_statistics(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(caches, 'test', TTLCache(max_size=2, ttl=60))
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60, name='test')
+    cache.set('key', 1)
+    cache.get('key')
+    cache.get('missing_key')
+
+    assert get_caches_statistics()['test'] == {'hits': 1, 'misses': 1, 'size': 1, 'max_size': 2}
@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import pytest
+
+from src.core.exceptions import ServiceUnavailableError
+from src.core.executors import BoundedExecutor
+
+
+def multiply(first: int, second: int) -> int:
+    return first * second
+
+
+@pytest.mark.anyio
+async def test_bounded_executor_thread_run_success() -> None:
+    executor: BoundedExecutor = BoundedExecutor(kind='thread', workers=2, max_pending=4)
+    try:
+        assert await executor.run(multiply, 2, 3) == 6
+    finally:
+        executor.shutdown()
+
+    assert executor.statistics.completed == 1
+    assert executor.statistics.pending == 0
+    assert executor.statistics.total_execution_seconds >= 0
+
+
+@pytest.mark.anyio
+async def test_bounded_executor_process_run_success() -> None:
+    executor: BoundedExecutor = BoundedExecutor(kind='process', workers=1, max_pending=4)
+    try:
+        assert await executor.run(multiply, 2, 3) == 6
+    finally:
+        executor.shutdown()
+
+    assert executor.statistics.completed == 1
+
+
+@pytest.mark.anyio
+async def test_bounded_executor_rejects_calls_over_limit() -> None:
+    executor: BoundedExecutor = BoundedExecutor(kind='thread', workers=1, max_pending=1)
+    release: threading.Event = threading.Event()
+    try:
+        blocked_call: asyncio.Task = asyncio.create_task(executor.run(release.wait))
+        await asyncio.sleep(0)
+        assert executor.statistics.pending == 1
+
+        with pytest.raises(ServiceUnavailableError):
+            await executor.run(multiply, 2, 3)
+
+        release.set()
+        assert await blocked_call
+    finally:
+        executor.shutdown()
+
+    assert executor.statistics.rejected == 1
+    assert executor.statistics.completed == 1
+    assert executor.statistics.pending_limit == 1
+
+
+@pytest.mark.anyio
+async def test_bounded_executor_stop_does_not_block_event_loop() -> None:
+    executor: BoundedExecutor = BoundedExecutor(kind='thread', workers=1, max_pending=1)
+    release: threading.Event = threading.Event()
+    blocked_call: asyncio.Task = asyncio.create_task(executor.run(release.wait))
+    await asyncio.sleep(0)
+
+    stop: asyncio.Task = asyncio.create_task(executor.stop())
+    await asyncio.sleep(0.05)
+    assert not stop.done()
+
+    # Loop keeps running, while pool waits for in-flight call:
+    release.set()
+    await stop
+    assert await blocked_call
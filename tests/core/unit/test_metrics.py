@@ -0,0 +1,67 @@
+from src.core.executors import ExecutorStatistics
+from src.core.cache import TTLCache
+from src.core.metrics import Histogram, HTTPMetrics, format_labels, render_executors_metrics, render_caches_metrics
+
+
+def test_histogram_observe() -> None:
+    histogram: Histogram = Histogram(buckets=(10, 1, 5))
+    for value in (0.5, 1, 3, 7, 100):
+        histogram.observe(value)
+
+    assert histogram.buckets == (1, 5, 10)
+    assert histogram.cumulative_counts() == [(1, 2), (5, 3), (10, 4), (float('inf'), 5)]
+    assert histogram.count == 5
+    assert histogram.sum == 111.5
+
+
+def test_histogram_to_dict() -> None:
+    histogram: Histogram = Histogram(buckets=(1, 5))
+    histogram.observe(2)
+
+    assert histogram.to_dict() == {'buckets': {'1': 0, '5': 1, '+Inf': 1}, 'count': 1, 'sum': 2}
+
+
+def test_http_metrics_render() -> None:
+    http_metrics: HTTPMetrics = HTTPMetrics(latency_buckets=(0.1, 1))
+    http_metrics.request_started(method='GET')
+    http_metrics.request_finished(method='GET', route='/users/{user_id}', status_code=200, seconds=0.5)
+    http_metrics.request_started(method='GET')
+
+    rendered_metrics: str = http_metrics.render()
+    labels: str = 'method="GET",route="/users/{user_id}"'
+    assert f'http_requests_total{{{labels},status="200"}} 1\n' in rendered_metrics
+    assert 'http_requests_in_flight{method="GET"} 1\n' in rendered_metrics
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.1"}} 0\n' in rendered_metrics
+    assert f'http_request_duration_seconds_bucket{{{labels},le="1.0"}} 1\n' in rendered_metrics
+    assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1\n' in rendered_metrics
+    assert f'http_request_duration_seconds_count{{{labels}}} 1\n' in rendered_metrics
+
+
+def test_format_labels_escapes_values() -> None:
+    assert format_labels({'route': 'a"b\\c\nd'}) == '{route="a\\"b\\\\c\\nd"}'
+
+
+def test_render_executors_metrics() -> None:
+    rendered_metrics: str = render_executors_metrics(
+        {'password_hashing': ExecutorStatistics(pending=2, pending_limit=8, completed=5, max_wait_seconds=0.25)}
+    )
+
+    assert '# TYPE executor_pending_calls gauge\n' in rendered_metrics
+    assert 'executor_pending_calls{executor="password_hashing"} 2\n' in rendered_metrics
+    assert 'executor_pending_calls_limit{executor="password_hashing"} 8\n' in rendered_metrics
+    assert 'executor_completed_calls_total{executor="password_hashing"} 5\n' in rendered_metrics
+    assert 'executor_wait_seconds_max{executor="password_hashing"} 0.25\n' in rendered_metrics
+
+
+def test_render_caches_metrics() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=60)
+    cache.set('key', 1)
+    cache.get('key')
+    cache.get('missing_key')
+
+    rendered_metrics: str = render_caches_metrics({'jwt_tokens': cache})
+    assert '# TYPE cache_hits_total counter\n' in rendered_metrics
+    assert 'cache_hits_total{cache="jwt_tokens"} 1\n' in rendered_metrics
+    assert 'cache_misses_total{cache="jwt_tokens"} 1\n' in rendered_metrics
+    assert 'cache_entries{cache="jwt_tokens"} 1\n' in rendered_metrics
+    assert 'cache_max_entries{cache="jwt_tokens"} 10\n' in rendered_metrics
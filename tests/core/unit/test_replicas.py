@@ -0,0 +1,46 @@
+import pytest
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.database.replicas import ReplicaRouter
+
+
+def test_replica_router_round_robin() -> None:
+    replica_router: ReplicaRouter = ReplicaRouter(session_factories=[async_sessionmaker(), async_sessionmaker()])
+    assert replica_router.has_replicas
+    assert [replica_router.select() for _ in range(4)] == [0, 1, 0, 1]
+
+
+@pytest.mark.anyio
+async def test_replica_router_least_busy() -> None:
+    replica_router: ReplicaRouter = ReplicaRouter(
+        session_factories=[async_sessionmaker(), async_sessionmaker(), async_sessionmaker()],
+        selection='least_busy'
+    )
+
+    async with replica_router.session():
+        async with replica_router.session():
+            assert replica_router.busy == [1, 1, 0]
+            assert replica_router.select() == 2
+
+    assert replica_router.busy == [0, 0, 0]
+
+
+@pytest.mark.anyio
+async def test_replica_router_session_released_on_error() -> None:
+    replica_router: ReplicaRouter = ReplicaRouter(session_factories=[async_sessionmaker()])
+    sessions: List[AsyncSession] = []
+    with pytest.raises(RuntimeError):
+        async with replica_router.session() as session:
+            sessions.append(session)
+            raise RuntimeError
+
+    assert len(sessions) == 1
+    assert replica_router.busy == [0]
+
+
+def test_replica_router_without_replicas() -> None:
+    replica_router: ReplicaRouter = ReplicaRouter(session_factories=[])
+    assert not replica_router.has_replicas
+    with pytest.raises(ValueError):
+        replica_router.select()
@@ -1,6 +1,10 @@
+import pytest
+
 from src.core.utils import (
     get_substring_before_chars,
-    get_substring_after_chars
+    get_substring_after_chars,
+    encode_cursor,
+    decode_cursor
 )
 
 
@@ -28,3 +32,13 @@ def test_get_substring_after_chars_without_selected_chars_in_string() -> None:
     chars: str = '_'
     test_string: str = 'Some text without selected symbol'
     assert get_substring_after_chars(string=test_string, chars=chars) == test_string
+
+
+def test_encode_and_decode_cursor() -> None:
+    cursor: str = encode_cursor(10, 0.5)
+    assert decode_cursor(cursor=cursor) == [10, 0.5]
+
+
+def test_decode_cursor_fail_invalid_cursor() -> None:
+    with pytest.raises(ValueError):
+        decode_cursor(cursor='someInvalidCursor')
@@ -0,0 +1,31 @@
+import pytest
+from fastapi import status
+from httpx import Response, AsyncClient
+from typing import Dict, Any
+
+from src.internal.config import RouterConfig, URLPathsConfig, internal_config
+from src.security.config import jwt_config
+from src.users.config import users_cache_config
+
+
+INTERNAL_API_KEY: str = 'someInternalAPIKey'
+
+
+@pytest.mark.anyio
+async def test_get_caches_statistics_success(async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(internal_config, 'INTERNAL_API_KEY', INTERNAL_API_KEY)
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.CACHES,
+        headers={'X-Internal-API-Key': INTERNAL_API_KEY}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    response_content: Dict[str, Any] = response.json()
+    assert response_content['jwt_tokens'] == {
+        'hits': 0,
+        'misses': 0,
+        'size': 0,
+        'max_size': jwt_config.JWT_TOKEN_CACHE_MAX_SIZE,
+    }
+    assert response_content['users_identity']['max_size'] == users_cache_config.USERS_IDENTITY_CACHE_MAX_SIZE
@@ -0,0 +1,58 @@
+import pytest
+from fastapi import status
+from httpx import Response, AsyncClient
+from typing import Dict, Any
+
+from src.internal.config import RouterConfig, URLPathsConfig, internal_config
+from src.internal.constants import ErrorDetails
+from tests.utils import get_error_message_from_response
+
+
+INTERNAL_API_KEY: str = 'someInternalAPIKey'
+
+
+@pytest.mark.anyio
+async def test_get_database_pools_statistics_success(
+        async_client: AsyncClient,
+        create_test_user: None,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+    monkeypatch.setattr(internal_config, 'INTERNAL_API_KEY', INTERNAL_API_KEY)
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.DATABASE_POOLS,
+        headers={'X-Internal-API-Key': INTERNAL_API_KEY}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    response_content: Dict[str, Any] = response.json()
+    assert response_content['primary']['checkouts'] > 0
+    assert response_content['primary']['checkout_wait_milliseconds']['count'] > 0
+
+
+@pytest.mark.anyio
+async def test_get_database_pools_statistics_fail_disabled(async_client: AsyncClient) -> None:
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.DATABASE_POOLS,
+        headers={'X-Internal-API-Key': INTERNAL_API_KEY}
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert get_error_message_from_response(response=response) == ErrorDetails.INTERNAL_API_DISABLED
+
+
+@pytest.mark.anyio
+async def test_get_database_pools_statistics_fail_invalid_key(
+        async_client: AsyncClient,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+    monkeypatch.setattr(internal_config, 'INTERNAL_API_KEY', INTERNAL_API_KEY)
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.DATABASE_POOLS,
+        headers={'X-Internal-API-Key': 'someInvalidKey'}
+    )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert get_error_message_from_response(response=response) == ErrorDetails.INVALID_INTERNAL_API_KEY
@@ -0,0 +1,25 @@
+import pytest
+from fastapi import status
+from httpx import Response, AsyncClient
+from typing import Dict, Any
+
+from src.internal.config import RouterConfig, URLPathsConfig, internal_config
+from src.users.config import passlib_config
+
+
+INTERNAL_API_KEY: str = 'someInternalAPIKey'
+
+
+@pytest.mark.anyio
+async def test_get_executors_statistics_success(async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(internal_config, 'INTERNAL_API_KEY', INTERNAL_API_KEY)
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.EXECUTORS,
+        headers={'X-Internal-API-Key': INTERNAL_API_KEY}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    response_content: Dict[str, Any] = response.json()
+    assert response_content['password_hashing']['pending_limit'] == passlib_config.PASSLIB_MAX_PENDING
+    assert 'users_import' in response_content
@@ -0,0 +1,45 @@
+import pytest
+from fastapi import status
+from httpx import Response, AsyncClient
+from typing import Dict, Any
+
+from src.internal.config import RouterConfig, URLPathsConfig, internal_config
+from src.users.utils import configure_password_hashing
+
+
+INTERNAL_API_KEY: str = 'someInternalAPIKey'
+
+
+@pytest.mark.anyio
+async def test_import_users_success(
+        async_client: AsyncClient,
+        restore_password_hashing: None,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+    configure_password_hashing(rounds=1000)
+    monkeypatch.setattr(internal_config, 'INTERNAL_API_KEY', INTERNAL_API_KEY)
+    response: Response = await async_client.post(
+        url=RouterConfig.PREFIX + URLPathsConfig.USERS_IMPORT,
+        params={'format': 'csv'},
+        content=b'email,username,password\nfirst@mail.ru,first_user,first_password\n',
+        headers={'X-Internal-API-Key': INTERNAL_API_KEY}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    response_content: Dict[str, Any] = response.json()
+    assert response_content['processed'] == 1
+    assert response_content['imported'] == 1
+    assert response_content['errors'] == []
+
+
+@pytest.mark.anyio
+async def test_import_users_fail_without_key(async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(internal_config, 'INTERNAL_API_KEY', INTERNAL_API_KEY)
+    response: Response = await async_client.post(
+        url=RouterConfig.PREFIX + URLPathsConfig.USERS_IMPORT,
+        content=b'{"email": "first@mail.ru", "username": "first_user", "password": "first_password"}\n'
+    )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
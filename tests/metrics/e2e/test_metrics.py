@@ -0,0 +1,19 @@
+import pytest
+from fastapi import status
+from httpx import Response, AsyncClient
+
+from src.config import metrics_config
+from src.users.config import RouterConfig, URLPathsConfig
+
+
+@pytest.mark.anyio
+async def test_metrics(async_client: AsyncClient) -> None:
+    await async_client.patch(url=RouterConfig.PREFIX + URLPathsConfig.LIKE_USER.format(user_id=1))
+    response: Response = await async_client.get(url=metrics_config.METRICS_PATH)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert 'http_requests_total{method="PATCH",route="/users/{user_id}/like",status="401"}' in response.text
+    assert 'http_request_duration_seconds_count{method="PATCH",route="/users/{user_id}/like"}' in response.text
+    assert 'executor_pending_calls{executor="password_hashing"}' in response.text
+    assert 'executor_completed_calls_total{executor="password_hashing"}' in response.text
+    assert 'cache_hits_total{cache="jwt_tokens"}' in response.text
@@ -0,0 +1,81 @@
+import pytest
+from datetime import datetime, timezone, timedelta
+from jose import jwt
+
+from src.security.codec import JWTCodec, base64url_encode
+from src.security.config import jwt_config
+from src.security.exceptions import InvalidTokenError
+from src.security.models import JWTDataModel
+
+
+@pytest.fixture
+def jwt_codec() -> JWTCodec:
+    return JWTCodec(secret_key=jwt_config.JWT_TOKEN_SECRET_KEY, algorithm=jwt_config.JWT_TOKEN_ALGORITHM)
+
+
+def test_jwt_codec_encode_decode(jwt_codec: JWTCodec) -> None:
+    jwt_data: JWTDataModel = JWTDataModel(user_id=1)
+    decoded_jwt_data: JWTDataModel = jwt_codec.decode(token=jwt_codec.encode(jwt_data=jwt_data))
+
+    assert decoded_jwt_data.user_id == 1
+    assert decoded_jwt_data.exp == jwt_data.exp.replace(microsecond=0)
+
+
+def test_jwt_codec_compatible_with_jose(jwt_codec: JWTCodec) -> None:
+    jwt_data: JWTDataModel = JWTDataModel(user_id=1)
+    token: str = jwt_codec.encode(jwt_data=jwt_data)
+    assert jwt.decode(
+        token,
+        jwt_config.JWT_TOKEN_SECRET_KEY,
+        algorithms=[jwt_config.JWT_TOKEN_ALGORITHM]
+    )['user_id'] == 1
+
+    jose_token: str = jwt.encode(
+        claims={'user_id': 1, 'exp': jwt_data.exp},
+        key=jwt_config.JWT_TOKEN_SECRET_KEY,
+        algorithm=jwt_config.JWT_TOKEN_ALGORITHM
+    )
+    assert jwt_codec.decode(token=jose_token).user_id == 1
+
+
+def test_jwt_codec_decode_fail_tampered_token(jwt_codec: JWTCodec) -> None:
+    header, _, signature = jwt_codec.encode(jwt_data=JWTDataModel(user_id=1)).split('.')
+    tampered_payload: str = base64url_encode(b'{"user_id":2,"exp":4102444800}').decode()
+    with pytest.raises(InvalidTokenError):
+        jwt_codec.decode(token=f'{header}.{tampered_payload}.{signature}')
+
+
+def test_jwt_codec_decode_fail_other_key(jwt_codec: JWTCodec) -> None:
+    other_jwt_codec: JWTCodec = JWTCodec(secret_key='otherSecretKey', algorithm=jwt_config.JWT_TOKEN_ALGORITHM)
+    with pytest.raises(InvalidTokenError):
+        jwt_codec.decode(token=other_jwt_codec.encode(jwt_data=JWTDataModel(user_id=1)))
+
+
+def test_jwt_codec_decode_fail_unsigned_token(jwt_codec: JWTCodec) -> None:
+    header: str = base64url_encode(b'{"alg":"none","typ":"JWT"}').decode()
+    payload: str = base64url_encode(b'{"user_id":1,"exp":4102444800}').decode()
+    with pytest.raises(InvalidTokenError):
+        jwt_codec.decode(token=f'{header}.{payload}.')
+
+
+@pytest.mark.parametrize('token', ['', 'someIncorrectToken', 'a.b.c', 'a.b.c.d'])
+def test_jwt_codec_decode_fail_malformed_token(jwt_codec: JWTCodec, token: str) -> None:
+    with pytest.raises(InvalidTokenError):
+        jwt_codec.decode(token=token)
+
+
+def test_jwt_codec_decode_fail_expired_token(jwt_codec: JWTCodec) -> None:
+    jwt_data: JWTDataModel = JWTDataModel(user_id=1, exp=datetime.now(timezone.utc) - timedelta(seconds=1))
+    with pytest.raises(InvalidTokenError):
+        jwt_codec.decode(token=jwt_codec.encode(jwt_data=jwt_data))
+
+
+def test_jwt_codec_unsupported_algorithm() -> None:
+    with pytest.raises(ValueError):
+        JWTCodec(secret_key=jwt_config.JWT_TOKEN_SECRET_KEY, algorithm='RS256')
+
+
+def test_jwt_data_expiration_computed_per_token() -> None:
+    jwt_data: JWTDataModel = JWTDataModel(user_id=1)
+    expected_exp: datetime = datetime.now(timezone.utc) + timedelta(days=jwt_config.JWT_TOKEN_EXPIRE_DAYS)
+    assert abs((expected_exp - jwt_data.exp).total_seconds()) < 1
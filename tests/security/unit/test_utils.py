@@ -1,9 +1,11 @@
+import time
+import hashlib
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 
 from src.security.exceptions import InvalidTokenError
 from src.security.models import JWTDataModel
-from src.security.utils import parse_jwt_token, create_jwt_token
+from src.security.utils import parse_jwt_token, create_jwt_token, jwt_tokens_cache
 
 
 @pytest.mark.anyio
@@ -25,3 +27,39 @@ async def test_parse_jwt_token_success() -> None:
     jwt_data: JWTDataModel = JWTDataModel(user_id=1)
     token: str = await create_jwt_token(jwt_data=jwt_data)
     assert await parse_jwt_token(token=token)
+
+
+@pytest.mark.anyio
+async def test_parse_jwt_token_cached() -> None:
+    jwt_data: JWTDataModel = JWTDataModel(user_id=1)
+    token: str = await create_jwt_token(jwt_data=jwt_data)
+
+    first_jwt_data: JWTDataModel = await parse_jwt_token(token=token)
+    second_jwt_data: JWTDataModel = await parse_jwt_token(token=token)
+    assert first_jwt_data == second_jwt_data
+    assert first_jwt_data.user_id == 1
+    assert len(jwt_tokens_cache) == 1
+    assert jwt_tokens_cache.misses == 1
+    assert jwt_tokens_cache.hits == 1
+
+
+@pytest.mark.anyio
+async def test_parse_jwt_token_not_cached_when_invalid() -> None:
+    with pytest.raises(InvalidTokenError):
+        await parse_jwt_token(token='someIncorrectToken')
+
+    assert len(jwt_tokens_cache) == 0
+
+
+@pytest.mark.anyio
+async def test_parse_jwt_token_cached_entry_does_not_outlive_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    jwt_data: JWTDataModel = JWTDataModel(user_id=1, exp=datetime.now(timezone.utc) + timedelta(seconds=5))
+    token: str = await create_jwt_token(jwt_data=jwt_data)
+    await parse_jwt_token(token=token)
+
+    token_digest: bytes = hashlib.sha256(token.encode()).digest()
+    assert jwt_tokens_cache.get(token_digest) is not None
+
+    now: float = time.monotonic()
+    monkeypatch.setattr(time, 'monotonic', lambda: now + 6)
+    assert jwt_tokens_cache.get(token_digest) is None
@@ -0,0 +1,73 @@
+import csv
+import io
+import orjson
+import pytest
+from fastapi import status
+from httpx import Response, AsyncClient, Cookies
+from typing import Dict, Any, List
+
+from src.users.config import RouterConfig, URLPathsConfig, UsersExportConfig, cookies_config
+from src.users.constants import ErrorDetails
+from tests.config import FakeUserConfig
+from tests.utils import get_error_message_from_response
+
+
+@pytest.mark.anyio
+async def test_export_users_ndjson_success(
+        async_client: AsyncClient,
+        create_test_user: None,
+        cookies: Cookies
+) -> None:
+
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.EXPORT,
+        cookies=cookies
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['content-type'] == UsersExportConfig.NDJSON_MEDIA_TYPE
+
+    rows: List[Dict[str, Any]] = [orjson.loads(line) for line in response.text.splitlines()]
+    assert rows == [
+        {
+            'id': 1,
+            'email': FakeUserConfig.EMAIL,
+            'username': FakeUserConfig.USERNAME,
+            'likes': 0,
+            'dislikes': 0
+        }
+    ]
+
+
+@pytest.mark.anyio
+async def test_export_users_csv_success(
+        async_client: AsyncClient,
+        create_test_user: None,
+        cookies: Cookies
+) -> None:
+
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.EXPORT,
+        params={'format': 'csv'},
+        cookies=cookies
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['content-type'].startswith(UsersExportConfig.CSV_MEDIA_TYPE)
+
+    rows: List[List[str]] = list(csv.reader(io.StringIO(response.text)))
+    assert rows == [
+        list(UsersExportConfig.FIELDS),
+        ['1', FakeUserConfig.EMAIL, FakeUserConfig.USERNAME, '0', '0']
+    ]
+
+
+@pytest.mark.anyio
+async def test_export_users_fail_user_not_authorized(async_client: AsyncClient, create_test_user: None) -> None:
+    # Deleting cookies from async client, because if used as a "session" fixture:
+    async_client.cookies.delete(cookies_config.COOKIES_KEY)
+
+    response: Response = await async_client.get(url=RouterConfig.PREFIX + URLPathsConfig.EXPORT)
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert get_error_message_from_response(response=response) == ErrorDetails.USER_NOT_AUTHENTICATED
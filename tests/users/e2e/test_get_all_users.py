@@ -2,9 +2,14 @@ import pytest
 from fastapi import status
 from httpx import Response, AsyncClient
 from typing import Dict, Any, List
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncConnection
 
 from src.users.config import RouterConfig, URLPathsConfig
+from src.users.constants import ErrorDetails
+from src.users.models import UserModel
 from tests.config import FakeUserConfig
+from tests.utils import get_error_message_from_response
 
 
 @pytest.mark.anyio
@@ -16,12 +21,15 @@ async def test_get_all_users_with_existing_user(
     response: Response = await async_client.get(url=RouterConfig.PREFIX + URLPathsConfig.ALL)
     assert response.status_code == status.HTTP_200_OK
 
-    response_content: List[Dict[str, Any]] = response.json()
-    assert len(response_content) == 1
-    user: Dict[str, Any] = response_content[0]
+    response_content: Dict[str, Any] = response.json()
+    users: List[Dict[str, Any]] = response_content['users']
+    assert len(users) == 1
+    assert response_content['next_cursor'] is None
+    user: Dict[str, Any] = users[0]
     assert user['id'] == 1
     assert user['email'] == FakeUserConfig.EMAIL
     assert user['username'] == FakeUserConfig.USERNAME
+    assert 'password' not in user
 
 
 @pytest.mark.anyio
@@ -29,5 +37,67 @@ async def test_get_all_users_without_existing_users(async_client: AsyncClient, c
     response: Response = await async_client.get(url=RouterConfig.PREFIX + URLPathsConfig.ALL)
     assert response.status_code == status.HTTP_200_OK
 
-    response_content: List[Dict[str, Any]] = response.json()
-    assert len(response_content) == 0
+    response_content: Dict[str, Any] = response.json()
+    assert len(response_content['users']) == 0
+    assert response_content['next_cursor'] is None
+
+
+@pytest.mark.anyio
+async def test_get_all_users_pagination(
+        async_client: AsyncClient,
+        create_test_user: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    await async_connection.execute(
+        insert(
+            UserModel
+        ),
+        [
+            {'email': f'user_{number}@mail.ru', 'password': '<PASSWORD>', 'username': f'user_{number}'}
+            for number in range(2, 4)
+        ]
+    )
+    await async_connection.commit()
+
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.ALL,
+        params={'limit': 2, 'include_total': True}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    response_content: Dict[str, Any] = response.json()
+    assert [user['id'] for user in response_content['users']] == [1, 2]
+    assert response_content['total'] == 3
+    assert response_content['next_cursor']
+
+    response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.ALL,
+        params={'limit': 2, 'cursor': response_content['next_cursor']}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    response_content = response.json()
+    assert [user['id'] for user in response_content['users']] == [3]
+    assert response_content['next_cursor'] is None
+
+
+@pytest.mark.anyio
+async def test_get_all_users_fail_invalid_cursor(async_client: AsyncClient, create_test_db: None) -> None:
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.ALL,
+        params={'cursor': 'someInvalidCursor'}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert get_error_message_from_response(response=response) == ErrorDetails.INVALID_CURSOR
+
+
+@pytest.mark.anyio
+async def test_get_all_users_fail_too_big_limit(async_client: AsyncClient, create_test_db: None) -> None:
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.ALL,
+        params={'limit': 100_000}
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,104 @@
+import pytest
+from fastapi import status
+from httpx import Response, AsyncClient
+from typing import Dict, Any, List
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.users.config import RouterConfig, URLPathsConfig, LeaderboardOrder
+from src.users.constants import ErrorDetails
+from src.users.models import UserModel, UserStatisticsModel
+from src.core.utils import encode_cursor
+from tests.utils import get_error_message_from_response
+
+
+@pytest.mark.anyio
+async def test_get_leaderboard_pagination(
+        async_client: AsyncClient,
+        create_test_db: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    await async_connection.execute(
+        insert(
+            UserModel
+        ),
+        [
+            {'email': f'user_{number}@mail.ru', 'password': '<PASSWORD>', 'username': f'user_{number}'}
+            for number in range(1, 4)
+        ]
+    )
+    await async_connection.execute(
+        insert(
+            UserStatisticsModel
+        ),
+        [
+            {'user_id': 1, 'likes': 1, 'dislikes': 0, 'score': 1},
+            {'user_id': 2, 'likes': 5, 'dislikes': 4, 'score': 1},
+            {'user_id': 3, 'likes': 3, 'dislikes': 0, 'score': 3},
+        ]
+    )
+    await async_connection.commit()
+
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.LEADERBOARD,
+        params={'order': LeaderboardOrder.SCORE.value, 'limit': 2}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    response_content: Dict[str, Any] = response.json()
+    users: List[Dict[str, Any]] = response_content['users']
+    assert [user['user_id'] for user in users] == [3, 2]
+    assert users[0]['username'] == 'user_3'
+    assert users[0]['score'] == 3
+    assert response_content['next_cursor']
+
+    response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.LEADERBOARD,
+        params={'order': LeaderboardOrder.SCORE.value, 'limit': 2, 'cursor': response_content['next_cursor']}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    response_content = response.json()
+    assert [user['user_id'] for user in response_content['users']] == [1]
+    assert response_content['next_cursor'] is None
+
+
+@pytest.mark.anyio
+async def test_get_leaderboard_without_existing_users(async_client: AsyncClient, create_test_db: None) -> None:
+    response: Response = await async_client.get(url=RouterConfig.PREFIX + URLPathsConfig.LEADERBOARD)
+    assert response.status_code == status.HTTP_200_OK
+
+    response_content: Dict[str, Any] = response.json()
+    assert len(response_content['users']) == 0
+    assert response_content['next_cursor'] is None
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    'cursor',
+    ['someInvalidCursor', encode_cursor(1), encode_cursor(0.5, 1), encode_cursor('1', 1), encode_cursor(1, 1, 1)]
+)
+async def test_get_leaderboard_fail_invalid_cursor(
+        async_client: AsyncClient,
+        create_test_db: None,
+        cursor: str
+) -> None:
+
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.LEADERBOARD,
+        params={'order': LeaderboardOrder.LIKES.value, 'cursor': cursor}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert get_error_message_from_response(response=response) == ErrorDetails.INVALID_CURSOR
+
+
+@pytest.mark.anyio
+async def test_get_leaderboard_fail_invalid_order(async_client: AsyncClient, create_test_db: None) -> None:
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.LEADERBOARD,
+        params={'order': 'password'}
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
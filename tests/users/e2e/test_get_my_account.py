@@ -26,6 +26,7 @@ async def test_get_my_account_success(
     response_content: Dict[str, Any] = response.json()
     assert response_content['email'] == FakeUserConfig.EMAIL
     assert response_content['username'] == FakeUserConfig.USERNAME
+    assert 'password' not in response_content
 
 
 @pytest.mark.anyio
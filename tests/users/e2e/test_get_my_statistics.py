@@ -25,6 +25,7 @@ async def test_get_my_statistics_success(
     response_content: Dict[str, Any] = response.json()
     assert response_content['likes'] == 0
     assert response_content['dislikes'] == 0
+    assert response_content['user_id'] == 1
 
 
 @pytest.mark.anyio
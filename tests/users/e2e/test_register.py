@@ -5,6 +5,7 @@ from httpx import Response, AsyncClient
 from src.users.config import RouterConfig, URLPathsConfig, UserValidationConfig
 from src.users.constants import ErrorDetails
 from src.users.models import UserModel
+from src.users.service import UsersService
 from tests.utils import get_error_message_from_response, generate_random_string
 from tests.config import FakeUserConfig
 
@@ -85,6 +86,7 @@ async def test_register_success(async_client: AsyncClient) -> None:
     )
 
     assert response.status_code == status.HTTP_201_CREATED
+    assert 'password' not in response.json()
     user: UserModel = UserModel(**response.json())
     assert user.email == FakeUserConfig.EMAIL
     assert user.username == FakeUserConfig.USERNAME
@@ -122,3 +124,24 @@ async def test_register_fail_username_already_taken(
 
     assert response.status_code == status.HTTP_409_CONFLICT
     assert get_error_message_from_response(response=response) == ErrorDetails.USER_ALREADY_EXISTS
+
+
+@pytest.mark.anyio
+async def test_register_fail_user_registered_after_existence_check(
+        async_client: AsyncClient,
+        create_test_user: None,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+    async def check_user_existence(*_args, **_kwargs) -> bool:
+        return False
+
+    # Existence check misses user, which was registered concurrently or was not replicated yet:
+    monkeypatch.setattr(UsersService, 'check_user_existence', check_user_existence)
+    response: Response = await async_client.post(
+        url=RouterConfig.PREFIX + URLPathsConfig.REGISTER,
+        json=FakeUserConfig().to_dict(to_lower=True)
+    )
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert get_error_message_from_response(response=response) == ErrorDetails.USER_ALREADY_EXISTS
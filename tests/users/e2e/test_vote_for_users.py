@@ -0,0 +1,90 @@
+import pytest
+from fastapi import status
+from httpx import Response, AsyncClient, Cookies
+from typing import Dict, Any, List
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.users.config import RouterConfig, URLPathsConfig, UsersVotesConfig, VoteType, VoteOutcome
+from src.users.models import UserModel, UserStatisticsModel
+
+
+@pytest.mark.anyio
+async def test_vote_for_users_success(
+        async_client: AsyncClient,
+        create_test_user: None,
+        cookies: Cookies,
+        async_connection: AsyncConnection
+) -> None:
+
+    await async_connection.execute(
+        insert(
+            UserModel
+        ),
+        [
+            {'email': f'user_{number}@mail.ru', 'password': '<PASSWORD>', 'username': f'user_{number}'}
+            for number in range(2, 4)
+        ]
+    )
+    await async_connection.execute(insert(UserStatisticsModel), [{'user_id': user_id} for user_id in range(2, 4)])
+    await async_connection.commit()
+
+    response: Response = await async_client.post(
+        url=RouterConfig.PREFIX + URLPathsConfig.VOTES,
+        json={
+            'votes': [
+                {'user_id': 2, 'vote': VoteType.LIKE.value},
+                {'user_id': 3, 'vote': VoteType.DISLIKE.value},
+                {'user_id': 1, 'vote': VoteType.LIKE.value},
+                {'user_id': 2, 'vote': VoteType.LIKE.value},
+                {'user_id': 100, 'vote': VoteType.DISLIKE.value},
+            ]
+        },
+        cookies=cookies
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    results: List[Dict[str, Any]] = response.json()['results']
+    assert [(result['user_id'], result['outcome']) for result in results] == [
+        (2, VoteOutcome.APPLIED.value),
+        (3, VoteOutcome.APPLIED.value),
+        (1, VoteOutcome.SELF_VOTE.value),
+        (2, VoteOutcome.ALREADY_VOTED.value),
+        (100, VoteOutcome.NOT_FOUND.value),
+    ]
+    assert results[1]['vote'] == VoteType.DISLIKE.value
+
+
+@pytest.mark.anyio
+async def test_vote_for_users_fail_user_not_authorized(async_client: AsyncClient, create_test_user: None) -> None:
+    response: Response = await async_client.post(
+        url=RouterConfig.PREFIX + URLPathsConfig.VOTES,
+        json={'votes': [{'user_id': 1, 'vote': VoteType.LIKE.value}]}
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    'votes',
+    [
+        [],
+        [{'user_id': 2, 'vote': 'love'}],
+        [{'user_id': user_id, 'vote': VoteType.LIKE.value} for user_id in range(UsersVotesConfig.BATCH_MAX_SIZE + 1)],
+    ]
+)
+async def test_vote_for_users_fail_invalid_batch(
+        async_client: AsyncClient,
+        cookies: Cookies,
+        votes: List[Dict[str, Any]]
+) -> None:
+
+    response: Response = await async_client.post(
+        url=RouterConfig.PREFIX + URLPathsConfig.VOTES,
+        json={'votes': votes},
+        cookies=cookies
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,157 @@
+import asyncio
+import pytest
+from typing import List, Tuple
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.users.counters import VoteCountersBuffer
+from src.users.exceptions import UserAlreadyVotedError
+from src.users.models import UserStatisticsModel
+from src.users.service import UsersService
+from src.users.utils import calculate_wilson_score_lower_bound
+from src.core.database.connection import engine, session_factory
+from src.core.database.unit_of_work import UnitOfWork
+
+
+@pytest.mark.anyio
+async def test_vote_counters_buffer_applies_votes_on_flush(create_test_user: None) -> None:
+    vote_counters_buffer: VoteCountersBuffer = VoteCountersBuffer()
+    buffered_users_service: UsersService = UsersService(vote_counters_buffer=vote_counters_buffer)
+    users_service: UsersService = UsersService(vote_counters_buffer=None)
+
+    for voting_user_id in range(2, 5):
+        await buffered_users_service.like_user(voting_user_id=voting_user_id, voted_for_user_id=1)
+
+    user_statistics: UserStatisticsModel = await buffered_users_service.dislike_user(
+        voting_user_id=5,
+        voted_for_user_id=1
+    )
+    assert (user_statistics.likes, user_statistics.dislikes, user_statistics.score) == (3, 1, 2)
+    assert vote_counters_buffer.pending_votes == 4
+
+    # Counters are not written until flush, but reads through buffer see pending votes:
+    user_statistics = await users_service.get_user_statistics_by_user_id(user_id=1)
+    assert (user_statistics.likes, user_statistics.dislikes) == (0, 0)
+    user_statistics = await buffered_users_service.get_user_statistics_by_user_id(user_id=1)
+    assert (user_statistics.likes, user_statistics.dislikes) == (3, 1)
+
+    assert await vote_counters_buffer.flush() == 1
+    assert vote_counters_buffer.pending_votes == 0
+    assert vote_counters_buffer.get_increments(user_id=1) == (0, 0)
+
+    user_statistics = await users_service.get_user_statistics_by_user_id(user_id=1)
+    assert (user_statistics.likes, user_statistics.dislikes, user_statistics.score) == (3, 1, 2)
+    assert user_statistics.wilson_score == pytest.approx(calculate_wilson_score_lower_bound(likes=3, dislikes=1))
+
+
+@pytest.mark.anyio
+async def test_vote_counters_buffer_skips_rolled_back_votes(create_test_user: None) -> None:
+    vote_counters_buffer: VoteCountersBuffer = VoteCountersBuffer()
+    users_service: UsersService = UsersService(vote_counters_buffer=vote_counters_buffer)
+    await users_service.like_user(voting_user_id=2, voted_for_user_id=1)
+    with pytest.raises(UserAlreadyVotedError):
+        await users_service.like_user(voting_user_id=2, voted_for_user_id=1)
+
+    assert vote_counters_buffer.get_increments(user_id=1) == (1, 0)
+
+
+@pytest.mark.anyio
+async def test_vote_counters_buffer_flushes_on_max_pending_votes_and_drains_on_stop(create_test_user: None) -> None:
+    vote_counters_buffer: VoteCountersBuffer = VoteCountersBuffer(
+        flush_interval_milliseconds=60_000,
+        max_pending_votes=2
+    )
+    users_service: UsersService = UsersService(vote_counters_buffer=vote_counters_buffer)
+    vote_counters_buffer.start()
+
+    await users_service.like_user(voting_user_id=2, voted_for_user_id=1)
+    await users_service.like_user(voting_user_id=3, voted_for_user_id=1)
+    for _ in range(100):
+        if vote_counters_buffer.flushes:
+            break
+
+        await asyncio.sleep(0.01)
+
+    assert vote_counters_buffer.flushes == 1
+
+    await users_service.dislike_user(voting_user_id=4, voted_for_user_id=1)
+    await vote_counters_buffer.stop()
+    assert vote_counters_buffer.flushes == 2
+    assert vote_counters_buffer.pending_votes == 0
+
+    user_statistics: UserStatisticsModel = await UsersService(
+        vote_counters_buffer=None
+    ).get_user_statistics_by_user_id(user_id=1)
+    assert (user_statistics.likes, user_statistics.dislikes) == (2, 1)
+
+
+@pytest.mark.anyio
+async def test_vote_counters_buffer_computes_score_from_counters(create_test_user: None) -> None:
+    async with UnitOfWork() as unit_of_work:
+        await unit_of_work.session.execute(
+            update(UserStatisticsModel).filter_by(user_id=1).values(likes=3, dislikes=1, score=0)
+        )
+
+    # Stored score is out of date and is replaced by score of counters with applied increments:
+    vote_counters_buffer: VoteCountersBuffer = VoteCountersBuffer()
+    buffered_users_service: UsersService = UsersService(vote_counters_buffer=vote_counters_buffer)
+    await buffered_users_service.dislike_user(voting_user_id=2, voted_for_user_id=1)
+    user_statistics: UserStatisticsModel = await buffered_users_service.get_user_statistics_by_user_id(user_id=1)
+    assert user_statistics.score == 1
+
+    await vote_counters_buffer.flush()
+    user_statistics = await UsersService(vote_counters_buffer=None).get_user_statistics_by_user_id(user_id=1)
+    assert user_statistics.score == 1
+
+
+@pytest.mark.anyio
+async def test_vote_counters_buffer_does_not_double_count_after_commit(create_test_user: None) -> None:
+    increments_on_close: List[Tuple[int, int]] = []
+
+    class RecordingSession(AsyncSession):
+        async def close(self) -> None:
+            increments_on_close.append(vote_counters_buffer.get_increments(user_id=1))
+            await super().close()
+
+    vote_counters_buffer: VoteCountersBuffer = VoteCountersBuffer(
+        session_factory=async_sessionmaker(bind=engine, class_=RecordingSession)
+    )
+    await UsersService(vote_counters_buffer=vote_counters_buffer).like_user(voting_user_id=2, voted_for_user_id=1)
+    assert await vote_counters_buffer.flush() == 1
+
+    # Committed increments are not merged to reads anymore, while flush session is being closed:
+    assert increments_on_close == [(0, 0)]
+
+
+@pytest.mark.anyio
+async def test_vote_counters_buffer_keeps_running_after_unexpected_flush_error(create_test_user: None) -> None:
+    failures: List[int] = [1]
+
+    def failing_session_factory() -> AsyncSession:
+        if failures:
+            failures.pop()
+            raise RuntimeError('Unexpected flush error')
+
+        return session_factory()
+
+    vote_counters_buffer: VoteCountersBuffer = VoteCountersBuffer(
+        session_factory=failing_session_factory,  # type: ignore[arg-type]
+        flush_interval_milliseconds=10
+    )
+    vote_counters_buffer.start()
+    await UsersService(vote_counters_buffer=vote_counters_buffer).like_user(voting_user_id=2, voted_for_user_id=1)
+    for _ in range(100):
+        if vote_counters_buffer.flushes:
+            break
+
+        await asyncio.sleep(0.01)
+
+    # Failed flush is logged and its increments are applied by the next flush:
+    assert not failures
+    assert vote_counters_buffer.flushes == 1
+    await vote_counters_buffer.stop()
+
+    user_statistics: UserStatisticsModel = await UsersService(
+        vote_counters_buffer=None
+    ).get_user_statistics_by_user_id(user_id=1)
+    assert user_statistics.likes == 1
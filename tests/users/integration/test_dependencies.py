@@ -1,8 +1,8 @@
 import pytest
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Optional, Any
 
-from sqlalchemy import insert, RowMapping, CursorResult
+from sqlalchemy import insert, select, RowMapping, CursorResult
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from src.users.exceptions import (
@@ -12,12 +12,15 @@ from src.users.exceptions import (
     UserCanNotVoteForHimSelf,
     UserAlreadyVotedError,
     UserStatisticsNotFoundError,
+    InvalidCursorError,
 )
 from src.security.exceptions import InvalidTokenError
 from src.users.models import UserModel, UserStatisticsModel
 from src.security.models import JWTDataModel
-from src.users.schemas import RegisterUserScheme, LoginUserScheme
+from src.users.schemas import RegisterUserScheme, LoginUserScheme, UserScheme, UsersPageScheme
 from src.security.utils import create_jwt_token
+from src.users.service import UsersService
+from src.users.utils import pwd_context, configure_password_hashing
 from tests.config import FakeUserConfig
 from src.users.dependencies import (
     register_user,
@@ -33,7 +36,7 @@ from src.users.dependencies import (
 @pytest.mark.anyio
 async def test_register_user_success(create_test_db: None) -> None:
     user_data: RegisterUserScheme = RegisterUserScheme(**FakeUserConfig().to_dict(to_lower=True))
-    user: UserModel = await register_user(user_data=user_data)
+    user: UserModel = await register_user(user_data=user_data, users_service=UsersService())
 
     assert user.id == 1
     assert user.username == FakeUserConfig.USERNAME
@@ -44,13 +47,13 @@ async def test_register_user_success(create_test_db: None) -> None:
 async def test_register_user_fail(create_test_user: None) -> None:
     user_data: RegisterUserScheme = RegisterUserScheme(**FakeUserConfig().to_dict(to_lower=True))
     with pytest.raises(UserAlreadyExistsError):
-        await register_user(user_data=user_data)
+        await register_user(user_data=user_data, users_service=UsersService())
 
 
 @pytest.mark.anyio
 async def test_verify_user_credentials_by_username_success(create_test_user: None) -> None:
     user_data: LoginUserScheme = LoginUserScheme(username=FakeUserConfig.USERNAME, password=FakeUserConfig.PASSWORD)
-    user: UserModel = await verify_user_credentials(user_data=user_data)
+    user: UserModel = await verify_user_credentials(user_data=user_data, users_service=UsersService())
 
     assert user.id == 1
     assert user.username == FakeUserConfig.USERNAME
@@ -60,18 +63,37 @@ async def test_verify_user_credentials_by_username_success(create_test_user: Non
 @pytest.mark.anyio
 async def test_verify_user_credentials_by_email_success(create_test_user: None) -> None:
     user_data: LoginUserScheme = LoginUserScheme(username=FakeUserConfig.EMAIL, password=FakeUserConfig.PASSWORD)
-    user: UserModel = await verify_user_credentials(user_data=user_data)
+    user: UserModel = await verify_user_credentials(user_data=user_data, users_service=UsersService())
 
     assert user.id == 1
     assert user.username == FakeUserConfig.USERNAME
     assert user.email == FakeUserConfig.EMAIL
 
 
+@pytest.mark.anyio
+async def test_verify_user_credentials_rehashes_outdated_password(
+        create_test_user: None,
+        restore_password_hashing: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    handler: Any = pwd_context.handler()
+    configure_password_hashing(rounds=handler.default_rounds + 1000)
+
+    user_data: LoginUserScheme = LoginUserScheme(username=FakeUserConfig.USERNAME, password=FakeUserConfig.PASSWORD)
+    user: UserModel = await verify_user_credentials(user_data=user_data, users_service=UsersService())
+    assert handler.from_string(user.password).rounds == handler.default_rounds + 1000
+
+    cursor: CursorResult = await async_connection.execute(select(UserModel.password).filter_by(id=user.id))
+    stored_password_hash: str = cursor.scalar_one()
+    assert stored_password_hash == user.password
+
+
 @pytest.mark.anyio
 async def test_verify_user_credentials_fail_user_does_not_exist(create_test_db: None) -> None:
     user_data: LoginUserScheme = LoginUserScheme(**FakeUserConfig().to_dict(to_lower=True))
     with pytest.raises(UserNotFoundError):
-        await verify_user_credentials(user_data=user_data)
+        await verify_user_credentials(user_data=user_data, users_service=UsersService())
 
 
 @pytest.mark.anyio
@@ -79,12 +101,12 @@ async def test_verify_user_credentials_fail_incorrect_password(create_test_user:
     user_data: LoginUserScheme = LoginUserScheme(**FakeUserConfig().to_dict(to_lower=True))
     user_data.password = 'some_incorrect_password'
     with pytest.raises(InvalidPasswordError):
-        await verify_user_credentials(user_data=user_data)
+        await verify_user_credentials(user_data=user_data, users_service=UsersService())
 
 
 @pytest.mark.anyio
 async def test_authenticate_user_success(create_test_db: None, access_token: str) -> None:
-    user: UserModel = await authenticate_user(token=access_token)
+    user: UserModel = await authenticate_user(token=access_token, users_service=UsersService())
     assert user.email == FakeUserConfig.EMAIL
     assert user.username == FakeUserConfig.USERNAME
 
@@ -92,7 +114,7 @@ async def test_authenticate_user_success(create_test_db: None, access_token: str
 @pytest.mark.anyio
 async def test_authenticate_user_fail_invalid_token(create_test_db: None) -> None:
     with pytest.raises(InvalidTokenError):
-        await authenticate_user(token='someInvalidToken')
+        await authenticate_user(token='someInvalidToken', users_service=UsersService())
 
 
 @pytest.mark.anyio
@@ -100,7 +122,7 @@ async def test_authenticate_user_fail_token_expired(create_test_db: None) -> Non
     jwt_data: JWTDataModel = JWTDataModel(user_id=1, exp=datetime.now(timezone.utc))
     token: str = await create_jwt_token(jwt_data=jwt_data)
     with pytest.raises(InvalidTokenError):
-        await authenticate_user(token=token)
+        await authenticate_user(token=token, users_service=UsersService())
 
 
 @pytest.mark.anyio
@@ -108,14 +130,16 @@ async def test_authenticate_user_fail_user_does_not_exist(create_test_db: None)
     jwt_data: JWTDataModel = JWTDataModel(user_id=1)
     token: str = await create_jwt_token(jwt_data=jwt_data)
     with pytest.raises(UserNotFoundError):
-        await authenticate_user(token=token)
+        await authenticate_user(token=token, users_service=UsersService())
 
 
 @pytest.mark.anyio
 async def test_get_all_users_with_existing_user(create_test_user: None) -> None:
-    users: List[UserModel] = await get_all_users()
-    assert len(users) == 1
-    user: UserModel = users[0]
+    users_page: UsersPageScheme = await get_all_users(users_service=UsersService())
+    assert len(users_page.users) == 1
+    assert users_page.next_cursor is None
+    assert users_page.total is None
+    user: UserScheme = users_page.users[0]
     assert user.id == 1
     assert user.username == FakeUserConfig.USERNAME
     assert user.email == FakeUserConfig.EMAIL
@@ -123,8 +147,48 @@ async def test_get_all_users_with_existing_user(create_test_user: None) -> None:
 
 @pytest.mark.anyio
 async def test_get_all_users_without_existing_users(create_test_db: None) -> None:
-    users: List[UserModel] = await get_all_users()
-    assert len(users) == 0
+    users_page: UsersPageScheme = await get_all_users(include_total=True, users_service=UsersService())
+    assert len(users_page.users) == 0
+    assert users_page.next_cursor is None
+    assert users_page.total == 0
+
+
+@pytest.mark.anyio
+async def test_get_all_users_pagination(create_test_user: None, async_connection: AsyncConnection) -> None:
+    await async_connection.execute(
+        insert(
+            UserModel
+        ),
+        [
+            {'email': f'user_{number}@mail.ru', 'password': '<PASSWORD>', 'username': f'user_{number}'}
+            for number in range(2, 6)
+        ]
+    )
+    await async_connection.commit()
+
+    users_ids: List[int] = []
+    cursor: Optional[str] = None
+    while True:
+        users_page: UsersPageScheme = await get_all_users(
+            limit=2,
+            cursor=cursor,
+            include_total=True,
+            users_service=UsersService()
+        )
+        assert users_page.total == 5
+        users_ids.extend(user.id for user in users_page.users)
+        if users_page.next_cursor is None:
+            break
+
+        cursor = users_page.next_cursor
+
+    assert users_ids == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.anyio
+async def test_get_all_users_fail_invalid_cursor(create_test_db: None) -> None:
+    with pytest.raises(InvalidCursorError):
+        await get_all_users(cursor='someInvalidCursor', users_service=UsersService())
 
 
 @pytest.mark.anyio
@@ -133,7 +197,8 @@ async def test_get_my_statistics_success(create_test_user: None) -> None:
         user=UserModel(
             id=1,
             **FakeUserConfig().to_dict(to_lower=True)
-        )
+        ),
+        users_service=UsersService()
     )
     assert statistics.likes == 0
     assert statistics.dislikes == 0
@@ -146,7 +211,8 @@ async def test_get_my_statistics_fail_user_does_not_exist(create_test_db: None)
             user=UserModel(
                 id=1,
                 **FakeUserConfig().to_dict(to_lower=True)
-            )
+            ),
+            users_service=UsersService()
         )
 
 
@@ -174,7 +240,8 @@ async def test_like_user_success(create_test_user: None, async_connection: Async
         user=UserModel(
             id=1,
             **FakeUserConfig().to_dict(to_lower=True)
-        )
+        ),
+        users_service=UsersService()
     )
     assert statistics.likes == 1
     assert statistics.dislikes == 0
@@ -208,7 +275,8 @@ async def test_like_user_fail_can_not_vote_more_than_one_time(
         user=UserModel(
             id=1,
             **FakeUserConfig().to_dict(to_lower=True)
-        )
+        ),
+        users_service=UsersService()
     )
 
     with pytest.raises(UserAlreadyVotedError):
@@ -217,7 +285,8 @@ async def test_like_user_fail_can_not_vote_more_than_one_time(
             user=UserModel(
                 id=1,
                 **FakeUserConfig().to_dict(to_lower=True)
-            )
+            ),
+            users_service=UsersService()
         )
 
 
@@ -229,7 +298,8 @@ async def test_like_user_fail_can_not_for_himself(create_test_user: None) -> Non
             user=UserModel(
                 id=1,
                 **FakeUserConfig().to_dict(to_lower=True)
-            )
+            ),
+            users_service=UsersService()
         )
 
 
@@ -257,7 +327,8 @@ async def test_dislike_user_success(create_test_user: None, async_connection: As
         user=UserModel(
             id=1,
             **FakeUserConfig().to_dict(to_lower=True)
-        )
+        ),
+        users_service=UsersService()
     )
     assert statistics.likes == 0
     assert statistics.dislikes == 1
@@ -291,7 +362,8 @@ async def test_dislike_user_fail_can_not_vote_more_than_one_time(
         user=UserModel(
             id=1,
             **FakeUserConfig().to_dict(to_lower=True)
-        )
+        ),
+        users_service=UsersService()
     )
 
     with pytest.raises(UserAlreadyVotedError):
@@ -300,7 +372,8 @@ async def test_dislike_user_fail_can_not_vote_more_than_one_time(
             user=UserModel(
                 id=1,
                 **FakeUserConfig().to_dict(to_lower=True)
-            )
+            ),
+            users_service=UsersService()
         )
 
 
@@ -312,5 +385,6 @@ async def test_dislike_user_fail_can_not_for_himself(create_test_user: None) ->
             user=UserModel(
                 id=1,
                 **FakeUserConfig().to_dict(to_lower=True)
-            )
+            ),
+            users_service=UsersService()
         )
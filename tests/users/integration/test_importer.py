@@ -0,0 +1,67 @@
+import pytest
+from typing import AsyncGenerator, List
+
+from src.users.config import ExportFormat
+from src.users.importer import UsersImportReport, import_users
+from src.users.models import UserModel, UserStatisticsModel
+from src.users.service import UsersService
+from src.users.utils import configure_password_hashing, verify_password
+from tests.config import FakeUserConfig
+
+
+async def split_to_chunks(content: bytes, chunk_size: int = 7) -> AsyncGenerator[bytes, None]:
+    for index in range(0, len(content), chunk_size):
+        yield content[index:index + chunk_size]
+
+
+@pytest.mark.anyio
+async def test_import_users_ndjson(create_test_user: None, restore_password_hashing: None) -> None:
+    configure_password_hashing(rounds=1000)
+    content: bytes = b'\n'.join([
+        b'{"email": "first@mail.ru", "username": "first_user", "password": "first_password"}',
+        b'{"email": "second@mail.ru", "username": "second_user", "password": "second_password"}',
+        f'{{"email": "other@mail.ru", "username": "{FakeUserConfig.USERNAME}", "password": "password"}}'.encode(),
+        b'{"email": "first@mail.ru", "username": "third_user", "password": "third_password"}',
+        b'',
+        b'{"email": "invalid email", "username": "fourth_user", "password": "fourth_password"}',
+        b'not json',
+        b'{"email": "fifth@mail.ru", "username": "fifth_user", "password": "fifth_password"}',
+    ])
+
+    progress: List[int] = []
+    report: UsersImportReport = await import_users(
+        chunks=split_to_chunks(content=content),
+        batch_size=4,
+        on_progress=lambda current_report: progress.append(current_report.processed)
+    )
+
+    assert (report.processed, report.imported, report.skipped, report.invalid) == (7, 3, 2, 2)
+    assert [error['line'] for error in report.errors] == [6, 7]
+    assert progress == [4, 7]
+    assert report.rows_per_second > 0
+
+    users_service: UsersService = UsersService()
+    user: UserModel = await users_service.get_user_by_username(username='fifth_user')
+    assert await verify_password(plain_password='fifth_password', hashed_password=user.password)
+    user_statistics: UserStatisticsModel = await users_service.get_user_statistics_by_user_id(user_id=user.id)
+    assert user_statistics.likes == 0
+    assert await users_service.count_users() == 4
+
+
+@pytest.mark.anyio
+async def test_import_users_csv(create_test_db: None, restore_password_hashing: None) -> None:
+    configure_password_hashing(rounds=1000)
+    content: bytes = (
+        b'username,email,password\r\n'
+        b'first_user,first@mail.ru,"first,password"\r\n'
+        b'second_user,second@mail.ru\r\n'
+    )
+
+    report: UsersImportReport = await import_users(
+        chunks=split_to_chunks(content=content),
+        import_format=ExportFormat.CSV
+    )
+
+    assert (report.processed, report.imported, report.skipped, report.invalid) == (2, 1, 0, 1)
+    user: UserModel = await UsersService().get_user_by_email(email='first@mail.ru')
+    assert await verify_password(plain_password='first,password', hashed_password=user.password)
@@ -1,12 +1,24 @@
+import asyncio
+import math
 import pytest
-from typing import Optional, List
-from sqlalchemy import select, insert, CursorResult, Row
+from typing import Optional, List, Sequence, Tuple, Dict
+from sqlalchemy import select, insert, update, CursorResult, Row
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.ext.asyncio import AsyncConnection
 
+from src.users.config import LeaderboardOrder, UsersLeaderboardConfig, VoteType, VoteOutcome
 from src.users.constants import ErrorDetails
-from src.users.exceptions import UserNotFoundError, UserStatisticsNotFoundError
-from src.users.service import UsersService
+from src.users.exceptions import UserNotFoundError, UserStatisticsNotFoundError, UserAlreadyVotedError
+from src.users.service import (
+    UsersService,
+    UnsupportedDialectError,
+    get_insert_ignoring_conflicts,
+    users_identity_cache,
+    users_count_cache,
+    USERS_COUNT_CACHE_KEY
+)
+from src.core.database.unit_of_work import UnitOfWork
 from src.users.models import UserModel, UserStatisticsModel, UserVoteModel
 from tests.config import FakeUserConfig
 
@@ -27,6 +39,64 @@ async def test_users_service_get_user_by_id_fail(create_test_db: None) -> None:
         await UsersService().get_user_by_id(id=1)
 
 
+@pytest.mark.anyio
+async def test_users_service_get_cached_user_by_id_success(
+        create_test_user: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    user: UserModel = await UsersService().get_cached_user_by_id(id=1)
+    assert user.id == 1
+    assert user.email == FakeUserConfig.EMAIL
+    assert len(users_identity_cache) == 1
+
+    # Cached user is returned without querying database:
+    await async_connection.execute(update(UserModel).filter_by(id=1).values(username='cachedUsername'))
+    await async_connection.commit()
+    cached_user: UserModel = await UsersService().get_cached_user_by_id(id=1)
+    assert cached_user is not user
+    assert cached_user.username == FakeUserConfig.USERNAME
+    assert users_identity_cache.hits == 1
+
+
+@pytest.mark.anyio
+async def test_users_service_get_cached_user_by_id_fail(create_test_db: None) -> None:
+    with pytest.raises(UserNotFoundError):
+        await UsersService().get_cached_user_by_id(id=1)
+
+    assert len(users_identity_cache) == 0
+
+
+@pytest.mark.anyio
+async def test_users_service_update_user_password_invalidates_cached_user(create_test_user: None) -> None:
+    users_service: UsersService = UsersService()
+    await users_service.get_cached_user_by_id(id=1)
+    await users_service.update_user_password(user_id=1, password='newPasswordHash')
+    assert len(users_identity_cache) == 0
+
+    user: UserModel = await users_service.get_cached_user_by_id(id=1)
+    assert user.password == 'newPasswordHash'
+
+
+@pytest.mark.anyio
+async def test_users_service_update_user_password_invalidates_cached_user_after_commit(
+        create_test_user: None
+) -> None:
+
+    users_service: UsersService = UsersService()
+    async with UnitOfWork() as unit_of_work:
+        await UsersService(unit_of_work=unit_of_work).update_user_password(user_id=1, password='newPasswordHash')
+
+        # User, loaded concurrently before commit, is cached with old password and is kept until commit:
+        user: UserModel = await users_service.get_cached_user_by_id(id=1)
+        assert user.password != 'newPasswordHash'
+        assert len(users_identity_cache) == 1
+
+    assert len(users_identity_cache) == 0
+    user = await users_service.get_cached_user_by_id(id=1)
+    assert user.password == 'newPasswordHash'
+
+
 @pytest.mark.anyio
 async def test_users_service_get_user_by_email_success(create_test_user: None) -> None:
     user: Optional[UserModel] = await UsersService().get_user_by_email(
@@ -63,23 +133,152 @@ async def test_users_service_get_user_by_username_fail(create_test_db: None) ->
         await UsersService().get_user_by_username(username=FakeUserConfig.USERNAME)
 
 
+@pytest.mark.anyio
+async def test_users_service_get_user_by_login_success_by_email(create_test_user: None) -> None:
+    user: UserModel = await UsersService().get_user_by_login(login=FakeUserConfig.EMAIL)
+
+    assert user.id == 1
+    assert user.email == FakeUserConfig.EMAIL
+    assert user.username == FakeUserConfig.USERNAME
+
+
+@pytest.mark.anyio
+async def test_users_service_get_user_by_login_success_by_username(create_test_user: None) -> None:
+    user: UserModel = await UsersService().get_user_by_login(login=FakeUserConfig.USERNAME)
+
+    assert user.id == 1
+    assert user.email == FakeUserConfig.EMAIL
+    assert user.username == FakeUserConfig.USERNAME
+
+
+@pytest.mark.anyio
+async def test_users_service_get_user_by_login_prefers_email_match(
+        create_test_user: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    await async_connection.execute(
+        insert(
+            UserModel
+        ).values(
+            email='second_user_email@mail.ru',
+            password='<PASSWORD>',
+            username=FakeUserConfig.EMAIL,
+        )
+    )
+    await async_connection.commit()
+
+    user: UserModel = await UsersService().get_user_by_login(login=FakeUserConfig.EMAIL)
+    assert user.id == 1
+
+
+@pytest.mark.anyio
+async def test_users_service_get_user_by_login_fail(create_test_db: None) -> None:
+    with pytest.raises(UserNotFoundError):
+        await UsersService().get_user_by_login(login=FakeUserConfig.USERNAME)
+
+
 @pytest.mark.anyio
 async def test_users_service_get_all_users_with_existing_users(create_test_user: None) -> None:
-    users_list: List[UserModel] = await UsersService().get_all_users()
+    users_list: Sequence[Row] = await UsersService().get_all_users()
     assert len(users_list) == 1
 
-    user: UserModel = users_list[0]
+    user: Row = users_list[0]
     assert user.id == 1
     assert user.email == FakeUserConfig.EMAIL
     assert user.username == FakeUserConfig.USERNAME
+    assert 'password' not in user._fields
 
 
 @pytest.mark.anyio
 async def test_users_service_get_all_users_without_existing_users(create_test_db: None) -> None:
-    users_list: List[UserModel] = await UsersService().get_all_users()
+    users_list: Sequence[Row] = await UsersService().get_all_users()
     assert len(users_list) == 0
 
 
+@pytest.mark.anyio
+async def test_users_service_get_all_users_after_id(create_test_user: None, async_connection: AsyncConnection) -> None:
+    await async_connection.execute(
+        insert(
+            UserModel
+        ),
+        [
+            {'email': f'user_{number}@mail.ru', 'password': '<PASSWORD>', 'username': f'user_{number}'}
+            for number in range(2, 5)
+        ]
+    )
+    await async_connection.commit()
+
+    users_list: Sequence[Row] = await UsersService().get_all_users(limit=2, after_id=1)
+    assert [user.id for user in users_list] == [2, 3]
+
+
+@pytest.mark.anyio
+async def test_users_service_count_users(create_test_user: None) -> None:
+    users_service: UsersService = UsersService()
+    assert await users_service.count_users() == 1
+
+    await users_service.register_user(
+        user=UserModel(email='second_user_email@mail.ru', password='<PASSWORD>', username='second_user_username')
+    )
+    assert await users_service.count_users() == 2
+
+
+@pytest.mark.anyio
+async def test_users_service_count_users_cache_invalidated_after_commit(create_test_user: None) -> None:
+    users_service: UsersService = UsersService()
+    async with UnitOfWork() as unit_of_work:
+        await UsersService(unit_of_work=unit_of_work).register_user(
+            user=UserModel(email='second_user_email@mail.ru', password='<PASSWORD>', username='second_user_username')
+        )
+
+        # Count, made concurrently before commit, is cached and kept until commit:
+        assert await users_service.count_users() == 1
+        assert users_count_cache.get(USERS_COUNT_CACHE_KEY) == 1
+
+    assert await users_service.count_users() == 2
+
+
+@pytest.mark.anyio
+async def test_users_service_count_users_cache_kept_after_rollback(create_test_user: None) -> None:
+    users_service: UsersService = UsersService()
+    assert await users_service.count_users() == 1
+    with pytest.raises(IntegrityError):
+        async with UnitOfWork() as unit_of_work:
+            await UsersService(unit_of_work=unit_of_work).register_user(
+                user=UserModel(email=FakeUserConfig.EMAIL, password='<PASSWORD>', username='second_user_username')
+            )
+
+    assert users_count_cache.get(USERS_COUNT_CACHE_KEY) == 1
+
+
+@pytest.mark.anyio
+async def test_users_service_stream_users_with_statistics(
+        create_test_user: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    await async_connection.execute(
+        insert(
+            UserModel
+        ),
+        [
+            {'email': f'user_{number}@mail.ru', 'password': '<PASSWORD>', 'username': f'user_{number}'}
+            for number in range(2, 6)
+        ]
+    )
+    await async_connection.commit()
+
+    batches: List[Sequence[Row]] = [
+        rows async for rows in UsersService().stream_users_with_statistics(batch_size=2)
+    ]
+    assert [len(rows) for rows in batches] == [2, 2, 1]
+    assert [row.id for rows in batches for row in rows] == [1, 2, 3, 4, 5]
+
+    # Users without statistics are exported with zero counters:
+    assert batches[-1][0].likes == 0
+
+
 @pytest.mark.anyio
 async def test_users_service_register_user_success(
         create_test_db: None,
@@ -160,6 +359,18 @@ async def test_users_service_check_user_existence_success_by_username(create_tes
     assert await UsersService().check_user_existence(username=FakeUserConfig.USERNAME)
 
 
+@pytest.mark.anyio
+async def test_users_service_check_user_existence_success_by_any_of_attributes(create_test_user: None) -> None:
+    assert await UsersService().check_user_existence(email='some_other_email@mail.ru', username=FakeUserConfig.USERNAME)
+
+
+@pytest.mark.anyio
+async def test_users_service_check_user_existence_does_not_load_users(create_test_user: None) -> None:
+    async with UnitOfWork() as unit_of_work:
+        assert await UsersService(unit_of_work=unit_of_work).check_user_existence(id=1)
+        assert not unit_of_work.session.identity_map
+
+
 @pytest.mark.anyio
 async def test_users_service_check_user_existence_fail_user_does_not_exist(create_test_db: None) -> None:
     assert not await UsersService().check_user_existence(username=FakeUserConfig.USERNAME)
@@ -193,12 +404,49 @@ async def test_like_user_success(create_test_user: None) -> None:
     assert user_statistics.dislikes == 0
 
 
+@pytest.mark.anyio
+async def test_like_user_concurrent_votes_are_not_lost(create_test_user: None) -> None:
+    users_service: UsersService = UsersService()
+    await asyncio.gather(
+        *(users_service.like_user(voting_user_id=voting_user_id, voted_for_user_id=1) for voting_user_id in range(2, 7))
+    )
+
+    user_statistics: UserStatisticsModel = await users_service.get_user_statistics_by_user_id(user_id=1)
+    assert user_statistics.likes == 5
+    assert user_statistics.dislikes == 0
+
+
 @pytest.mark.anyio
 async def test_like_user_fail_user_statistics_not_found(create_test_db: None) -> None:
     with pytest.raises(UserStatisticsNotFoundError):
         await UsersService().like_user(voting_user_id=1, voted_for_user_id=1)
 
 
+@pytest.mark.anyio
+async def test_like_user_fail_user_already_voted(create_test_user: None) -> None:
+    users_service: UsersService = UsersService()
+    await users_service.like_user(voting_user_id=2, voted_for_user_id=1)
+    with pytest.raises(UserAlreadyVotedError):
+        await users_service.like_user(voting_user_id=2, voted_for_user_id=1)
+
+    # Rejected vote should not change user statistics:
+    user_statistics: UserStatisticsModel = await users_service.get_user_statistics_by_user_id(user_id=1)
+    assert user_statistics.likes == 1
+
+
+@pytest.mark.anyio
+async def test_like_user_concurrent_duplicated_votes_are_rejected(create_test_user: None) -> None:
+    users_service: UsersService = UsersService()
+    results: List[UserStatisticsModel | BaseException] = await asyncio.gather(
+        *(users_service.like_user(voting_user_id=2, voted_for_user_id=1) for _ in range(5)),
+        return_exceptions=True
+    )
+
+    assert len([result for result in results if isinstance(result, UserAlreadyVotedError)]) == 4
+    user_statistics: UserStatisticsModel = await users_service.get_user_statistics_by_user_id(user_id=1)
+    assert user_statistics.likes == 1
+
+
 @pytest.mark.anyio
 async def test_dislike_user_success(create_test_user: None) -> None:
     user_statistics: UserStatisticsModel = await UsersService().dislike_user(voting_user_id=1, voted_for_user_id=1)
@@ -206,12 +454,212 @@ async def test_dislike_user_success(create_test_user: None) -> None:
     assert user_statistics.dislikes == 1
 
 
+@pytest.mark.anyio
+async def test_dislike_user_concurrent_votes_are_not_lost(create_test_user: None) -> None:
+    users_service: UsersService = UsersService()
+    await asyncio.gather(
+        *(
+            users_service.dislike_user(voting_user_id=voting_user_id, voted_for_user_id=1)
+            for voting_user_id in range(2, 7)
+        )
+    )
+
+    user_statistics: UserStatisticsModel = await users_service.get_user_statistics_by_user_id(user_id=1)
+    assert user_statistics.likes == 0
+    assert user_statistics.dislikes == 5
+
+
 @pytest.mark.anyio
 async def test_dislike_user_fail_user_statistics_not_found(create_test_db: None) -> None:
     with pytest.raises(UserStatisticsNotFoundError):
         await UsersService().dislike_user(voting_user_id=1, voted_for_user_id=1)
 
 
+@pytest.mark.anyio
+async def test_dislike_user_fail_user_already_voted(create_test_user: None) -> None:
+    users_service: UsersService = UsersService()
+    await users_service.like_user(voting_user_id=2, voted_for_user_id=1)
+    with pytest.raises(UserAlreadyVotedError):
+        await users_service.dislike_user(voting_user_id=2, voted_for_user_id=1)
+
+    # Rejected vote should not change user statistics:
+    user_statistics: UserStatisticsModel = await users_service.get_user_statistics_by_user_id(user_id=1)
+    assert user_statistics.likes == 1
+    assert user_statistics.dislikes == 0
+
+
+def calculate_wilson_score(likes: int, dislikes: int, z: float = UsersLeaderboardConfig.WILSON_SCORE_Z) -> float:
+    votes: int = likes + dislikes
+    if likes == 0:
+        return 0.0
+
+    proportion: float = likes / votes
+    margin: float = z * math.sqrt((proportion * (1 - proportion) + z * z / (4 * votes)) / votes)
+    return (proportion + z * z / (2 * votes) - margin) / (1 + z * z / votes)
+
+
+@pytest.mark.anyio
+async def test_like_and_dislike_user_update_scores(create_test_user: None) -> None:
+    users_service: UsersService = UsersService()
+    for voting_user_id in range(2, 5):
+        await users_service.like_user(voting_user_id=voting_user_id, voted_for_user_id=1)
+
+    user_statistics: UserStatisticsModel = await users_service.dislike_user(voting_user_id=5, voted_for_user_id=1)
+    assert user_statistics.score == 2
+    assert user_statistics.wilson_score == pytest.approx(calculate_wilson_score(likes=3, dislikes=1))
+
+
+@pytest.mark.anyio
+async def test_like_user_computes_score_from_counters(create_test_db: None, async_connection: AsyncConnection) -> None:
+    await create_users_with_statistics(async_connection=async_connection, votes=[(3, 1)])
+    await async_connection.commit()
+
+    # Stored score is out of date, for example was not backfilled, and is replaced by score of updated counters:
+    user_statistics: UserStatisticsModel = await UsersService().like_user(voting_user_id=2, voted_for_user_id=1)
+    assert user_statistics.score == 3
+
+
+async def create_users_with_statistics(async_connection: AsyncConnection, votes: List[Tuple[int, int]]) -> None:
+    """
+    Creates users with provided likes and dislikes, without stored scores.
+    """
+
+    await async_connection.execute(
+        insert(
+            UserModel
+        ),
+        [
+            {'email': f'user_{number}@mail.ru', 'password': '<PASSWORD>', 'username': f'user_{number}'}
+            for number in range(1, len(votes) + 1)
+        ]
+    )
+    await async_connection.execute(
+        insert(
+            UserStatisticsModel
+        ),
+        [
+            {'user_id': user_id, 'likes': likes, 'dislikes': dislikes}
+            for user_id, (likes, dislikes) in enumerate(votes, start=1)
+        ]
+    )
+    await async_connection.commit()
+
+
+@pytest.mark.anyio
+async def test_users_service_recompute_users_scores(create_test_db: None, async_connection: AsyncConnection) -> None:
+    votes: List[Tuple[int, int]] = [(0, 0), (10, 1), (2, 0), (1, 5), (30, 10)]
+    await create_users_with_statistics(async_connection=async_connection, votes=votes)
+
+    users_service: UsersService = UsersService()
+    assert await users_service.recompute_users_scores(batch_size=2) == len(votes)
+
+    users_statistics: List[UserStatisticsModel] = [
+        await users_service.get_user_statistics_by_user_id(user_id=user_id) for user_id in range(1, len(votes) + 1)
+    ]
+    assert [user_statistics.score for user_statistics in users_statistics] == [0, 9, 2, -4, 20]
+    assert [user_statistics.wilson_score for user_statistics in users_statistics] == pytest.approx(
+        [calculate_wilson_score(likes=likes, dislikes=dislikes) for likes, dislikes in votes]
+    )
+
+
+@pytest.mark.anyio
+async def test_users_service_wilson_score_of_users_without_likes(
+        create_test_db: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    votes: List[Tuple[int, int]] = [(0, 0), (0, 1), (0, 2), (0, 3), (0, 5)]
+    await create_users_with_statistics(async_connection=async_connection, votes=votes)
+    await async_connection.commit()
+
+    users_service: UsersService = UsersService()
+    await users_service.recompute_users_scores()
+    await users_service.dislike_user(voting_user_id=2, voted_for_user_id=1)
+
+    # Users without likes have exactly zero score, so they are ordered only by user id:
+    leaderboard: Sequence[Row] = await users_service.get_leaderboard(order=LeaderboardOrder.WILSON_SCORE)
+    assert [row.user_id for row in leaderboard] == [5, 4, 3, 2, 1]
+    assert [row.wilson_score for row in leaderboard] == [0.0] * len(votes)
+
+
+@pytest.mark.anyio
+async def test_users_service_get_leaderboard(create_test_db: None, async_connection: AsyncConnection) -> None:
+    await create_users_with_statistics(
+        async_connection=async_connection,
+        votes=[(0, 0), (10, 1), (2, 0), (1, 5), (30, 10), (2, 2)]
+    )
+    users_service: UsersService = UsersService()
+    await users_service.recompute_users_scores()
+
+    leaderboards: Dict[LeaderboardOrder, List[int]] = {
+        LeaderboardOrder.LIKES: [5, 2, 6, 3, 4, 1],
+        LeaderboardOrder.SCORE: [5, 2, 3, 6, 1, 4],
+        LeaderboardOrder.WILSON_SCORE: [2, 5, 3, 6, 4, 1],
+    }
+    for order, user_ids in leaderboards.items():
+        users_statistics: Sequence[Row] = await users_service.get_leaderboard(order=order, limit=10)
+        assert [user_statistics.user_id for user_statistics in users_statistics] == user_ids
+
+        # Page after the second user, given by its score and id:
+        after: Row = users_statistics[1]
+        users_statistics = await users_service.get_leaderboard(
+            order=order,
+            limit=2,
+            after=(getattr(after, order.value), after.user_id)
+        )
+        assert [user_statistics.user_id for user_statistics in users_statistics] == user_ids[2:4]
+
+
+def test_get_insert_ignoring_conflicts_fail_unsupported_dialect() -> None:
+    assert get_insert_ignoring_conflicts(dialect_name='sqlite') is sqlite.insert
+    with pytest.raises(UnsupportedDialectError):
+        get_insert_ignoring_conflicts(dialect_name='mysql')
+
+
+@pytest.mark.anyio
+async def test_vote_for_users(create_test_db: None, async_connection: AsyncConnection) -> None:
+    await create_users_with_statistics(async_connection=async_connection, votes=[(0, 0)] * 4)
+    users_service: UsersService = UsersService()
+    await users_service.like_user(voting_user_id=1, voted_for_user_id=4)
+
+    outcomes: List[VoteOutcome] = await users_service.vote_for_users(
+        voting_user_id=1,
+        votes=[
+            (2, VoteType.LIKE),
+            (3, VoteType.DISLIKE),
+            (1, VoteType.LIKE),
+            (2, VoteType.DISLIKE),
+            (4, VoteType.LIKE),
+            (5, VoteType.LIKE),
+        ]
+    )
+    assert outcomes == [
+        VoteOutcome.APPLIED,
+        VoteOutcome.APPLIED,
+        VoteOutcome.SELF_VOTE,
+        VoteOutcome.ALREADY_VOTED,
+        VoteOutcome.ALREADY_VOTED,
+        VoteOutcome.NOT_FOUND,
+    ]
+
+    liked_user_statistics: UserStatisticsModel = await users_service.get_user_statistics_by_user_id(user_id=2)
+    assert (liked_user_statistics.likes, liked_user_statistics.dislikes, liked_user_statistics.score) == (1, 0, 1)
+    assert liked_user_statistics.wilson_score == pytest.approx(calculate_wilson_score(likes=1, dislikes=0))
+
+    disliked_user_statistics: UserStatisticsModel = await users_service.get_user_statistics_by_user_id(user_id=3)
+    assert (disliked_user_statistics.likes, disliked_user_statistics.dislikes, disliked_user_statistics.score) == (
+        0, 1, -1
+    )
+
+    # Votes, which were not applied, should not change user statistics:
+    already_voted_user_statistics: UserStatisticsModel = await users_service.get_user_statistics_by_user_id(user_id=4)
+    assert already_voted_user_statistics.likes == 1
+
+    # Repeated batch is not applied again:
+    outcomes = await users_service.vote_for_users(voting_user_id=1, votes=[(2, VoteType.LIKE), (3, VoteType.LIKE)])
+    assert outcomes == [VoteOutcome.ALREADY_VOTED, VoteOutcome.ALREADY_VOTED]
+
+
 @pytest.mark.anyio
 async def test_check_if_user_already_voted_success(create_test_user: None, async_connection: AsyncConnection) -> None:
     await async_connection.execute(
@@ -1,10 +1,19 @@
 import pytest
 from starlette.requests import Request
-from typing import Dict
+from typing import Dict, Any
 
 from src.users.config import URLPathsConfig
 from src.users.exceptions import NotAuthenticatedError
-from src.users.utils import hash_password, verify_password, OAuth2Cookie
+from src.users.utils import (
+    hash_password,
+    verify_password,
+    verify_and_update_password,
+    OAuth2Cookie,
+    calibrate_password_rounds,
+    configure_password_hashing,
+    calculate_wilson_score_lower_bound,
+    pwd_context
+)
 from tests.config import FakeUserConfig
 from tests.utils import build_request
 
@@ -21,6 +30,47 @@ async def test_verify_password_fail() -> None:
     assert not await verify_password(plain_password=FakeUserConfig.PASSWORD, hashed_password=hashed_password)
 
 
+def test_calibrate_password_rounds() -> None:
+    handler: Any = pwd_context.handler()
+    fast_rounds: int = calibrate_password_rounds(target_milliseconds=1)
+    slow_rounds: int = calibrate_password_rounds(target_milliseconds=50)
+
+    assert handler.min_rounds <= fast_rounds < slow_rounds <= handler.max_rounds
+
+
+@pytest.mark.anyio
+async def test_verify_and_update_password_outdated_hash(restore_password_hashing: None) -> None:
+    handler: Any = pwd_context.handler()
+    outdated_hash: str = handler.using(rounds=handler.min_rounds).hash(FakeUserConfig.PASSWORD)
+
+    is_valid, updated_hash = await verify_and_update_password(
+        plain_password=FakeUserConfig.PASSWORD,
+        hashed_password=outdated_hash
+    )
+    assert is_valid
+    assert updated_hash is None
+
+    configure_password_hashing(rounds=handler.min_rounds + 1000)
+    is_valid, updated_hash = await verify_and_update_password(
+        plain_password=FakeUserConfig.PASSWORD,
+        hashed_password=outdated_hash
+    )
+    assert is_valid
+    assert updated_hash is not None
+    assert handler.from_string(updated_hash).rounds == handler.min_rounds + 1000
+
+
+@pytest.mark.anyio
+async def test_verify_and_update_password_fail() -> None:
+    hashed_password: str = await hash_password('some other password')
+    is_valid, updated_hash = await verify_and_update_password(
+        plain_password=FakeUserConfig.PASSWORD,
+        hashed_password=hashed_password
+    )
+    assert not is_valid
+    assert updated_hash is None
+
+
 @pytest.mark.anyio
 async def test_oauth2cookie_success() -> None:
     oauth2cookie: OAuth2Cookie = OAuth2Cookie(token_url=URLPathsConfig.LOGIN)
@@ -47,3 +97,8 @@ async def test_oauth2cookie_fail_with_auto_error() -> None:
         oauth2cookie: OAuth2Cookie = OAuth2Cookie(token_url=URLPathsConfig.LOGIN)
         request: Request = build_request()
         await oauth2cookie(request)
+
+
+@pytest.mark.parametrize('dislikes', [0, 1, 2, 3, 5])
+def test_calculate_wilson_score_lower_bound_without_likes(dislikes: int) -> None:
+    assert calculate_wilson_score_lower_bound(likes=0, dislikes=dislikes) == 0.0
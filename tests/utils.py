@@ -16,8 +16,10 @@ def get_base_url() -> str:
 
 
 def drop_test_db() -> None:
-    if os.path.exists(database_config.DATABASE_NAME):
-        os.remove(database_config.DATABASE_NAME)
+    # Write-ahead log and shared memory files are left next to database in WAL journal mode:
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(database_config.DATABASE_NAME + suffix):
+            os.remove(database_config.DATABASE_NAME + suffix)
 
 
 def get_error_message_from_response(response: Response) -> str: